@@ -1,6 +1,5 @@
 import streamlit as st
 import pandas as pd
-import joblib
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
@@ -14,6 +13,10 @@ project_root = os.path.dirname(script_dir)
 sys.path.insert(0, os.path.join(project_root, 'src'))
 
 from database import PredictionDatabase
+from model_registry import ModelRegistry
+from model_handle import ModelHandle
+from profiling import Profiler
+from feature_engineering import category_codes
 
 # Page configuration
 st.set_page_config(
@@ -139,19 +142,29 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Load model
+# Load model (one handle per server process; it hot-swaps newly promoted versions)
 @st.cache_resource
 def load_model():
-    model_path = os.path.join(project_root, 'models', 'xgboost_model.pkl')
-    scaler_path = os.path.join(project_root, 'models', 'scaler.pkl')
+    legacy_paths = (os.path.join(project_root, 'models', 'xgboost_model.pkl'),
+                    os.path.join(project_root, 'models', 'scaler.pkl'),
+                    os.path.join(project_root, 'models', 'label_encoders.pkl'))
     try:
-        model = joblib.load(model_path)
-        scaler = joblib.load(scaler_path)
-        return model, scaler, True
-    except:
-        return None, None, False
+        handle = ModelHandle(ModelRegistry(), poll_interval=5.0, legacy_paths=legacy_paths)
+        return handle.start(), True
+    except Exception:
+        return None, False
+
+model_handle, model_loaded = load_model()
 
-model, scaler, model_loaded = load_model()
+# Per-prediction timings, shared by all sessions of this server process
+# Off unless FUEL_APP_PROFILING=1; the trace is written at most every FUEL_TRACE_INTERVAL seconds
+@st.cache_resource
+def load_profiler():
+    return Profiler(max_records=1000, enabled=os.environ.get('FUEL_APP_PROFILING') == '1')
+
+app_profiler = load_profiler()
+trace_path = os.path.join(project_root, 'reports', 'profiling', 'app_trace.json')
+trace_interval = float(os.environ.get('FUEL_TRACE_INTERVAL', 30))
 
 if not model_loaded:
     st.error("⚠️ Model not found. Run: `python main.py`")
@@ -176,15 +189,25 @@ with st.sidebar:
     st.markdown("---")
     st.markdown("### 🕐 Last Updated")
     st.info(datetime.now().strftime("%Y-%m-%d %H:%M"))
+    st.caption(f"Model version: {model_handle.version}")
+    if model_handle.last_error:
+        st.caption(f"⚠️ {model_handle.last_error}")
 
-# Helper function for prediction
-def make_prediction(vehicle_type, engine_capacity, fuel_type, distance, load_weight, 
-                   mileage_category, road_type, avg_speed, traffic_level):
-    vehicle_map = {'Car': 0, 'Van': 3, 'Bus': 1, 'Truck': 2}
-    fuel_map = {'CNG': 0, 'Diesel': 1, 'Petrol': 2}
-    road_map = {'City': 0, 'Highway': 1, 'Mixed': 2}
-    traffic_map = {'High': 0, 'Low': 1, 'Medium': 2}
-    mileage_map = {'High': 0, 'Low': 1, 'Medium': 2}
+# Helper functions for prediction
+def build_features(vehicle_type, engine_capacity, fuel_type, distance, load_weight, 
+                   mileage_category, road_type, avg_speed, traffic_level, encoders=None):
+    if encoders is not None:
+        # Codes the served model was trained with
+        codes = category_codes(encoders)
+        vehicle_map, fuel_map, road_map = codes['vehicle_type'], codes['fuel_type'], codes['road_type']
+        traffic_map, mileage_map = codes['traffic_level'], codes['mileage_category']
+    else:
+        # Models saved before the encoders were
+        vehicle_map = {'Car': 0, 'Van': 3, 'Bus': 1, 'Truck': 2}
+        fuel_map = {'CNG': 0, 'Diesel': 1, 'Petrol': 2}
+        road_map = {'City': 0, 'Highway': 1, 'Mixed': 2}
+        traffic_map = {'High': 0, 'Low': 1, 'Medium': 2}
+        mileage_map = {'High': 0, 'Low': 1, 'Medium': 2}
     
     load_per_km = load_weight / distance
     engine_load_ratio = engine_capacity * load_weight / 1000
@@ -193,11 +216,23 @@ def make_prediction(vehicle_type, engine_capacity, fuel_type, distance, load_wei
                          vehicle_map[vehicle_type], fuel_map[fuel_type],
                          road_map[road_type], traffic_map[traffic_level],
                          mileage_map[mileage_category], load_per_km, engine_load_ratio]])
-    
-    features_scaled = scaler.transform(features)
-    prediction = model.predict(features_scaled)[0]
+    return features
+
+def make_prediction(*trip, loaded=None):
+    """Point estimate; pass `loaded` (a model_handle.current() snapshot) to pin the version"""
+    loaded = loaded or model_handle.current()
+    with app_profiler.stage('predict', version=loaded.version):
+        prediction = loaded.predict(build_features(*trip, encoders=loaded.encoders))[0]
     return prediction
 
+def make_quantile_prediction(*trip, loaded=None):
+    """P10/P50/P90 fuel estimate, or None if the served version has no quantile model"""
+    loaded = loaded or model_handle.current()
+    if loaded.quantile_model is None:
+        return None
+    with app_profiler.stage('predict_quantiles', version=loaded.version):
+        return loaded.predict_quantiles(build_features(*trip, encoders=loaded.encoders))[0]
+
 # PREDICT PAGE
 if page == "🔮 Predict":
     st.markdown("## 🚗 Vehicle & Route Configuration")
@@ -229,8 +264,12 @@ if page == "🔮 Predict":
         predict_btn = st.button("🔮 PREDICT FUEL CONSUMPTION", use_container_width=True)
     
     if predict_btn:
-        prediction = make_prediction(vehicle_type, engine_capacity, fuel_type, distance, 
-                                    load_weight, mileage_category, road_type, avg_speed, traffic_level)
+        trip = (vehicle_type, engine_capacity, fuel_type, distance, 
+                load_weight, mileage_category, road_type, avg_speed, traffic_level)
+        # One snapshot for both calls, so a hot swap cannot mix versions
+        loaded = model_handle.current()
+        prediction = make_prediction(*trip, loaded=loaded)
+        quantiles = make_quantile_prediction(*trip, loaded=loaded)
         
         # Store in session state
         st.session_state['last_prediction'] = {
@@ -292,6 +331,11 @@ if page == "🔮 Predict":
             </div>
             """, unsafe_allow_html=True)
         
+        if quantiles is not None:
+            p10, p50, p90 = quantiles
+            st.info(f"📏 Uncertainty: P10 {p10:.2f} L · P50 {p50:.2f} L · P90 {p90:.2f} L "
+                    f"(80% of similar trips use between {p10:.1f} and {p90:.1f} L)")
+        
         st.success("✅ Prediction saved to history!")
 
 # FUEL PRICING PAGE
@@ -579,6 +623,13 @@ else:
         B.Tech Data Engineering Project
         """)
 
+# Persist prediction timings periodically (or now, from the sidebar) instead of on every rerun
+if app_profiler.enabled:
+    with st.sidebar:
+        if st.button("💾 Save profiling trace") and app_profiler.records:
+            st.caption(f"Saved {app_profiler.export_json(trace_path)}")
+    app_profiler.export_json_every(trace_path, trace_interval)
+
 # Footer
 st.markdown("---")
 st.markdown("""
@@ -11,13 +11,21 @@ def print_header(text):
     print(f"  {text}")
     print("="*60 + "\n")
 
-def main():
+def main(cprofile=False, memory=False):
     print_header("🚀 FUEL CONSUMPTION PREDICTION SYSTEM")
     print("Starting complete ML pipeline...\n")
     
     # Add src to path
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
     
+    # Instrument every stage (wall, CPU); memory tracking and a full cProfile are opt-in,
+    # since tracemalloc slows down every allocation and skews the timings
+    from profiling import profiler
+    if memory:
+        profiler.enable_memory()
+    if cprofile:
+        profiler.enable_cprofile()
+    
     # Step 1: Generate Data
     print_header("Step 1: Generating Synthetic Data")
     from data_generation import generate_fuel_data
@@ -29,7 +37,7 @@ def main():
     # Step 2: Feature Engineering
     print_header("Step 2: Feature Engineering")
     from feature_engineering import engineer_features
-    df_processed = engineer_features(df)
+    df_processed, encoders = engineer_features(df, return_encoders=True)
     df_processed.to_csv('data/processed/fuel_data_processed.csv', index=False)
     print(f"✓ Encoded categorical variables")
     print(f"✓ Created engineered features")
@@ -38,21 +46,24 @@ def main():
     # Step 3: Train Models
     print_header("Step 3: Training ML Models")
     from feature_engineering import prepare_data
-    from model import train_models, save_model
+    from model import train_models, train_quantile_model, save_model
     
     X, y, scaler = prepare_data(df_processed)
     print(f"✓ Prepared {X.shape[0]} samples with {X.shape[1]} features")
     
     trained_models, X_train, X_test, y_train, y_test = train_models(X, y)
+    quantile_model = train_quantile_model(X_train, y_train)
     
     save_model(trained_models['XGBoost'], 'models/xgboost_model.pkl')
     save_model(scaler, 'models/scaler.pkl')
+    save_model(encoders, 'models/label_encoders.pkl')
     
     # Step 4: Evaluate Models
     print_header("Step 4: Model Evaluation")
-    from evaluation import compare_models
+    from evaluation import compare_models, evaluate_quantiles
     
     results = compare_models(trained_models, X_test, y_test)
+    quantile_results = evaluate_quantiles(quantile_model, X_test, y_test)
     
     print("\n📊 MODEL PERFORMANCE COMPARISON")
     print("-" * 60)
@@ -63,6 +74,22 @@ def main():
         print(f"{model_name:<20} {metrics['MAE']:<10.4f} {metrics['RMSE']:<10.4f} {metrics['R2']:<10.4f}")
     
     print("-" * 60)
+    print(f"P10-P90 interval coverage: {quantile_results['interval_coverage']:.1%} "
+          f"(target 80%), mean width: {quantile_results['mean_interval_width']:.2f} L")
+    
+    # Step 5: Register & Promote
+    print_header("Step 5: Registering Model Version")
+    from model_registry import ModelRegistry, hash_dataset
+    
+    registry = ModelRegistry()
+    version = registry.register(
+        {'model': trained_models['XGBoost'], 'scaler': scaler, 'quantile_model': quantile_model,
+         'encoders': encoders},
+        metrics={**results, 'XGBoost Quantile': quantile_results},
+        feature_cols=list(X.columns),
+        data_hash=hash_dataset(X, y)
+    )
+    registry.promote(version)
     
     # Summary
     print_header("✅ PIPELINE COMPLETED SUCCESSFULLY")
@@ -71,11 +98,29 @@ def main():
     print("   ✓ data/processed/fuel_data_processed.csv")
     print("   ✓ models/xgboost_model.pkl")
     print("   ✓ models/scaler.pkl")
+    print("   ✓ models/label_encoders.pkl")
+    print(f"   ✓ models/registry/{version}/ (active)")
+    
+    # Profiling report
+    print("\n⏱️  Stage Timings:")
+    print("-" * 60)
+    print(f"{'Stage':<28} {'Wall (s)':<10} {'CPU (s)':<10} {'Mem Δ (MB)':<10}")
+    print("-" * 60)
+    for name, row in profiler.summary().iterrows():
+        mem = f"{row['mem_delta_mb']:.2f}" if memory else 'n/a'
+        print(f"{name:<28} {row['wall_s']:<10.3f} {row['cpu_s']:<10.3f} {mem:<10}")
+    print("-" * 60)
+    
+    trace_path = profiler.export_json('reports/profiling/pipeline_trace.json')
+    print(f"   ✓ {trace_path} (open in chrome://tracing)")
+    if cprofile:
+        print(f"   ✓ {profiler.dump_cprofile('reports/profiling/pipeline.prof')}")
     
     print("\n🎯 Next Steps:")
     print("   1. Run 'python evaluation.py' for detailed metrics")
     print("   2. Open notebooks/EDA.ipynb for visualizations")
     print("   3. Run 'streamlit run ../app/app.py' for web interface")
+    print("   4. Run 'python src/model_registry.py rollback' to restore the previous model")
     
     print("\n" + "="*60)
     print("  🎉 Ready for deployment!")
@@ -83,7 +128,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        main(cprofile='--cprofile' in sys.argv, memory='--memory' in sys.argv)
     except Exception as e:
         print(f"\n❌ Error: {e}")
         print("Please ensure you're running from the project root directory")
@@ -0,0 +1,124 @@
+"""
+Inference Benchmarks - Measure prediction latency of the serving paths
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def time_call(fn, repeats=20):
+    """Median wall time of fn() in seconds after one warm-up call"""
+    fn()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+
+def benchmark_quantiles(point_model, quantile_model, X, batch_sizes=(1, 100, 10000)):
+    """Compare interval (P10/P50/P90) prediction cost against point prediction"""
+    X = np.asarray(X, dtype=np.float32)
+    rows = []
+
+    for batch_size in batch_sizes:
+        batch = X[np.arange(batch_size) % len(X)]
+        point_time = time_call(lambda: point_model.predict(batch))
+        interval_time = time_call(lambda: quantile_model.predict(batch))
+        rows.append({
+            'batch_size': batch_size,
+            'point_ms': point_time * 1000,
+            'interval_ms': interval_time * 1000,
+            'ratio': interval_time / point_time
+        })
+
+    return pd.DataFrame(rows)
+
+
+def make_synthetic_trips(n_trips, segments_per_trip, seed=42):
+    """Random multi-segment trips for load testing the route API"""
+    rng = np.random.default_rng(seed)
+    trips = []
+    for i in range(n_trips):
+        trips.append({
+            'trip_id': i,
+            'vehicle_type': rng.choice(['Truck', 'Van', 'Bus', 'Car']),
+            'engine_capacity': rng.uniform(1.5, 5.0),
+            'fuel_type': rng.choice(['Diesel', 'Petrol', 'CNG']),
+            'load_weight_kg': rng.uniform(0, 5000),
+            'mileage_category': rng.choice(['Low', 'Medium', 'High']),
+            'segments': [{
+                'distance_km': rng.uniform(0.5, 20),
+                'road_type': rng.choice(['Highway', 'City', 'Mixed']),
+                'traffic_level': rng.choice(['Low', 'Medium', 'High']),
+                'avg_speed_kmh': rng.uniform(20, 120)
+            } for _ in range(segments_per_trip)]
+        })
+    return trips
+
+
+def benchmark_segments(predict_fn, encoders, quantile_fn=None, shapes=((1, 1000), (10, 500), (100, 100))):
+    """Latency of scoring (trips x segments) route batches end to end"""
+    from route_segments import score_trips
+
+    rows = []
+    for n_trips, segments_per_trip in shapes:
+        trips = make_synthetic_trips(n_trips, segments_per_trip)
+        elapsed = time_call(lambda: score_trips(trips, predict_fn, encoders, quantile_fn), repeats=10)
+        rows.append({
+            'trips': n_trips,
+            'segments': n_trips * segments_per_trip,
+            'total_ms': elapsed * 1000
+        })
+
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    sys.path.insert(0, script_dir)
+    os.chdir(project_root)
+
+    from feature_engineering import engineer_features, prepare_data
+    from model import train_models, train_quantile_model
+
+    df, encoders = engineer_features(pd.read_csv('data/raw/fuel_data.csv'), return_encoders=True)
+    X, y, scaler = prepare_data(df)
+    trained_models, X_train, X_test, y_train, y_test = train_models(X, y)
+    quantile_model = train_quantile_model(X_train, y_train)
+
+    results = benchmark_quantiles(trained_models['XGBoost'], quantile_model, X_test)
+
+    print("\n⏱️  INTERVAL vs POINT PREDICTION")
+    print("-" * 60)
+    print(f"{'Batch':<10} {'Point (ms)':<14} {'P10/P50/P90 (ms)':<18} {'Ratio':<8}")
+    print("-" * 60)
+    for row in results.itertuples():
+        print(f"{row.batch_size:<10} {row.point_ms:<14.3f} {row.interval_ms:<18.3f} {row.ratio:<8.2f}")
+    print("-" * 60)
+
+    worst = results['ratio'].max()
+    print(f"{'✓' if worst < 2 else '✗'} Worst-case ratio {worst:.2f}x (target < 2x)")
+
+    segment_results = benchmark_segments(
+        lambda F: trained_models['XGBoost'].predict(scaler.transform(F)),
+        encoders,
+        lambda F: quantile_model.predict(scaler.transform(F))
+    )
+
+    print("\n🛣️  ROUTE SEGMENT SCORING (point + P10/P50/P90)")
+    print("-" * 60)
+    print(f"{'Trips':<10} {'Segments':<12} {'Total (ms)':<12}")
+    print("-" * 60)
+    for row in segment_results.itertuples():
+        print(f"{row.trips:<10} {row.segments:<12} {row.total_ms:<12.2f}")
+    print("-" * 60)
+
+    sys.exit(0 if worst < 2 else 1)
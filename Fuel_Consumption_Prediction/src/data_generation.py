@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
+from profiling import profiled
 
+@profiled()
 def generate_fuel_data(n_samples=1000):
     """Generate synthetic fuel consumption dataset"""
     np.random.seed(42)
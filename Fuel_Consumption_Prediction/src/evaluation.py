@@ -1,5 +1,6 @@
 import numpy as np
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from profiling import profiled
 
 def evaluate_model(model, X_test, y_test):
     """Evaluate model performance"""
@@ -18,6 +19,24 @@ def evaluate_model(model, X_test, y_test):
         'predictions': y_pred
     }
 
+def evaluate_quantiles(model, X_test, y_test):
+    """Evaluate calibration of a multi-quantile model"""
+    preds = model.predict(X_test)
+    y_true = np.asarray(y_test)[:, None]
+    
+    results = {}
+    for i, q in enumerate(model.quantiles):
+        diff = y_true[:, 0] - preds[:, i]
+        results[f"P{round(q * 100)}_coverage"] = float(np.mean(diff <= 0))
+        results[f"P{round(q * 100)}_pinball"] = float(np.mean(np.maximum(q * diff, (q - 1) * diff)))
+    
+    lower, upper = preds[:, 0], preds[:, -1]
+    results['interval_coverage'] = float(np.mean((y_true[:, 0] >= lower) & (y_true[:, 0] <= upper)))
+    results['mean_interval_width'] = float(np.mean(upper - lower))
+    
+    return results
+
+@profiled()
 def compare_models(models, X_test, y_test):
     """Compare multiple models"""
     results = {}
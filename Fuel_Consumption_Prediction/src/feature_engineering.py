@@ -1,33 +1,45 @@
 import pandas as pd
 from sklearn.preprocessing import LabelEncoder, StandardScaler
+from profiling import profiled
 
-def engineer_features(df):
-    """Encode categorical variables and scale features"""
+FEATURE_COLS = ['engine_capacity', 'distance_km', 'load_weight_kg', 'avg_speed_kmh',
+                'vehicle_type_encoded', 'fuel_type_encoded', 'road_type_encoded', 
+                'traffic_level_encoded', 'mileage_category_encoded', 'load_per_km', 
+                'engine_load_ratio']
+
+CATEGORICAL_COLS = ['vehicle_type', 'fuel_type', 'road_type', 'traffic_level', 'mileage_category']
+
+@profiled()
+def engineer_features(df, return_encoders=False):
+    """Encode categorical variables and scale features
+
+    With return_encoders=True also returns the fitted LabelEncoders
+    ({column: encoder}); save them with the model so serving uses the
+    same codes as training.
+    """
     df = df.copy()
     
-    le_vehicle = LabelEncoder()
-    le_fuel = LabelEncoder()
-    le_road = LabelEncoder()
-    le_traffic = LabelEncoder()
-    le_mileage = LabelEncoder()
-    
-    df['vehicle_type_encoded'] = le_vehicle.fit_transform(df['vehicle_type'])
-    df['fuel_type_encoded'] = le_fuel.fit_transform(df['fuel_type'])
-    df['road_type_encoded'] = le_road.fit_transform(df['road_type'])
-    df['traffic_level_encoded'] = le_traffic.fit_transform(df['traffic_level'])
-    df['mileage_category_encoded'] = le_mileage.fit_transform(df['mileage_category'])
+    encoders = {}
+    for col in CATEGORICAL_COLS:
+        encoders[col] = LabelEncoder()
+        df[f'{col}_encoded'] = encoders[col].fit_transform(df[col])
     
     df['load_per_km'] = df['load_weight_kg'] / df['distance_km']
     df['engine_load_ratio'] = df['engine_capacity'] * df['load_weight_kg'] / 1000
     
+    if return_encoders:
+        return df, encoders
     return df
 
+def category_codes(encoders):
+    """{column: {label: code}} from fitted LabelEncoders"""
+    return {col: {label: code for code, label in enumerate(encoder.classes_)}
+            for col, encoder in encoders.items()}
+
+@profiled()
 def prepare_data(df):
     """Prepare features and target for modeling"""
-    feature_cols = ['engine_capacity', 'distance_km', 'load_weight_kg', 'avg_speed_kmh',
-                    'vehicle_type_encoded', 'fuel_type_encoded', 'road_type_encoded', 
-                    'traffic_level_encoded', 'mileage_category_encoded', 'load_per_km', 
-                    'engine_load_ratio']
+    feature_cols = FEATURE_COLS
     
     X = df[feature_cols]
     y = df['fuel_consumed_liters']
@@ -5,7 +5,49 @@ from sklearn.linear_model import LinearRegression
 from sklearn.ensemble import RandomForestRegressor
 from xgboost import XGBRegressor
 import joblib
+from profiling import stage, profiled
 
+QUANTILES = (0.1, 0.5, 0.9)
+
+class QuantileModel:
+    """Single multi-output XGBoost booster predicting several quantiles at once
+
+    Raw quantile boosters under-cover on small datasets, so each output is
+    shifted by a conformal offset measured on a held-out calibration split.
+    """
+    def __init__(self, booster, quantiles, offsets):
+        self.booster = booster
+        self.quantiles = tuple(quantiles)
+        self.offsets = np.asarray(offsets, dtype=float)
+
+    def predict(self, X):
+        """Return an (n_samples, n_quantiles) array from one booster call"""
+        preds = self.booster.predict(X).reshape(-1, len(self.quantiles)) + self.offsets
+        # Guard against quantile crossing
+        preds.sort(axis=1)
+        return preds
+
+def train_quantile_model(X_train, y_train, quantiles=QUANTILES):
+    """Train a calibrated multi-quantile model (P10/P50/P90 by default)"""
+    X_fit, X_cal, y_fit, y_cal = train_test_split(X_train, y_train, test_size=0.2, random_state=42)
+
+    # One tree per round with vector leaves: inference cost of a single booster
+    booster = XGBRegressor(n_estimators=100, learning_rate=0.1, max_depth=4, random_state=42,
+                           objective='reg:quantileerror', quantile_alpha=np.array(quantiles),
+                           tree_method='hist', multi_strategy='multi_output_tree')
+    with stage('fit XGBoost Quantile'):
+        booster.fit(X_fit, y_fit)
+
+    # One-sided conformal correction per quantile
+    residuals = np.asarray(y_cal)[:, None] - booster.predict(X_cal).reshape(-1, len(quantiles))
+    offsets = [np.quantile(residuals[:, i], q) for i, q in enumerate(quantiles)]
+
+    labels = '/'.join(f"P{round(q * 100)}" for q in quantiles)
+    print(f"✓ XGBoost Quantile ({labels}) trained")
+
+    return QuantileModel(booster, quantiles, offsets)
+
+@profiled()
 def train_models(X, y):
     """Train multiple regression models"""
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
@@ -18,12 +60,14 @@ def train_models(X, y):
     
     trained_models = {}
     for name, model in models.items():
-        model.fit(X_train, y_train)
+        with stage(f"fit {name}"):
+            model.fit(X_train, y_train)
         trained_models[name] = model
         print(f"✓ {name} trained")
     
     return trained_models, X_train, X_test, y_train, y_test
 
+@profiled()
 def save_model(model, filename):
     """Save trained model"""
     joblib.dump(model, filename)
@@ -0,0 +1,147 @@
+"""
+Model Handle - Serve the active registry version and hot-swap it on promotion
+"""
+
+import os
+import threading
+import time
+
+import joblib
+import numpy as np
+
+from model_registry import ModelRegistry
+
+
+class LoadedModel:
+    """Immutable snapshot of one servable version"""
+
+    def __init__(self, version, model, scaler, loaded_at, quantile_model=None, encoders=None):
+        self.version = version
+        self.model = model
+        self.scaler = scaler
+        self.loaded_at = loaded_at
+        self.quantile_model = quantile_model
+        self.encoders = encoders  # training-time LabelEncoders ({column: encoder}), if saved
+
+    def predict(self, features):
+        return self.model.predict(self.scaler.transform(features))
+
+    def predict_quantiles(self, features):
+        """(n_samples, n_quantiles) array, e.g. P10/P50/P90, from one batched call"""
+        if self.quantile_model is None:
+            raise ValueError(f"Model version {self.version} has no quantile model")
+        return self.quantile_model.predict(self.scaler.transform(features))
+
+
+class ModelHandle:
+    def __init__(self, registry=None, poll_interval=5.0, legacy_paths=None):
+        self.registry = registry or ModelRegistry()
+        self.poll_interval = poll_interval
+        self.legacy_paths = legacy_paths
+        self.last_error = None
+
+        self._stop = threading.Event()
+        self._watcher = None
+
+        self._current = self._load_initial()
+
+    def current(self):
+        """Snapshot to use for a whole request; never mutated after a swap"""
+        return self._current
+
+    @property
+    def version(self):
+        return self._current.version
+
+    def predict(self, features):
+        """Predict with whichever version is live when the call starts"""
+        return self.current().predict(features)
+
+    def predict_quantiles(self, features):
+        return self.current().predict_quantiles(features)
+
+    def start(self):
+        """Begin watching the registry for newly promoted versions"""
+        if self._watcher is None or not self._watcher.is_alive():
+            self._stop.clear()
+            self._watcher = threading.Thread(target=self._watch, name='model-watcher', daemon=True)
+            self._watcher.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+
+    def check_for_update(self):
+        """Load, warm up and swap in the active version if it changed"""
+        active = self.registry.active_version()
+        if active is None or active == self._current.version:
+            return False
+
+        try:
+            candidate = self._load(active)
+            self._warm_up(candidate)
+        except Exception as e:
+            # Keep serving the old version; retry on the next poll
+            self.last_error = f"{active}: {e}"
+            return False
+
+        # Single reference assignment: in-flight requests keep their snapshot
+        self._current = candidate
+        self.last_error = None
+        return True
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.check_for_update()
+            except Exception as e:
+                # e.g. the registry is briefly unreadable; keep watching
+                self.last_error = f"watcher: {e}"
+
+    def _load_initial(self):
+        """The active version; if it fails to load or its canary, earlier promoted versions, then the legacy pickles"""
+        active = self.registry.active_version()
+        registered = set(self.registry.list_versions())
+        versions = [active] if active else []
+        versions += [v for v in reversed(self.registry.history()) if v not in versions and v in registered]
+        if self.legacy_paths or not versions:
+            versions.append(None)
+
+        errors = []
+        for version in versions:
+            try:
+                loaded = self._load(version)
+                self._warm_up(loaded)
+            except Exception as e:
+                errors.append(f"{version or 'legacy'}: {e}")
+                continue
+            # Serving a fallback: report why the active version was skipped
+            self.last_error = '; '.join(errors) or None
+            return loaded
+        raise RuntimeError("No loadable model version (" + '; '.join(errors) + ")")
+
+    def _load(self, version):
+        if version is None:
+            if not self.legacy_paths:
+                raise FileNotFoundError("No active model version in registry")
+            model_path, scaler_path, *encoders_path = self.legacy_paths
+            encoders = None
+            if encoders_path and os.path.exists(encoders_path[0]):
+                encoders = joblib.load(encoders_path[0])
+            return LoadedModel('legacy', joblib.load(model_path), joblib.load(scaler_path), time.time(),
+                               encoders=encoders)
+
+        artifacts, _ = self.registry.load(version)
+        return LoadedModel(version, artifacts['model'], artifacts['scaler'], time.time(),
+                           quantile_model=artifacts.get('quantile_model'), encoders=artifacts.get('encoders'))
+
+    def _warm_up(self, loaded):
+        """Canary prediction on the training mean; also faults in mmap pages"""
+        canary = np.asarray(loaded.scaler.mean_, dtype=float).reshape(1, -1)
+        prediction = loaded.predict(canary)
+        if loaded.quantile_model is not None:
+            prediction = np.append(prediction, loaded.predict_quantiles(canary))
+        if not np.all(np.isfinite(prediction)):
+            raise ValueError(f"canary prediction is not finite: {prediction}")
@@ -0,0 +1,209 @@
+"""
+Model Registry - Versioned model artifacts with atomic promotion and rollback
+
+Layout on disk:
+    models/registry/
+        v0001/
+            model.pkl
+            scaler.pkl
+            manifest.json
+        v0002/ ...
+        ACTIVE          # name of the version currently served
+        HISTORY         # promotion stack, oldest first; rollback pops the current version
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from datetime import datetime
+
+import joblib
+import pandas as pd
+
+DEFAULT_REGISTRY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models', 'registry'
+)
+
+
+def hash_dataset(X, y):
+    """Stable SHA-256 fingerprint of the training features and target"""
+    digest = hashlib.sha256()
+    digest.update(','.join(map(str, X.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(X, index=False).values.tobytes())
+    digest.update(pd.util.hash_pandas_object(pd.Series(y), index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def _to_builtin(value):
+    """Convert numpy scalars in metrics to plain Python for JSON"""
+    if isinstance(value, dict):
+        return {k: _to_builtin(v) for k, v in value.items()}
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
+
+
+def _atomic_write(path, text):
+    """Write a small text file so readers never see a partial write"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    with os.fdopen(fd, 'w') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class ModelRegistry:
+    def __init__(self, root=DEFAULT_REGISTRY_DIR):
+        self.root = root
+        self.active_path = os.path.join(self.root, 'ACTIVE')
+        self.history_path = os.path.join(self.root, 'HISTORY')
+
+    def list_versions(self):
+        """All registered versions, oldest first"""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name for name in os.listdir(self.root)
+            if name.startswith('v') and os.path.isfile(os.path.join(self.root, name, 'manifest.json'))
+        )
+
+    def register(self, artifacts, metrics=None, feature_cols=None, data_hash=None):
+        """Store artifacts (name -> object) as a new immutable version"""
+        os.makedirs(self.root, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=self.root, prefix='.staging-')
+
+        files = {}
+        for name, obj in artifacts.items():
+            filename = f"{name}.pkl"
+            # Uncompressed dumps keep numpy arrays mmap-able on load
+            joblib.dump(obj, os.path.join(staging, filename))
+            files[name] = filename
+
+        manifest = {
+            'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'artifacts': files,
+            'metrics': _to_builtin(metrics or {}),
+            'feature_cols': list(feature_cols or []),
+            'data_hash': data_hash
+        }
+
+        # Claim the next version number; rename fails if another run got there first
+        while True:
+            versions = self.list_versions()
+            next_number = int(versions[-1][1:]) + 1 if versions else 1
+            version = f"v{next_number:04d}"
+            manifest['version'] = version
+            with open(os.path.join(staging, 'manifest.json'), 'w') as f:
+                json.dump(manifest, f, indent=2)
+            try:
+                os.rename(staging, os.path.join(self.root, version))
+                break
+            except OSError:
+                if not os.path.exists(os.path.join(self.root, version)):
+                    raise
+
+        print(f"✓ Registered model version: {version}")
+        return version
+
+    def promote(self, version):
+        """Atomically make a version the one served by the app"""
+        if version not in self.list_versions():
+            raise ValueError(f"Unknown model version: {version}")
+
+        # HISTORY before ACTIVE: after a crash in between, the stack holds an extra
+        # never-served entry (dropped by rollback) rather than missing the active version
+        stack = self._read_history() + [version]
+        _atomic_write(self.history_path, ''.join(v + '\n' for v in stack))
+        _atomic_write(self.active_path, version + '\n')
+
+        print(f"✓ Promoted model version: {version}")
+        return version
+
+    def rollback(self):
+        """Serve the version promoted before the current one; repeated rollbacks keep stepping back"""
+        current = self.active_version()
+        stack = self._read_history()
+        versions = set(self.list_versions())
+
+        # Drop entries above the current version (a promotion interrupted before ACTIVE
+        # was written), then pop it and any versions deleted since
+        if current in stack:
+            del stack[len(stack) - stack[::-1].index(current):]
+        while stack and (stack[-1] == current or stack[-1] not in versions):
+            stack.pop()
+        if not stack:
+            raise ValueError("No earlier promoted version to roll back to")
+
+        version = stack[-1]
+        _atomic_write(self.history_path, ''.join(v + '\n' for v in stack))
+        _atomic_write(self.active_path, version + '\n')
+
+        print(f"✓ Rolled back to model version: {version}")
+        return version
+
+    def history(self):
+        """Promotion stack, oldest first"""
+        return self._read_history()
+
+    def active_version(self):
+        """Name of the currently promoted version, or None"""
+        try:
+            with open(self.active_path) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def get_manifest(self, version=None):
+        """Manifest of a version (defaults to the active one)"""
+        version = version or self.active_version()
+        if version is None:
+            raise FileNotFoundError("No active model version")
+
+        with open(os.path.join(self.root, version, 'manifest.json')) as f:
+            return json.load(f)
+
+    def load(self, version=None, mmap_mode='r'):
+        """Load artifacts of a version
+
+        mmap_mode='r' memory-maps the numpy arrays stored in the pickles (the
+        scaler's mean/scale), which are then shared through the page cache.
+        The XGBoost booster is deserialized into each process's own memory,
+        so every serving process still holds a private copy of the model.
+        """
+        manifest = self.get_manifest(version)
+        version_dir = os.path.join(self.root, manifest['version'])
+
+        artifacts = {
+            name: joblib.load(os.path.join(version_dir, filename), mmap_mode=mmap_mode)
+            for name, filename in manifest['artifacts'].items()
+        }
+        return artifacts, manifest
+
+    def _read_history(self):
+        try:
+            with open(self.history_path) as f:
+                return [line.strip() for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+
+if __name__ == "__main__":
+    import sys
+
+    registry = ModelRegistry()
+    command = sys.argv[1] if len(sys.argv) > 1 else 'list'
+
+    if command == 'promote' and len(sys.argv) > 2:
+        registry.promote(sys.argv[2])
+    elif command == 'rollback':
+        registry.rollback()
+    else:
+        active = registry.active_version()
+        for version in registry.list_versions():
+            manifest = registry.get_manifest(version)
+            r2 = manifest['metrics'].get('XGBoost', {}).get('R2')
+            marker = '*' if version == active else ' '
+            r2_text = f"{r2:.4f}" if r2 is not None else 'n/a'
+            print(f"{marker} {version}  {manifest['created_at']}  XGBoost R²={r2_text}")
@@ -0,0 +1,175 @@
+"""
+Profiling - Wall time, CPU time and memory instrumentation for pipeline stages
+
+Usage:
+    from profiling import stage, profiled, profiler
+
+    with stage('train_models'):
+        ...
+
+    @profiled()
+    def engineer_features(df): ...
+
+    profiler.export_json('reports/profiling/pipeline_trace.json')
+
+The JSON trace uses the Chrome trace-event format, so it opens directly in
+chrome://tracing or https://ui.perfetto.dev.
+"""
+
+import os
+import json
+import time
+import cProfile
+import functools
+import threading
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+import pandas as pd
+
+
+class Profiler:
+    def __init__(self, max_records=10000, enabled=True):
+        self.records = deque(maxlen=max_records)
+        self.enabled = enabled  # when False, stage() records nothing
+        self.origin = time.perf_counter()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._cprofile = None
+        self._recorded = 0          # records ever appended
+        self._exported = (0, None)  # (records, perf_counter time) at the last throttled export
+
+    def enable_memory(self):
+        """Track Python heap deltas per stage (adds allocation overhead)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def enable_cprofile(self):
+        """Collect a function-level cProfile for the calling thread"""
+        if self._cprofile is None:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    @contextmanager
+    def stage(self, name, **meta):
+        """Record wall time, CPU time and memory delta of the enclosed block
+
+        CPU time is process-wide so native worker threads (XGBoost, sklearn)
+        are included.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        tracing = tracemalloc.is_tracing()
+        mem_before = tracemalloc.get_traced_memory()[0] if tracing else None
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        stack.append(name)
+        try:
+            yield
+        finally:
+            stack.pop()
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            mem_delta = tracemalloc.get_traced_memory()[0] - mem_before if tracing else None
+
+            record = {
+                'name': name,
+                'parent': stack[-1] if stack else None,
+                'start_s': wall_start - self.origin,
+                'wall_s': wall,
+                'cpu_s': cpu,
+                'mem_delta_bytes': mem_delta,
+                'thread': threading.get_ident()
+            }
+            if meta:
+                record['meta'] = meta
+            with self._lock:
+                self.records.append(record)
+                self._recorded += 1
+
+    def profiled(self, name=None):
+        """Decorator form of stage(); defaults to the function name"""
+        def decorator(func):
+            stage_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(stage_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def summary(self):
+        """Per-stage totals, slowest first"""
+        with self._lock:
+            df = pd.DataFrame(list(self.records))
+        if df.empty:
+            return df
+
+        summary = df.groupby('name').agg(
+            calls=('wall_s', 'size'),
+            wall_s=('wall_s', 'sum'),
+            cpu_s=('cpu_s', 'sum'),
+            mem_delta_mb=('mem_delta_bytes', lambda m: m.sum(min_count=1) / 1e6)
+        )
+        return summary.sort_values('wall_s', ascending=False)
+
+    def export_json(self, path):
+        """Write records as a Chrome trace-event JSON file (atomic replace)"""
+        with self._lock:
+            records = list(self.records)
+
+        events = [{
+            'name': r['name'],
+            'ph': 'X',
+            'ts': r['start_s'] * 1e6,
+            'dur': r['wall_s'] * 1e6,
+            'pid': os.getpid(),
+            'tid': r['thread'],
+            'args': {k: v for k, v in r.items() if k in ('cpu_s', 'mem_delta_bytes', 'parent', 'meta')}
+        } for r in records]
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        os.replace(tmp_path, path)
+        return path
+
+    def export_json_every(self, path, interval):
+        """export_json() only if there are new records and `interval` seconds have passed since the last one"""
+        exported_count, exported_at = self._exported
+        now = time.perf_counter()
+        if self._recorded == exported_count or (exported_at is not None and now - exported_at < interval):
+            return None
+        self._exported = (self._recorded, now)
+        return self.export_json(path)
+
+    def dump_cprofile(self, path):
+        """Stop cProfile collection and write a pstats file (view with snakeviz)"""
+        if self._cprofile is None:
+            return None
+        self._cprofile.disable()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._cprofile.dump_stats(path)
+        self._cprofile = None
+        return path
+
+    def reset(self):
+        with self._lock:
+            self.records.clear()
+        self.origin = time.perf_counter()
+
+
+# Process-wide default profiler used by the pipeline modules and the app
+profiler = Profiler()
+stage = profiler.stage
+profiled = profiler.profiled
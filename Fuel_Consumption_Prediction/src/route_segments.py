@@ -0,0 +1,133 @@
+"""
+Route Segments - Fuel estimates for trips that mix road, traffic and speed conditions
+
+A trip is a dict of vehicle attributes plus a list of segments:
+
+    {
+        'trip_id': 'delivery-42',            # optional, defaults to list position
+        'vehicle_type': 'Truck', 'engine_capacity': 4.0, 'fuel_type': 'Diesel',
+        'load_weight_kg': 3000, 'mileage_category': 'Low',
+        'segments': [
+            {'distance_km': 35, 'road_type': 'City', 'traffic_level': 'High', 'avg_speed_kmh': 25},
+            {'distance_km': 180, 'road_type': 'Highway', 'traffic_level': 'Low', 'avg_speed_kmh': 90},
+        ]
+    }
+
+The model was trained on whole trips (10-500 km), so each segment is scored as
+if the entire trip ran under that segment's conditions, and the resulting
+litres-per-km rate is applied to the segment's share of the distance. This
+keeps short segments inside the training distribution.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+CO2_PER_LITER = 2.31
+
+TRIP_FIELDS = ['vehicle_type', 'engine_capacity', 'fuel_type', 'load_weight_kg', 'mileage_category']
+SEGMENT_FIELDS = ['distance_km', 'road_type', 'traffic_level', 'avg_speed_kmh']
+
+
+def _encode(values, encoder, column):
+    """Label codes from a fitted LabelEncoder (its classes_ are sorted, so one searchsorted)"""
+    classes = np.asarray(encoder.classes_, dtype=str)
+    values = np.asarray(values, dtype=str)
+    codes = np.searchsorted(classes, values)
+    known = classes[np.minimum(codes, len(classes) - 1)] == values
+    if not known.all():
+        raise ValueError(f"Unknown {column}: {values[~known][0]}. Expected one of {classes.tolist()}")
+    return codes.astype(float)
+
+
+def flatten_trips(trips):
+    """Turn a list of trips into flat per-segment arrays plus a segment -> trip index"""
+    counts = np.array([len(trip['segments']) for trip in trips], dtype=np.intp)
+    if (counts == 0).any():
+        raise ValueError("Every trip needs at least one segment")
+
+    segments = [segment for trip in trips for segment in trip['segments']]
+    trip_index = np.repeat(np.arange(len(trips)), counts)
+
+    flat = {field: [segment[field] for segment in segments] for field in SEGMENT_FIELDS}
+    segment_km = np.asarray(flat['distance_km'], dtype=float)
+    valid = np.isfinite(segment_km) & (segment_km > 0)
+    if not valid.all():
+        bad = np.flatnonzero(~valid)[0]
+        raise ValueError(f"Segment distance_km must be > 0 (trip {trip_index[bad]}: {segment_km[bad]})")
+    for field in TRIP_FIELDS:
+        # Trip attributes are broadcast to their segments
+        flat[field] = np.repeat(np.array([trip[field] for trip in trips], dtype=object), counts)
+
+    return flat, trip_index
+
+
+def build_segment_features(flat, trip_index, n_trips, encoders):
+    """Feature matrix (one row per segment) in training column order
+
+    encoders: the LabelEncoders saved with the model ({column: encoder}).
+    """
+    segment_km = np.asarray(flat['distance_km'], dtype=float)
+    trip_km = np.bincount(trip_index, weights=segment_km, minlength=n_trips)[trip_index]
+
+    engine_capacity = flat['engine_capacity'].astype(float)
+    load_weight = flat['load_weight_kg'].astype(float)
+
+    features = np.column_stack([
+        engine_capacity,
+        trip_km,
+        load_weight,
+        np.asarray(flat['avg_speed_kmh'], dtype=float),
+        _encode(flat['vehicle_type'], encoders['vehicle_type'], 'vehicle_type'),
+        _encode(flat['fuel_type'], encoders['fuel_type'], 'fuel_type'),
+        _encode(flat['road_type'], encoders['road_type'], 'road_type'),
+        _encode(flat['traffic_level'], encoders['traffic_level'], 'traffic_level'),
+        _encode(flat['mileage_category'], encoders['mileage_category'], 'mileage_category'),
+        load_weight / trip_km,
+        engine_capacity * load_weight / 1000
+    ])
+
+    return features, segment_km / trip_km
+
+
+def score_trips(trips, predict_fn, encoders, quantile_fn=None, quantiles=(0.1, 0.5, 0.9), return_segments=False):
+    """Score all segments of all trips in one batch and aggregate per trip
+
+    predict_fn / quantile_fn take an unscaled feature matrix, e.g.
+    LoadedModel.predict and LoadedModel.predict_quantiles; encoders are the
+    LabelEncoders saved with that model (LoadedModel.encoders).
+    """
+    if not trips:
+        return pd.DataFrame()
+    if encoders is None:
+        raise ValueError("This model version has no saved label encoders; retrain with main.py")
+
+    n_trips = len(trips)
+    flat, trip_index = flatten_trips(trips)
+    features, distance_share = build_segment_features(flat, trip_index, n_trips, encoders)
+
+    segment_fuel = np.asarray(predict_fn(features), dtype=float) * distance_share
+
+    distance = np.bincount(trip_index, weights=np.asarray(flat['distance_km'], dtype=float),
+                           minlength=n_trips)
+    fuel = np.bincount(trip_index, weights=segment_fuel, minlength=n_trips)
+
+    result = pd.DataFrame({
+        'trip_id': [trip.get('trip_id', i) for i, trip in enumerate(trips)],
+        'segments': np.bincount(trip_index, minlength=n_trips),
+        'distance_km': distance,
+        'fuel_liters': fuel,
+        'mileage_kmpl': distance / fuel,
+        'co2_kg': fuel * CO2_PER_LITER
+    })
+
+    if quantile_fn is not None:
+        # Summing quantiles treats segments as perfectly correlated (conservative band)
+        segment_quantiles = np.asarray(quantile_fn(features), dtype=float) * distance_share[:, None]
+        for i, q in enumerate(quantiles):
+            result[f"fuel_p{round(q * 100)}"] = np.bincount(trip_index, weights=segment_quantiles[:, i],
+                                                            minlength=n_trips)
+
+    if return_segments:
+        return result, pd.DataFrame({'trip_index': trip_index, 'fuel_liters': segment_fuel})
+    return result
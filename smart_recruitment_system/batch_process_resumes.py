@@ -1,78 +1,114 @@
 """
-Batch Resume Processor - Process all resumes in subdirectories
+Batch Resume Processor - Process all resumes in subdirectories on a process pool
 """
 
+import os
 import sys
 import json
+import time
+import argparse
 from pathlib import Path
+from multiprocessing import Pool
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.nlp_engine import ResumeNLPEngine
+from src.nlp_engine import ResumeNLPEngine, ParseCache
+
+RESUME_DIR = Path("data/resumes")
+OUTPUT_PATH = Path("data/processed/batch_results.jsonl")
+SUPPORTED_FORMATS = ('.pdf', '.docx', '.txt')
+
+# One engine per worker process, built by the pool initializer
+_engine = None
 
 def print_header(text):
     print("\n" + "="*60)
     print(f"  {text}")
     print("="*60 + "\n")
 
-def process_all_resumes():
+def find_resumes(resume_dir=RESUME_DIR):
+    """Every supported resume file under the directory, largest first"""
+    resumes = [p for p in resume_dir.rglob("*") if p.is_file() and p.suffix.lower() in SUPPORTED_FORMATS]
+    # Start big files first so one slow PDF does not hold up the end of the run
+    return sorted(resumes, key=lambda p: p.stat().st_size, reverse=True)
+
+def _init_worker():
+    """Build the NLP engine once per worker instead of once per resume"""
+    global _engine
+    # Workers share the on-disk parse cache, so re-runs skip unchanged files
+    _engine = ResumeNLPEngine(parse_cache=ParseCache())
+
+def _process_one(resume_path):
+    """Process one resume; errors are returned as rows so the batch keeps going"""
+    try:
+        return _engine.process_resume(resume_path)
+    except Exception as e:
+        return {'file_path': str(resume_path), 'error': f"{type(e).__name__}: {e}"}
+
+def _results(resumes, workers, chunksize):
+    """Yield results as soon as any worker finishes one"""
+    if workers == 1:
+        _init_worker()
+        for resume_path in resumes:
+            yield _process_one(resume_path)
+        return
+
+    with Pool(processes=workers, initializer=_init_worker) as pool:
+        yield from pool.imap_unordered(_process_one, resumes, chunksize=chunksize)
+
+def process_all_resumes(resume_dir=RESUME_DIR, output_path=OUTPUT_PATH, workers=None, chunksize=4):
     print_header("📄 BATCH RESUME PROCESSING")
-    
-    # Find all PDF files recursively
-    resume_dir = Path("data/resumes")
-    resumes = list(resume_dir.rglob("*.pdf")) + list(resume_dir.rglob("*.docx"))
-    
+
+    resumes = find_resumes(Path(resume_dir))
     if not resumes:
         print("⚠️  No resumes found")
         return
-    
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(resumes)))
     print(f"Found {len(resumes)} resume(s)")
-    print(f"Processing first 5 resumes...\n")
-    
-    # Initialize engine
-    engine = ResumeNLPEngine()
-    
-    # Process first 5 resumes
-    results = []
-    for i, resume_path in enumerate(resumes[:5], 1):
-        print(f"\n[{i}/5] Processing: {resume_path.name}")
-        
-        try:
-            result = engine.process_resume(resume_path)
-            
-            # Print summary
-            entities = result['entities']
-            skills = result['skills']
-            
-            print(f"  Name: {entities.get('name') or 'Not found'}")
-            print(f"  Email: {entities.get('email') or 'Not found'}")
-            
-            tech_skills = []
-            for cat, skill_list in skills.get('technical', {}).items():
-                tech_skills.extend(skill_list)
-            
-            print(f"  Technical Skills: {len(tech_skills)}")
-            if tech_skills:
-                print(f"    {', '.join(tech_skills[:5])}")
-            
-            results.append(result)
-            
-        except Exception as e:
-            print(f"  ✗ Error: {e}")
-    
-    # Save results
-    output_path = Path("data/processed/batch_results.json")
-    with open(output_path, 'w') as f:
-        json.dump(results, f, indent=2)
-    
+    print(f"Processing on {workers} worker(s)...\n")
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    processed = failed = 0
+    start = time.perf_counter()
+
+    # One JSON object per line, written as results arrive, so a crash or
+    # Ctrl+C keeps everything finished so far
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for result in _results(resumes, workers, chunksize):
+            f.write(json.dumps(result) + "\n")
+
+            if 'error' in result:
+                failed += 1
+                print(f"\n  ✗ {Path(result['file_path']).name}: {result['error']}")
+            else:
+                processed += 1
+
+            done = processed + failed
+            elapsed = time.perf_counter() - start
+            print(f"\r  [{done}/{len(resumes)}] {done / elapsed:,.1f} rows/sec", end="", flush=True)
+
+    elapsed = time.perf_counter() - start
+    print()
+
     print_header("✅ BATCH PROCESSING COMPLETE")
-    print(f"\nProcessed: {len(results)} resumes")
+    print(f"Processed: {processed} resumes")
+    print(f"Failed: {failed}")
+    print(f"Time: {elapsed:.2f}s ({len(resumes) / elapsed:,.1f} rows/sec)")
     print(f"Saved to: {output_path}")
-    print(f"\nTotal resumes available: {len(resumes)}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Process every resume under data/resumes")
+    parser.add_argument('--input', default=str(RESUME_DIR), help="Resume directory (searched recursively)")
+    parser.add_argument('--output', default=str(OUTPUT_PATH), help="JSON Lines output file")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument('--chunksize', type=int, default=4, help="Resumes handed to a worker at a time")
+    args = parser.parse_args()
+
     try:
-        process_all_resumes()
+        process_all_resumes(args.input, args.output, args.workers, args.chunksize)
     except Exception as e:
         print(f"\n❌ Error: {e}")
         import traceback
@@ -0,0 +1,237 @@
+"""
+NLP Benchmarks - Latency of the resume processing and ranking stages
+"""
+
+import re
+import sys
+import json
+import time
+import random
+import tempfile
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.nlp_engine import skill_index
+from src.nlp_engine.skill_extractor import SkillExtractor
+from src.nlp_engine.skill_index import SkillIndex
+from src.nlp_engine.entity_recognizer import EntityRecognizer, EMAIL_PATTERN, PHONE_PATTERN
+from src.ranking.skill_bitmap_index import SkillBitmapIndex
+from src.ranking.candidate_scorer import CandidateScorer
+
+SAMPLE_DIR = Path("data/resumes/test")
+
+
+def print_header(text):
+    print("\n" + "="*60)
+    print(f"  {text}")
+    print("="*60 + "\n")
+
+
+def time_per_call(fn, repeats=50):
+    """Median milliseconds per call after one warm-up"""
+    fn()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def load_sample_texts():
+    """Plain-text samples (no parser dependencies needed)"""
+    texts = [p.read_text(encoding='utf-8', errors='ignore') for p in SAMPLE_DIR.glob('*.txt')]
+    return texts or [Path("data/resumes/sample_resume.txt").read_text(encoding='utf-8')]
+
+
+def regex_loop_extract(extractor, text):
+    """Previous implementation: one re.search per skill"""
+    text_lower = text.lower()
+    found = set()
+    for skills in list(extractor.tech_skills.values()) + [extractor.soft_skills]:
+        for skill in skills:
+            if re.search(r'\b' + re.escape(skill) + r'\b', text_lower):
+                found.add(skill)
+    return found
+
+
+def synthetic_taxonomy(size, seed=42):
+    """Random multi-word skill names to stress taxonomy scaling"""
+    rng = random.Random(seed)
+    syllables = ['ka', 'zo', 'ri', 'mu', 'te', 'lo', 'vi', 'sa', 'ne', 'po', 'qu', 'dex']
+    names = set()
+    while len(names) < size:
+        words = [''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+                 for _ in range(rng.randint(1, 3))]
+        names.add(' '.join(words))
+    return sorted(names)
+
+
+def benchmark_skills(texts):
+    print_header("🧠 SKILL EXTRACTION")
+    extractor = SkillExtractor()
+    text = max(texts, key=len)
+    print(f"Resume length: {len(text):,} chars\n")
+
+    print(f"{'Taxonomy':<10} {'Regex loop':<12} {'Index match':<13} {'Cold build':<12} {'Cached load':<12}")
+    print(f"{'entries':<10} {'(ms)':<12} {'(ms)':<13} {'(ms)':<12} {'(ms)':<12}")
+    print("-" * 60)
+
+    regex_ms = time_per_call(lambda: regex_loop_extract(extractor, text))
+    match_ms = time_per_call(lambda: extractor.extract_skills(text))
+    print(f"{len(extractor.index):<10,} {regex_ms:<12.2f} {match_ms:<13.2f} {'-':<12} {'-':<12}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in [1000, 10000, 30000]:
+            names = synthetic_taxonomy(size)
+            taxonomy_path = Path(tmp) / f"taxonomy_{size}.json"
+            taxonomy_path.write_text(json.dumps({'technical': {'synthetic': names}, 'soft': []}))
+
+            # Regex loop is too slow to repeat at large sizes; time one pass
+            lowered = text.lower()
+            start = time.perf_counter()
+            for name in names:
+                re.search(r'\b' + re.escape(name) + r'\b', lowered)
+            regex_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            SkillIndex.load(taxonomy_path, tmp)
+            build_ms = (time.perf_counter() - start) * 1000
+
+            # Simulate a fresh process: drop the in-memory copy, load from disk
+            skill_index._loaded_indexes.clear()
+            start = time.perf_counter()
+            large = SkillExtractor(taxonomy_path, tmp)
+            load_ms = (time.perf_counter() - start) * 1000
+
+            match_ms = time_per_call(lambda: large.extract_skills(text))
+            print(f"{size:<10,} {regex_ms:<12.2f} {match_ms:<13.2f} {build_ms:<12.1f} {load_ms:<12.1f}")
+
+    print("-" * 60)
+
+
+def sequential_extract_entities(recognizer, text):
+    """Previous implementation: one full findall pass per entity type"""
+    def first(pattern, flags=0):
+        matches = re.findall(pattern, text, flags)
+        return matches[0] if matches else None
+
+    def profile_url(pattern):
+        url = first(pattern, re.IGNORECASE)
+        if url and not url.startswith('http'):
+            url = 'https://' + url
+        return url.rstrip('/') if url else None
+
+    emails = [e for e in re.findall(rf'\b{EMAIL_PATTERN}', text) if '.' in e.split('@')[1]]
+    phone = first(PHONE_PATTERN)
+    location = re.findall(r'\b([A-Z][a-z]+(?:\s[A-Z][a-z]+)*),\s*([A-Z]{2}|[A-Z][a-z]+)\b', text)
+    return {
+        'name': recognizer._extract_name(text),
+        'email': emails[0].lower() if emails else None,
+        'phone': re.sub(r'[^0-9+]', '', phone) if phone else None,
+        'linkedin': profile_url(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+/?'),
+        'github': profile_url(r'(?:https?://)?(?:www\.)?github\.com/[\w-]+/?'),
+        'location': f"{location[0][0]}, {location[0][1]}" if location else None
+    }
+
+
+def benchmark_entities(texts):
+    print_header("📇 ENTITY RECOGNITION")
+    recognizer = EntityRecognizer()
+
+    print(f"{'Resume chars':<14} {'Sequential (ms)':<17} {'One-pass (ms)':<15} {'Speedup':<8}")
+    print("-" * 60)
+    for text in sorted(texts, key=len):
+        # Pad to a realistic multi-page length; contact details stay near the top
+        long_text = text + "\n" + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 200
+        for sample in (text, long_text):
+            sequential_ms = time_per_call(lambda: sequential_extract_entities(recognizer, sample))
+            one_pass_ms = time_per_call(lambda: recognizer.extract_entities(sample))
+            print(f"{len(sample):<14,} {sequential_ms:<17.3f} {one_pass_ms:<15.3f} "
+                  f"{sequential_ms / one_pass_ms:<8.1f}x")
+    print("-" * 60)
+
+
+def benchmark_docx():
+    print_header("📄 DOCX EXTRACTION")
+    from src.nlp_engine.resume_parser import ResumeParser
+    from src.nlp_engine.docx_extractor import extract_docx_text
+    parser = ResumeParser()
+
+    samples = sorted(SAMPLE_DIR.glob('*.docx'))
+    if not samples:
+        print(f"No DOCX samples in {SAMPLE_DIR}")
+        return
+
+    print(f"{'File':<24} {'python-docx (ms)':<18} {'Streaming (ms)':<16} {'Speedup':<8} {'Same text'}")
+    print("-" * 78)
+    for path in samples:
+        document_ms = time_per_call(lambda: parser._parse_docx_document(path), repeats=20)
+        streaming_ms = time_per_call(lambda: parser._clean_text(extract_docx_text(path)), repeats=20)
+        same = parser._parse_docx(path) == parser._parse_docx_document(path)
+        print(f"{path.name[:23]:<24} {document_ms:<18.2f} {streaming_ms:<16.2f} "
+              f"{document_ms / streaming_ms:<8.1f}x {'✅' if same else '❌'}")
+    print("-" * 78)
+
+
+def synthetic_candidates(n, num_skills=300, per_candidate=15, seed=42):
+    """(candidate_id, skills) pairs with a long-tailed skill popularity"""
+    rng = random.Random(seed)
+    skills = [f"skill {i}" for i in range(num_skills)]
+    weights = [1 / (rank + 1) for rank in range(num_skills)]
+    return [(i, set(rng.choices(skills, weights, k=per_candidate))) for i in range(1, n + 1)], skills
+
+
+def benchmark_skill_filter():
+    print_header("🎯 REQUIRED-SKILL FILTERING")
+    print(f"{'Candidates':<12} {'Set loop (ms)':<15} {'AND (ms)':<10} {'OR (ms)':<10} {'>=3 of 10 (ms)':<15}")
+    print("-" * 60)
+
+    for n in [10000, 100000, 1000000]:
+        candidates, skills = synthetic_candidates(n)
+        required = set(skills[5:15])
+        index = SkillBitmapIndex(capacity=n)
+        index.add_many(candidates)
+
+        # Previous approach: intersect every candidate's skill set
+        repeats = 3 if n >= 1000000 else 10
+        set_ms = time_per_call(lambda: [c for c, s in candidates if len(s & required) >= 3], repeats)
+        and_ms = time_per_call(lambda: index.match_all(skills[5:8]))
+        or_ms = time_per_call(lambda: index.match_any(required))
+        k_ms = time_per_call(lambda: index.match_at_least(required, 3))
+        print(f"{n:<12,} {set_ms:<15.1f} {and_ms:<10.2f} {or_ms:<10.2f} {k_ms:<15.2f}")
+    print("-" * 60)
+
+
+def benchmark_scoring(texts, n=20000):
+    print_header("📊 CANDIDATE SCORING")
+    extractor = SkillExtractor()
+    recognizer = EntityRecognizer()
+    scorer = CandidateScorer()
+
+    base = [{'raw_text': t, 'skills': extractor.extract_skills(t), 'entities': recognizer.extract_entities(t)}
+            for t in texts]
+    candidates = [dict(base[i % len(base)], id=i) for i in range(n)]
+    job = {'required_skills': ['Python', 'Sql', 'Aws', 'Docker']}
+
+    loop_ms = time_per_call(lambda: [scorer.score_candidate(c, job) for c in candidates], 5)
+    extract_ms = time_per_call(lambda: scorer.extract_features(candidates), 5)
+    features = scorer.extract_features(candidates)
+    batch_ms = time_per_call(lambda: scorer.score_batch(features, job))
+
+    print(f"Candidates: {n:,}\n")
+    print(f"Per-candidate loop:        {loop_ms:8.1f} ms")
+    print(f"Feature extraction (once): {extract_ms:8.1f} ms")
+    print(f"Batch score / re-weight:   {batch_ms:8.2f} ms")
+    print("-" * 60)
+
+
+if __name__ == "__main__":
+    texts = load_sample_texts()
+    benchmark_skills(texts)
+    benchmark_entities(texts)
+    benchmark_docx()
+    benchmark_skill_filter()
+    benchmark_scoring(texts)
@@ -12,6 +12,41 @@ IMAGE_SIZE = (160, 160)
 FACE_CONFIDENCE_THRESHOLD = 0.9
 VERIFICATION_THRESHOLD = 0.6
 
+# Skill Extraction Settings
+SKILLS_TAXONOMY_PATH = BASE_DIR / "config" / "skills_taxonomy.json"
+SKILL_INDEX_CACHE_DIR = PROCESSED_DATA_DIR / "skill_index"
+
+# Resume Parsing Settings
+PARSE_CACHE_DIR = PROCESSED_DATA_DIR / "parse_cache"
+PDF_MAX_PAGES = 50        # stop reading long PDFs (scanned portfolios) after this many pages
+PDF_MAX_CHARS = 200_000   # ...or once this much text has been extracted
+PARSE_WORKERS = 2         # sandboxed parser processes kept alive by the web app
+PARSE_TIMEOUT = 30        # seconds before a parse is abandoned and its worker killed
+PARSE_MEMORY_LIMIT_MB = 1024  # address-space cap per parser process
+
+# Candidate Storage Settings
+CANDIDATE_DB_PATH = PROCESSED_DATA_DIR / "candidates.db"
+
+# Ingestion Queue Settings
+INGEST_QUEUE_DB_PATH = PROCESSED_DATA_DIR / "ingest_queue.db"
+INGEST_WORKERS = 2            # background parser processes started by the web app
+INGEST_POLL_INTERVAL = 0.5    # seconds an idle worker waits before checking the queue again
+INGEST_HEARTBEAT_INTERVAL = 5  # seconds between a busy worker's heartbeats on its job
+INGEST_LEASE_TIMEOUT = 60      # seconds without a heartbeat before a 'processing' job counts as abandoned
+INGEST_MAX_ATTEMPTS = 3        # claims before an abandoned job is marked failed instead of re-queued
+BULK_UPLOAD_MAX_BYTES = 2 * 1024 * 1024 * 1024  # request size limit for /upload_resumes (zip exports)
+BULK_UPLOAD_MAX_FILES = 5000                    # resumes accepted per bulk request
+BULK_UPLOAD_MAX_FILE_BYTES = 16 * 1024 * 1024   # per resume, same as a single upload
+
+# Job Matching Settings
+TFIDF_INDEX_DIR = PROCESSED_DATA_DIR / "tfidf_index"
+SEMANTIC_INDEX_PATH = PROCESSED_DATA_DIR / "semantic_index.npz"
+MATCH_INDEX_SAVE_INTERVAL = 60  # seconds between index saves after uploads/deletes
+
+# Dashboard Analytics Settings
+ANALYTICS_STATE_PATH = PROCESSED_DATA_DIR / "analytics_state.json"
+ANALYTICS_SAVE_INTERVAL = 60    # seconds between analytics saves after uploads/deletes
+
 # Supported Image Formats
 SUPPORTED_FORMATS = ['.jpg', '.jpeg', '.png', '.bmp']
 
@@ -1,5 +1,6 @@
 from .dashboard_generator import DashboardGenerator
 from .analytics_generator import AnalyticsGenerator
 from .visualization_generator import VisualizationGenerator
+from .analytics_state import AnalyticsState
 
-__all__ = ['DashboardGenerator', 'AnalyticsGenerator', 'VisualizationGenerator']
+__all__ = ['DashboardGenerator', 'AnalyticsGenerator', 'VisualizationGenerator', 'AnalyticsState']
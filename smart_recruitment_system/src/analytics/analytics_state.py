@@ -0,0 +1,268 @@
+"""
+Analytics State - Dashboard analytics kept up to date one candidate at a time
+
+Every candidate's contribution (technical skills, skill categories,
+contact flags, score, grade) is recorded once when it is added. Adding,
+removing or rescoring a candidate adjusts running totals, Counters and
+sorted score lists instead of rescanning the pool. The analytics dict
+(same shape as AnalyticsGenerator.generate_analytics) is rebuilt from the
+totals only after a change, so reads are O(1). The state is saved to one
+JSON file; loading rebuilds the totals from the saved contributions.
+"""
+import bisect
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from pathlib import Path
+
+STATE_FORMAT_VERSION = 1
+
+
+def _with(counter, keys, delta):
+    if delta > 0:
+        counter.update(keys)
+        return
+    counter.subtract(keys)
+    for key in keys:
+        if counter.get(key, 1) <= 0:
+            del counter[key]
+
+
+class AnalyticsState:
+    def __init__(self):
+        self._members = {}               # candidate id -> contribution
+        self._seq = 0                    # insertion order, breaks ties like a stable sort
+        self._skills = Counter()         # technical skill -> mentions
+        self._categories = Counter()     # skill category -> candidates
+        self._grades = Counter()
+        self._with_email = 0
+        self._with_linkedin = 0
+        self._complete = 0
+        self._score_sum = 0.0
+        self._scores = []                # sorted scores of scored candidates (min / max)
+        self._ranking = []               # sorted (-score, seq) of every candidate (top candidates)
+        self._unsorted = False           # inside add_many, before the final sort
+        self._lock = threading.Lock()
+        self._analytics = None           # cached result of analytics()
+        self.dirty = False               # changed since the last save
+
+    def __len__(self):
+        return len(self._members)
+
+    def __contains__(self, candidate_id):
+        return str(candidate_id) in self._members
+
+    @property
+    def ids(self):
+        return list(self._members)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def add(self, candidate_id, candidate, score=None, grade=None, contact=None):
+        """Add or replace a candidate
+
+        candidate: parsed resume ('entities' and 'skills'). score / grade:
+        its total_score and grade, if scored. contact: (name, email) shown
+        in top candidates; defaults to the parsed entities.
+        """
+        with self._lock:
+            self._add(candidate_id, candidate, score, grade, contact)
+
+    def add_many(self, entries):
+        """add() for many (candidate_id, candidate, score, grade, contact) tuples, sorting once at the end"""
+        with self._lock:
+            self._unsorted = True
+            for entry in entries:
+                self._add(*entry)
+            self._scores.sort()
+            self._ranking.sort()
+            self._unsorted = False
+
+    def _add(self, candidate_id, candidate, score, grade, contact):
+        entities = candidate.get('entities', {})
+        technical = candidate.get('skills', {}).get('technical', {})
+        if contact is None:
+            contact = (entities.get('name'), entities.get('email'))
+        key = str(candidate_id)
+        self._remove(key)
+        self._seq += 1
+        self._apply(key, {
+            'skills': [skill for skill_list in technical.values() for skill in skill_list],
+            'categories': list(technical),
+            'email': bool(entities.get('email')),
+            'linkedin': bool(entities.get('linkedin')),
+            'complete': bool(entities.get('email') and entities.get('phone')),
+            'score': score,
+            'grade': grade or 'D',
+            'name': contact[0],
+            'contact_email': contact[1],
+            'seq': self._seq,
+        })
+
+    def remove(self, candidate_id):
+        """Drop a candidate; returns False if it was not tracked"""
+        with self._lock:
+            return self._remove(str(candidate_id))
+
+    def rescore(self, candidate_id, score, grade):
+        """Update one candidate's score and grade"""
+        with self._lock:
+            member = self._members.get(str(candidate_id))
+            if member is None:
+                return False
+            self._remove(str(candidate_id))
+            self._apply(str(candidate_id), {**member, 'score': score, 'grade': grade or 'D'})
+            return True
+
+    def _apply(self, key, member):
+        self._members[key] = member
+        _with(self._skills, member['skills'], 1)
+        _with(self._categories, member['categories'], 1)
+        self._grades[member['grade']] += 1
+        self._with_email += member['email']
+        self._with_linkedin += member['linkedin']
+        self._complete += member['complete']
+        entry = (-(member['score'] or 0), member['seq'], key)
+        if self._unsorted:
+            if member['score'] is not None:
+                self._scores.append(member['score'])
+            self._ranking.append(entry)
+        else:
+            if member['score'] is not None:
+                bisect.insort(self._scores, member['score'])
+            bisect.insort(self._ranking, entry)
+        if member['score'] is not None:
+            self._score_sum += member['score']
+        self._changed()
+
+    def _remove(self, key):
+        member = self._members.pop(key, None)
+        if member is None:
+            return False
+        _with(self._skills, member['skills'], -1)
+        _with(self._categories, member['categories'], -1)
+        _with(self._grades, [member['grade']], -1)
+        self._with_email -= member['email']
+        self._with_linkedin -= member['linkedin']
+        self._complete -= member['complete']
+        entry = (-(member['score'] or 0), member['seq'], key)
+        if member['score'] is not None:
+            self._score_sum -= member['score']
+        if self._unsorted:
+            if member['score'] is not None:
+                self._scores.remove(member['score'])
+            self._ranking.remove(entry)
+        else:
+            if member['score'] is not None:
+                del self._scores[bisect.bisect_left(self._scores, member['score'])]
+            del self._ranking[bisect.bisect_left(self._ranking, entry)]
+        self._changed()
+        return True
+
+    def _changed(self):
+        self._analytics = None
+        self.dirty = True
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def analytics(self):
+        """Current analytics; rebuilt from the running totals only after a change"""
+        with self._lock:
+            if self._analytics is None:
+                self._analytics = self._build()
+            return self._analytics
+
+    def _build(self):
+        total = len(self._members)
+        if not total:
+            return {
+                'overview': {'total_candidates': 0, 'avg_score': 0},
+                'skills_distribution': {'total_unique_skills': 0, 'top_skills': {}},
+                'score_distribution': {'grade_distribution': {}},
+                'profile_completeness': {'complete_profiles': 0},
+                'top_candidates': []
+            }
+
+        scores = self._scores
+        top = [self._members[key] for _, _, key in self._ranking[:5]]
+        return {
+            'overview': {
+                'total_candidates': total,
+                'avg_score': round(self._score_sum / len(scores), 2) if scores else 0,
+                'max_score': scores[-1] if scores else 0,
+                'min_score': scores[0] if scores else 0,
+                'candidates_with_email': self._with_email,
+                'candidates_with_linkedin': self._with_linkedin
+            },
+            'skills_distribution': {
+                'total_unique_skills': len(self._skills),
+                'top_skills': dict(self._skills.most_common(10)),
+                'skill_categories': dict(self._categories)
+            },
+            'score_distribution': {
+                'grade_distribution': dict(self._grades),
+                'a_grade_count': self._grades.get('A', 0),
+                'b_grade_count': self._grades.get('B', 0),
+                'c_grade_count': self._grades.get('C', 0),
+                'd_grade_count': self._grades.get('D', 0)
+            },
+            'profile_completeness': {
+                'complete_profiles': self._complete,
+                'incomplete_profiles': total - self._complete,
+                'completeness_rate': round((self._complete / total) * 100, 2)
+            },
+            'top_candidates': [{
+                'name': m['name'] or 'Unknown',
+                'score': m['score'] or 0,
+                'grade': m['grade'],
+                'email': m['contact_email']
+            } for m in top]
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path):
+        """Write every contribution and the current analytics to one JSON file (atomic replace)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        analytics = self.analytics()
+        with self._lock:
+            state = {'format': STATE_FORMAT_VERSION, 'seq': self._seq,
+                     'members': self._members, 'analytics': analytics}
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-', suffix='.json')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, path)
+            self.dirty = False
+
+    @classmethod
+    def load(cls, path):
+        """Load a saved state, or return an empty one if none exists (or it is stale)"""
+        state = cls()
+        try:
+            saved = json.loads(Path(path).read_text())
+            if saved.get('format') != STATE_FORMAT_VERSION:
+                return state
+            members = saved['members']
+        except (OSError, ValueError, KeyError):
+            return state
+
+        # Sort once at the end instead of inserting into the sorted lists one by one
+        state._unsorted = True
+        for key, member in sorted(members.items(), key=lambda item: item[1]['seq']):
+            state._apply(key, member)
+        state._scores.sort()
+        state._ranking.sort()
+        state._unsorted = False
+        state._seq = saved.get('seq', len(members))
+        state._analytics = saved.get('analytics')
+        state.dirty = False
+        return state
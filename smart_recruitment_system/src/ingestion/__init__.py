@@ -0,0 +1,5 @@
+from .job_queue import IngestionQueue
+from .worker_pool import IngestionWorkers
+from .bulk_upload import BulkUpload
+
+__all__ = ['IngestionQueue', 'IngestionWorkers', 'BulkUpload']
@@ -0,0 +1,188 @@
+"""
+Bulk Upload - Save many uploaded resumes (plain files or zip archives) for ingestion
+
+Every file is copied to the uploaded folder in fixed-size chunks while
+its SHA-256 is computed, so neither an archive nor its members are ever
+held in memory. Zip members are read one at a time from the archive
+(which Werkzeug has already spooled to a temporary file). Content that
+is already stored, already queued or repeated within the request is not
+saved again, and a new file never replaces an existing resume with the
+same name: it is linked into place under the first free name. The saved files are queued in a single transaction, and
+the ingestion workers parse them in parallel.
+"""
+import hashlib
+import os
+import tempfile
+import zipfile
+import zlib
+from pathlib import Path, PurePosixPath
+
+from werkzeug.utils import secure_filename
+
+from config.settings import BULK_UPLOAD_MAX_FILES, BULK_UPLOAD_MAX_FILE_BYTES
+
+RESUME_EXTENSIONS = {'.pdf', '.docx', '.txt'}
+ARCHIVE_EXTENSIONS = {'.zip'}
+_CHUNK_SIZE = 1024 * 1024
+
+
+class _TooLarge(Exception):
+    pass
+
+
+class BulkUpload:
+    def __init__(self, folder, store, queue, source='uploaded',
+                 max_files=BULK_UPLOAD_MAX_FILES, max_file_bytes=BULK_UPLOAD_MAX_FILE_BYTES):
+        self.folder = Path(folder).resolve()
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.store = store
+        self.queue = queue
+        self.source = source
+        self.max_files = max_files
+        self.max_file_bytes = max_file_bytes
+        self.files = []      # per-file summary rows, in upload order
+        self._saved = []     # (file_path, filename, content_hash, summary row) waiting to be queued
+        self._hashes = {}    # content hash -> filename saved by this request
+        self._names = set()  # filenames used by this request
+
+    def add(self, storage):
+        """Add one uploaded file: a resume, or a zip archive of resumes"""
+        name = storage.filename or ''
+        if PurePosixPath(name).suffix.lower() in ARCHIVE_EXTENSIONS:
+            self._add_archive(name, storage.stream)
+        else:
+            self._add_file(name, PurePosixPath(name).name, storage.stream.read)
+
+    def _add_archive(self, archive_name, stream):
+        try:
+            archive = zipfile.ZipFile(stream)
+        except (zipfile.BadZipFile, OSError) as e:
+            self._row(archive_name, 'skipped', reason=f"not a readable zip archive ({e})")
+            return
+        with archive:
+            for info in archive.infolist():
+                path = PurePosixPath(info.filename)
+                # Folders and OS metadata (__MACOSX/, .DS_Store, ._resume.pdf)
+                if info.is_dir() or any(part.startswith(('.', '__MACOSX')) for part in path.parts):
+                    continue
+                name = f"{archive_name}/{info.filename}"
+                if path.suffix.lower() in ARCHIVE_EXTENSIONS:
+                    self._row(name, 'skipped', reason='nested archives are not extracted')
+                    continue
+                if info.file_size > self.max_file_bytes:
+                    self._row(name, 'skipped', reason=self._size_reason())
+                    continue
+                try:
+                    with archive.open(info) as member:
+                        self._add_file(name, path.name, member.read, fallback_name='_'.join(path.parts))
+                except (RuntimeError, NotImplementedError, zipfile.BadZipFile, zlib.error, OSError) as e:
+                    # Encrypted members, unsupported compression, corrupt data
+                    self._row(name, 'skipped', reason=f"could not extract ({e})")
+
+    def _add_file(self, name, basename, read, fallback_name=None):
+        """Stream one file to disk unless it is unsupported, too large or a duplicate"""
+        if PurePosixPath(basename).suffix.lower() not in RESUME_EXTENSIONS:
+            self._row(name, 'skipped', reason='unsupported file type')
+            return
+        if len(self._saved) >= self.max_files:
+            self._row(name, 'skipped', reason=f"more than {self.max_files} files in one request")
+            return
+        filename = secure_filename(basename)
+        if not filename:
+            self._row(name, 'skipped', reason='invalid filename')
+            return
+
+        try:
+            temp_path, content_hash = self._copy(read)
+        except _TooLarge:
+            self._row(name, 'skipped', reason=self._size_reason())
+            return
+
+        duplicate_of = (self._hashes.get(content_hash) or self.store.find_by_hash(content_hash, self.source)
+                        or self.queue.pending_with_hash(content_hash))
+        if duplicate_of:
+            os.unlink(temp_path)
+            self._row(name, 'duplicate', filename=duplicate_of)
+            return
+
+        filename = self._place(temp_path, filename, fallback_name)
+        file_path = self.folder / filename
+        self._hashes[content_hash] = filename
+        self._names.add(filename)
+        self._saved.append((file_path, filename, content_hash, self._row(name, 'queued', filename=filename)))
+
+    def _copy(self, read):
+        """Write chunks from `read` to a temp file in the target folder; returns (path, sha256)"""
+        fd, temp_path = tempfile.mkstemp(dir=self.folder, prefix='.upload-')
+        sha = hashlib.sha256()
+        size = 0
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                for chunk in iter(lambda: read(_CHUNK_SIZE), b''):
+                    size += len(chunk)
+                    if size > self.max_file_bytes:
+                        raise _TooLarge()
+                    sha.update(chunk)
+                    out.write(chunk)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return temp_path, sha.hexdigest()
+
+    def _place(self, temp_path, filename, fallback_name):
+        """Move the temp file to the first name no file, stored candidate or earlier member uses
+
+        os.link fails instead of replacing, so a concurrent upload of the
+        same name cannot be overwritten either. Returns the name used.
+        """
+        for candidate in self._candidate_names(filename, fallback_name):
+            if self.store.contains(candidate, self.source):
+                continue
+            try:
+                os.link(temp_path, self.folder / candidate)
+            except FileExistsError:
+                continue
+            os.unlink(temp_path)
+            return candidate
+
+    def _candidate_names(self, filename, fallback_name):
+        """The file's own name, then its archive path (e.g. same name in two folders), then numbered variants"""
+        names = [filename]
+        if fallback_name:
+            names.append(secure_filename(fallback_name) or filename)
+        for name in dict.fromkeys(names):
+            if name not in self._names:
+                yield name
+        stem, suffix = os.path.splitext(names[-1])
+        n = 1
+        while True:
+            n += 1
+            candidate = f"{stem}_{n}{suffix}"
+            if candidate not in self._names:
+                yield candidate
+
+    def _size_reason(self):
+        return f"larger than {self.max_file_bytes // (1024 * 1024)}MB"
+
+    def _row(self, name, status, filename=None, reason=None):
+        row = {'name': name, 'status': status}
+        if filename:
+            row['filename'] = filename
+        if reason:
+            row['reason'] = reason
+        self.files.append(row)
+        return row
+
+    def commit(self):
+        """Queue every saved file in one transaction; returns the job ids"""
+        job_ids = self.queue.enqueue_many([saved[:3] for saved in self._saved], self.source)
+        for (_, _, _, row), job_id in zip(self._saved, job_ids):
+            row['job_id'] = job_id
+        self._saved = []
+        return job_ids
+
+    def summary(self):
+        counts = {'queued': 0, 'duplicate': 0, 'skipped': 0}
+        for row in self.files:
+            counts[row['status']] += 1
+        return {'counts': counts, 'files': self.files}
@@ -0,0 +1,222 @@
+"""
+Ingestion Queue - SQLite job table for background resume parsing
+
+One row per uploaded file. Jobs move queued -> processing -> done | failed;
+workers claim the oldest queued job with a single UPDATE, so any number
+of worker processes can share the table. Finished jobs get an increasing
+done_seq, which lets web processes pick up newly stored candidates with
+one indexed query (finished_since). A worker holds its job on a lease it
+renews with heartbeats; only jobs whose lease ran out are re-queued, so a
+web process starting its own workers never takes jobs from live ones. A
+job abandoned after INGEST_MAX_ATTEMPTS claims (e.g. a file that keeps
+killing its worker) is failed instead.
+"""
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from config.settings import INGEST_QUEUE_DB_PATH, INGEST_LEASE_TIMEOUT, INGEST_MAX_ATTEMPTS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    filename TEXT NOT NULL,
+    source TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    content_hash TEXT,
+    status TEXT NOT NULL DEFAULT 'queued',
+    stage TEXT,
+    error TEXT,
+    candidate_id INTEGER,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    heartbeat REAL,
+    done_seq INTEGER UNIQUE,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, id);
+"""
+
+HASH_INDEX = "CREATE INDEX IF NOT EXISTS idx_jobs_hash ON jobs (content_hash)"
+
+# Columns added after the first release: name -> type
+ADDED_COLUMNS = {'content_hash': 'TEXT', 'heartbeat': 'REAL'}
+
+STATUSES = ('queued', 'processing', 'done', 'failed')
+
+
+def _now():
+    return datetime.now().isoformat(timespec='seconds')
+
+
+class IngestionQueue:
+    def __init__(self, db_path=INGEST_QUEUE_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # sqlite3 connections must not be shared between threads
+        self._local = threading.local()
+        with self.conn as conn:
+            conn.executescript(SCHEMA)
+            # Queues created before these columns existed
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(jobs)")]
+            for name, column_type in ADDED_COLUMNS.items():
+                if name not in columns:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {column_type}")
+            conn.execute(HASH_INDEX)
+
+    @property
+    def conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def enqueue(self, file_path, filename, source='uploaded', content_hash=None):
+        """Queue a saved file for parsing; returns the job id"""
+        return self.enqueue_many([(file_path, filename, content_hash)], source)[0]
+
+    def enqueue_many(self, files, source='uploaded'):
+        """Queue (file_path, filename, content_hash) tuples in one transaction; returns the job ids"""
+        now = _now()
+        with self.conn as conn:
+            return [conn.execute(
+                "INSERT INTO jobs (filename, source, file_path, content_hash, created_at) VALUES (?, ?, ?, ?, ?)",
+                (filename, source, str(file_path), content_hash, now)
+            ).lastrowid for file_path, filename, content_hash in files]
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def claim(self, worker):
+        """Atomically take the oldest queued job; None when the queue is empty"""
+        with self.conn as conn:
+            row = conn.execute(
+                """
+                UPDATE jobs SET status = 'processing', stage = 'parsing', worker = ?,
+                    started_at = ?, heartbeat = ?, attempts = attempts + 1
+                WHERE id = (SELECT id FROM jobs WHERE status = 'queued' ORDER BY id LIMIT 1)
+                RETURNING *
+                """,
+                (worker, _now(), time.time())
+            ).fetchone()
+        return dict(row) if row else None
+
+    def heartbeat(self, job_id):
+        """Renew the lease on a job being processed"""
+        with self.conn as conn:
+            conn.execute("UPDATE jobs SET heartbeat = ? WHERE id = ? AND status = 'processing'",
+                         (time.time(), job_id))
+
+    def set_stage(self, job_id, stage):
+        with self.conn as conn:
+            conn.execute("UPDATE jobs SET stage = ? WHERE id = ?", (stage, job_id))
+
+    def complete(self, job_id, candidate_id):
+        with self.conn as conn:
+            conn.execute(
+                """
+                UPDATE jobs SET status = 'done', stage = NULL, candidate_id = ?, finished_at = ?,
+                    done_seq = (SELECT COALESCE(MAX(done_seq), 0) + 1 FROM jobs)
+                WHERE id = ?
+                """,
+                (candidate_id, _now(), job_id)
+            )
+
+    def fail(self, job_id, reason):
+        with self.conn as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', stage = NULL, error = ?, finished_at = ? WHERE id = ?",
+                (reason, _now(), job_id)
+            )
+
+    def requeue_abandoned(self, lease_timeout=INGEST_LEASE_TIMEOUT, max_attempts=INGEST_MAX_ATTEMPTS):
+        """Put 'processing' jobs whose worker stopped heartbeating back in the queue
+
+        Jobs already claimed max_attempts times are marked failed instead.
+        Returns the number of jobs re-queued.
+        """
+        abandoned = "status = 'processing' AND (heartbeat IS NULL OR heartbeat < ?)"
+        expired = time.time() - lease_timeout
+        with self.conn as conn:
+            conn.execute(
+                f"""
+                UPDATE jobs SET status = 'failed', stage = NULL, heartbeat = NULL, finished_at = ?,
+                    error = 'Abandoned by its worker ' || attempts || ' times; giving up'
+                WHERE {abandoned} AND attempts >= ?
+                """,
+                (_now(), expired, max_attempts)
+            )
+            return conn.execute(
+                f"""
+                UPDATE jobs SET status = 'queued', stage = NULL, worker = NULL, heartbeat = NULL
+                WHERE {abandoned}
+                """,
+                (expired,)
+            ).rowcount
+
+    # ------------------------------------------------------------------
+    # Status
+    # ------------------------------------------------------------------
+
+    def get(self, job_id):
+        """Job row plus its position in the queue (0 = next), or None"""
+        row = self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        if job['status'] == 'queued':
+            job['position'] = self.conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = 'queued' AND id < ?", (job_id,)
+            ).fetchone()[0]
+        return job
+
+    def pending_with_hash(self, content_hash):
+        """Filename of a queued or processing job for the same content, or None"""
+        row = self.conn.execute(
+            "SELECT filename FROM jobs WHERE content_hash = ? AND status IN ('queued', 'processing') LIMIT 1",
+            (content_hash,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def filenames(self, source):
+        """Filenames with a job in any status for a source"""
+        return {row[0] for row in self.conn.execute("SELECT DISTINCT filename FROM jobs WHERE source = ?", (source,))}
+
+    def counts(self):
+        counts = dict.fromkeys(STATUSES, 0)
+        for status, n in self.conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"):
+            counts[status] = n
+        return counts
+
+    def has_pending(self):
+        return self.conn.execute(
+            "SELECT EXISTS (SELECT 1 FROM jobs WHERE status IN ('queued', 'processing'))"
+        ).fetchone()[0] == 1
+
+    def last_seq(self):
+        return self.conn.execute("SELECT COALESCE(MAX(done_seq), 0) FROM jobs").fetchone()[0]
+
+    def finished_since(self, seq):
+        """Jobs completed after done_seq `seq`, oldest first"""
+        return [dict(row) for row in self.conn.execute(
+            "SELECT id, done_seq, candidate_id, source FROM jobs WHERE done_seq > ? ORDER BY done_seq", (seq,)
+        )]
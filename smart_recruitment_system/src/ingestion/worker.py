@@ -0,0 +1,69 @@
+"""
+Ingestion Worker - Subprocess entry point used by IngestionWorkers
+
+Run as `python -m src.ingestion.worker <name> <parent pid> [queue db]`.
+Claims queued jobs one at a time, parses each file (through a
+ParseSandbox, so a bad file times out instead of wedging the worker)
+and upserts the result into the candidate store. A background thread
+renews the lease on the current job every INGEST_HEARTBEAT_INTERVAL.
+"""
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from config.settings import INGEST_QUEUE_DB_PATH, INGEST_POLL_INTERVAL, INGEST_HEARTBEAT_INTERVAL
+from src.nlp_engine import ResumeNLPEngine, ParseCache, ParseSandbox, ParseError
+from src.storage import CandidateStore
+from .job_queue import IngestionQueue
+
+
+def run_worker(name, parent_pid=None, db_path=INGEST_QUEUE_DB_PATH, poll_interval=INGEST_POLL_INTERVAL):
+    queue = IngestionQueue(db_path)
+    store = CandidateStore()
+    cache = ParseCache()
+    engine = ResumeNLPEngine(parse_cache=cache, parse_sandbox=ParseSandbox(workers=1))
+    current = {'job_id': None}  # job being processed, read by the heartbeat thread
+    stop = threading.Event()
+    threading.Thread(target=_heartbeat, args=(queue, name, current, stop), daemon=True).start()
+
+    # Exit once the web process that started us is gone
+    while parent_pid is None or os.getppid() == parent_pid:
+        job = queue.claim(name)
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+        current['job_id'] = job['id']
+        try:
+            path = Path(job['file_path'])
+            result = engine.process_resume(str(path))
+            queue.set_stage(job['id'], 'storing')
+            candidate_id = store.upsert(result, job['filename'], job['source'], file_path=path,
+                                        content_hash=job['content_hash'] or cache.content_hash(path), size=path.stat().st_size)
+        except ParseError as e:
+            queue.fail(job['id'], e.reason)
+        except Exception as e:
+            queue.fail(job['id'], f"{type(e).__name__}: {e}")
+        else:
+            queue.complete(job['id'], candidate_id)
+        current['job_id'] = None
+
+    stop.set()
+    engine.parser.sandbox.close()
+
+
+def _heartbeat(queue, name, current, stop, interval=INGEST_HEARTBEAT_INTERVAL):
+    """Keep the lease on the current job alive, even during a long parse"""
+    while not stop.wait(interval):
+        job_id = current['job_id']
+        if job_id is None:
+            continue
+        try:
+            queue.heartbeat(job_id)
+        except Exception as e:
+            print(f"⚠️ {name}: heartbeat failed: {e}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    run_worker(sys.argv[1], int(sys.argv[2]), *(sys.argv[3:4] or [INGEST_QUEUE_DB_PATH]))
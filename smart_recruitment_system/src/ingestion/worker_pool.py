@@ -0,0 +1,60 @@
+"""
+Ingestion Workers - Background processes that drain the ingestion queue
+
+Each worker is a separate `python -m src.ingestion.worker` process (not a
+fork of the web server) that parses queued files and writes the results
+to the candidate store. Workers are started on first use and restarted
+if they die; a worker notices when the web process is gone and exits.
+Jobs of workers that stopped without finishing are re-queued once their
+lease expires, whichever web process started them.
+"""
+import os
+import subprocess
+import sys
+import threading
+
+from config.settings import BASE_DIR, INGEST_WORKERS
+from .job_queue import IngestionQueue
+
+
+class IngestionWorkers:
+    def __init__(self, num_workers=INGEST_WORKERS, queue=None):
+        self.num_workers = num_workers
+        self.queue = queue or IngestionQueue()
+        self._processes = []
+        self._lock = threading.Lock()
+
+    def ensure_running(self):
+        """Start missing workers (first call, or after one exited)"""
+        with self._lock:
+            # Only jobs whose worker stopped heartbeating; other processes' live workers keep theirs
+            self.queue.requeue_abandoned()
+            self._processes = [p for p in self._processes if p.poll() is None]
+            while len(self._processes) < self.num_workers:
+                self._processes.append(self._spawn(len(self._processes)))
+
+    def _spawn(self, number):
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(p for p in [str(BASE_DIR), env.get('PYTHONPATH')] if p)
+        return subprocess.Popen(
+            [sys.executable, '-m', 'src.ingestion.worker', f"worker-{os.getpid()}-{number}", str(os.getpid()),
+             str(self.queue.db_path)],
+            cwd=BASE_DIR, env=env, stdin=subprocess.DEVNULL
+        )
+
+    def alive(self):
+        with self._lock:
+            return sum(p.poll() is None for p in self._processes)
+
+    def close(self):
+        """Stop every worker; a job in progress is re-queued once its lease expires"""
+        with self._lock:
+            for process in self._processes:
+                if process.poll() is None:
+                    process.terminate()
+            for process in self._processes:
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+            self._processes = []
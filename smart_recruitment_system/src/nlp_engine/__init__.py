@@ -1,7 +1,9 @@
 from .nlp_engine import ResumeNLPEngine
 from .resume_parser import ResumeParser
+from .parse_cache import ParseCache
+from .parse_sandbox import ParseSandbox, ParseError
 from .entity_recognizer import EntityRecognizer
 from .skill_extractor import SkillExtractor
 from .text_preprocessor import TextPreprocessor
 
-__all__ = ['ResumeNLPEngine', 'ResumeParser', 'EntityRecognizer', 'SkillExtractor', 'TextPreprocessor']
+__all__ = ['ResumeNLPEngine', 'ResumeParser', 'ParseCache', 'ParseSandbox', 'ParseError', 'EntityRecognizer', 'SkillExtractor', 'TextPreprocessor']
@@ -0,0 +1,138 @@
+"""
+DOCX Extractor - Stream paragraph and table text straight out of word/document.xml
+
+python-docx builds an object for every paragraph, run and table cell and
+resolves each one with XPath. Here the main document part is read from
+the zip with lxml's incremental parser instead. Each top-level block
+(paragraph or table) is converted to text as soon as it has been parsed,
+then freed.
+
+The output matches ResumeParser's python-docx path exactly:
+- body paragraphs come first, skipping empty ones, then the rows of each
+  top-level table;
+- run text maps w:tab/w:ptab to tab, w:br (text wrapping)/w:cr to
+  newline and w:noBreakHyphen to "-";
+- merged cells repeat once per grid column they span, and vertically
+  merged cells repeat the cell above, like python-docx's row.cells.
+"""
+import zipfile
+
+from lxml import etree
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_P, _R, _T, _HYPERLINK = _W + 'p', _W + 'r', _W + 't', _W + 'hyperlink'
+_TBL, _TBL_GRID, _GRID_COL, _TR, _TC = _W + 'tbl', _W + 'tblGrid', _W + 'gridCol', _W + 'tr', _W + 'tc'
+_TC_PR, _GRID_SPAN, _V_MERGE, _VAL = _W + 'tcPr', _W + 'gridSpan', _W + 'vMerge', _W + 'val'
+_BR, _BR_TYPE = _W + 'br', _W + 'type'
+
+# Run children with a fixed text equivalent
+_RUN_CHARS = {_W + 'tab': '\t', _W + 'ptab': '\t', _W + 'cr': '\n', _W + 'noBreakHyphen': '-'}
+
+_OFFICE_DOCUMENT_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+_RELS_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+def _run_text(run):
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _T:
+            parts.append(child.text or '')
+        elif tag == _BR:
+            if child.get(_BR_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag in _RUN_CHARS:
+            parts.append(_RUN_CHARS[tag])
+    return ''.join(parts)
+
+
+def _paragraph_text(paragraph):
+    parts = []
+    for child in paragraph:
+        if child.tag == _R:
+            parts.append(_run_text(child))
+        elif child.tag == _HYPERLINK:
+            parts.extend(_run_text(run) for run in child if run.tag == _R)
+    return ''.join(parts)
+
+
+def _table_rows(table):
+    """Cell texts per row, laid out on the table grid like python-docx's row.cells"""
+    grid = table.find(_TBL_GRID)
+    num_columns = len(grid.findall(_GRID_COL)) if grid is not None else 0
+    rows = table.findall(_TR)
+
+    cells = []
+    for row in rows:
+        for cell in row.iterchildren(_TC):
+            span, merge = 1, None
+            properties = cell.find(_TC_PR)
+            if properties is not None:
+                grid_span = properties.find(_GRID_SPAN)
+                if grid_span is not None:
+                    span = int(grid_span.get(_VAL))
+                v_merge = properties.find(_V_MERGE)
+                if v_merge is not None:
+                    merge = v_merge.get(_VAL, 'continue')
+
+            for column in range(span):
+                if merge == 'continue' and len(cells) >= num_columns > 0:
+                    cells.append(cells[-num_columns])
+                elif column > 0:
+                    cells.append(cells[-1])
+                else:
+                    cells.append('\n'.join(_paragraph_text(p) for p in cell.iterchildren(_P)))
+
+    return [cells[i * num_columns:(i + 1) * num_columns] for i in range(len(rows))]
+
+
+def _main_part_name(archive):
+    """Path of the main document part, from the package relationships"""
+    try:
+        rels = etree.fromstring(archive.read('_rels/.rels'))
+    except KeyError:
+        return 'word/document.xml'
+    for rel in rels.iter(_RELS_NS + 'Relationship'):
+        if rel.get('Type') == _OFFICE_DOCUMENT_REL:
+            return rel.get('Target').lstrip('/')
+    return 'word/document.xml'
+
+
+def iter_docx_blocks(file_path):
+    """Yield ('paragraph', text) and ('table', rows) for each top-level body block, in document order"""
+    with zipfile.ZipFile(file_path) as archive:
+        with archive.open(_main_part_name(archive)) as stream:
+            depth = 0
+            for event, element in etree.iterparse(stream, events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                # document (depth 0) > body (1) > block (2)
+                if depth != 2:
+                    continue
+                if element.tag == _P:
+                    yield 'paragraph', _paragraph_text(element)
+                elif element.tag == _TBL:
+                    yield 'table', _table_rows(element)
+                # Free the finished block and everything before it
+                element.clear()
+                parent = element.getparent()
+                while element.getprevious() is not None:
+                    del parent[0]
+
+
+def extract_docx_text(file_path):
+    """Paragraphs, then table rows, joined by newlines (same as the python-docx path)"""
+    paragraphs = []
+    table_rows = []
+    for kind, content in iter_docx_blocks(file_path):
+        if kind == 'paragraph':
+            if content.strip():
+                paragraphs.append(content)
+        else:
+            for row in content:
+                row_text = ' '.join(cell.strip() for cell in row if cell.strip())
+                if row_text:
+                    table_rows.append(row_text)
+    return '\n'.join(paragraphs + table_rows)
@@ -3,30 +3,92 @@ Entity Recognizer - Extract contact information and personal details
 """
 import re
 
+CONTACT_ENTITIES = ('email', 'linkedin', 'github', 'phone', 'location')
+
+# Contact patterns, combined into EntityRecognizer.contact_re
+EMAIL_PATTERN = r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b'
+PHONE_PATTERN = r'(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{2,4}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{4}'
+# Matched case-insensitively; the named group tells LinkedIn from GitHub
+PROFILE_URL_PATTERN = r'(?:https?://)?(?:www\.)?(?:(?P<linkedin>linkedin)\.com/in|(?P<github>github)\.com)/[\w-]+/?'
+# Relies on capitalisation: "City, ST" or "City, Country"
+LOCATION_PATTERN = r'(?:[A-Z][a-z]+(?:\s[A-Z][a-z]+)*),\s*(?:[A-Z]{2}|[A-Z][a-z]+)\b'
+
 class EntityRecognizer:
     def __init__(self):
-        # Enhanced regex patterns
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b'
-        self.phone_pattern = r'(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{2,4}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{4}'
-        self.linkedin_pattern = r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+/?'
-        self.github_pattern = r'(?:https?://)?(?:www\.)?github\.com/[\w-]+/?'
-    
+        self.non_phone_chars_re = re.compile(r'[^0-9+]')
+
+        # One scanner for all contact entities. Alternatives are tried in order at
+        # each position, so emails and URLs claim their characters before the
+        # phone pattern can match digits inside them. Each alternative is gated
+        # on its first character, which lets the engine skip ordinary prose
+        # without attempting every sub-pattern at every position.
+        self.contact_re = re.compile(
+            rf"\b(?:(?P<email>{EMAIL_PATTERN})|(?P<location>{LOCATION_PATTERN}))"
+            rf"|(?P<url>(?=[hwlgHWLG])(?i:{PROFILE_URL_PATTERN}))"
+            rf"|(?P<phone>(?=[+(\d]){PHONE_PATTERN})"
+        )
+
     def extract_entities(self, text):
         """Extract all entities from resume text"""
-        return {
-            'name': self._extract_name(text),
-            'email': self._extract_email(text),
-            'phone': self._extract_phone(text),
-            'linkedin': self._extract_linkedin(text),
-            'github': self._extract_github(text),
-            'location': self._extract_location(text)
-        }
-    
+        entities = {'name': self._extract_name(text)}
+        entities.update(self.scan_contacts(text))
+        return entities
+
+    def scan_contacts(self, text):
+        """Extract email, phone, LinkedIn, GitHub and location in a single pass"""
+        found = dict.fromkeys(CONTACT_ENTITIES)
+        remaining = len(CONTACT_ENTITIES)
+
+        for match in self.contact_re.finditer(text):
+            kind = match.lastgroup
+            if kind == 'url':
+                kind = 'linkedin' if match.group('linkedin') else 'github'
+            if found[kind] is not None:
+                continue
+
+            value = self._normalize(kind, match.group())
+            if value is not None:
+                found[kind] = value
+                remaining -= 1
+                # Stop scanning once every entity has been found
+                if not remaining:
+                    break
+
+        return found
+
+    def _normalize(self, kind, value):
+        """Clean a raw match; None if it is not a valid entity"""
+        if kind == 'email':
+            return value.lower() if '.' in value.split('@')[1] else None
+        if kind == 'phone':
+            phone = self.non_phone_chars_re.sub('', value)
+            return phone if len(phone) >= 10 else None
+        if kind in ('linkedin', 'github'):
+            if not value.startswith('http'):
+                value = 'https://' + value
+            return value.rstrip('/')
+        if kind == 'location':
+            city, region = value.split(',', 1)
+            return f"{city}, {region.strip()}"
+        return value
+
     def _extract_name(self, text):
         """Extract candidate name from first few lines"""
-        lines = [l.strip() for l in text.split('\n') if l.strip()]
-        
-        for line in lines[:5]:
+        checked = 0
+        start = 0
+
+        # Walk lines lazily; only the first five non-empty lines matter
+        while checked < 5 and start <= len(text):
+            end = text.find('\n', start)
+            if end == -1:
+                end = len(text)
+            line = text[start:end].strip()
+            start = end + 1
+
+            if not line:
+                continue
+            checked += 1
+
             # Name heuristics: 2-4 words, no digits, reasonable length
             words = line.split()
             if 2 <= len(words) <= 4 and len(line) <= 50:
@@ -35,48 +97,3 @@ class EntityRecognizer:
                     if not any(keyword in line.lower() for keyword in ['resume', 'cv', 'curriculum']):
                         return line.title()
         return None
-    
-    def _extract_email(self, text):
-        """Extract email address"""
-        matches = re.findall(self.email_pattern, text)
-        # Return first valid email
-        for email in matches:
-            if '@' in email and '.' in email.split('@')[1]:
-                return email.lower()
-        return None
-    
-    def _extract_phone(self, text):
-        """Extract phone number"""
-        matches = re.findall(self.phone_pattern, text)
-        if matches:
-            # Clean and format phone number
-            phone = re.sub(r'[^0-9+]', '', matches[0])
-            return phone if len(phone) >= 10 else None
-        return None
-    
-    def _extract_linkedin(self, text):
-        """Extract LinkedIn profile URL"""
-        matches = re.findall(self.linkedin_pattern, text, re.IGNORECASE)
-        if matches:
-            url = matches[0]
-            if not url.startswith('http'):
-                url = 'https://' + url
-            return url.rstrip('/')
-        return None
-    
-    def _extract_github(self, text):
-        """Extract GitHub profile URL"""
-        matches = re.findall(self.github_pattern, text, re.IGNORECASE)
-        if matches:
-            url = matches[0]
-            if not url.startswith('http'):
-                url = 'https://' + url
-            return url.rstrip('/')
-        return None
-    
-    def _extract_location(self, text):
-        """Extract location/address"""
-        # Simple location pattern (City, State/Country)
-        location_pattern = r'\b([A-Z][a-z]+(?:\s[A-Z][a-z]+)*),\s*([A-Z]{2}|[A-Z][a-z]+)\b'
-        matches = re.findall(location_pattern, text)
-        return f"{matches[0][0]}, {matches[0][1]}" if matches else None
@@ -8,8 +8,11 @@ from .skill_extractor import SkillExtractor
 from .text_preprocessor import TextPreprocessor
 
 class ResumeNLPEngine:
-    def __init__(self):
-        self.parser = ResumeParser()
+    def __init__(self, parse_cache=None, parse_sandbox=None, skill_sections=None):
+        self.parser = ResumeParser(cache=parse_cache, sandbox=parse_sandbox)
+        # Optional section names, e.g. ('skills', 'experience', 'projects'), to look for skills in;
+        # the whole resume is scanned when none of them are found
+        self.skill_sections = skill_sections
         self.entity_recognizer = EntityRecognizer()
         self.skill_extractor = SkillExtractor()
         self.preprocessor = TextPreprocessor()
@@ -18,15 +21,22 @@ class ResumeNLPEngine:
         """Complete resume processing pipeline"""
         # Parse resume
         text = self.parser.parse(file_path)
+        # Lowercased once for the whole-resume skill scan
+        text_lower = text.lower()
         
         # Extract entities
         entities = self.entity_recognizer.extract_entities(text)
         
-        # Extract skills
-        skills = self.skill_extractor.extract_skills(text)
+        # Split into sections once; spans are stored, bodies can scope extraction
+        segments = self.preprocessor.segment_sections(text)
+        sections = self.preprocessor.extract_sections(text, segments)
         
-        # Extract sections
-        sections = self.preprocessor.extract_sections(text)
+        # Extract skills
+        skill_text = self.preprocessor.section_text(segments, self.skill_sections) if self.skill_sections else None
+        if skill_text:
+            skills = self.skill_extractor.extract_skills(skill_text)
+        else:
+            skills = self.skill_extractor.extract_skills(text, text_lower)
         
         return {
             'file_path': str(file_path),
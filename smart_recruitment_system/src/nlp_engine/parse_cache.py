@@ -0,0 +1,108 @@
+"""
+Parse Cache - Content-addressed on-disk cache of parsed resume text
+
+Entries are keyed on the SHA-256 of the file bytes, combined with the
+parser settings that shape the text (the PDF page and character limits),
+and stored under a directory per parser version:
+
+    <cache_dir>/v<PARSER_VERSION>/<key[:2]>/<key>.json
+
+Renaming or re-uploading an unchanged file is a cache hit. Editing it, or
+changing the limits it was parsed under, is a miss. Bumping
+PARSER_VERSION makes every old entry unreachable (prune() deletes them). Writes are atomic renames, so any number of processes can
+share one cache directory.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from config.settings import PARSE_CACHE_DIR
+from .resume_parser import PARSER_VERSION
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class ParseCache:
+    def __init__(self, cache_dir=PARSE_CACHE_DIR, version=PARSER_VERSION):
+        self.cache_dir = Path(cache_dir)
+        self.version = version
+        self.version_dir = self.cache_dir / f"v{version}"
+        self.hits = 0
+        self.misses = 0
+        # (path, size, mtime) -> content hash, so unchanged files are not re-read
+        self._digests = {}
+
+    def content_hash(self, file_path):
+        """SHA-256 of the file bytes, memoized on path, size and mtime"""
+        file_path = Path(file_path)
+        stat = file_path.stat()
+        stat_key = (str(file_path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+        digest = self._digests.get(stat_key)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+                    sha.update(chunk)
+            digest = sha.hexdigest()
+            self._digests[stat_key] = digest
+        return digest
+
+    @staticmethod
+    def key(digest, settings=None):
+        """Cache key for a content hash parsed under the given settings (e.g. 'pages=50,chars=200000')"""
+        if not settings:
+            return digest
+        return hashlib.sha256(f"{digest}|{settings}".encode()).hexdigest()
+
+    def _entry_path(self, key):
+        return self.version_dir / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        """Cached text for a key, or None on a miss"""
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                text = json.load(f)['text']
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return text
+
+    def put(self, key, text, source=None, settings=None):
+        """Store parsed text; the atomic rename makes concurrent writers safe"""
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'parser_version': self.version, 'settings': settings, 'source': source, 'text': text}, f)
+        os.replace(tmp_path, path)
+
+    def get_or_parse(self, file_path, parse_fn, settings=None):
+        """Return cached text for the file, calling parse_fn(file_path) only on a miss
+
+        settings: parser settings the text depends on; entries parsed under
+        other settings are not reused.
+        """
+        key = self.key(self.content_hash(file_path), settings)
+        text = self.get(key)
+        if text is None:
+            text = parse_fn(file_path)
+            self.put(key, text, source=Path(file_path).name, settings=settings)
+        return text
+
+    def prune(self):
+        """Delete entries written by other parser versions"""
+        removed = 0
+        if self.cache_dir.exists():
+            for entry in self.cache_dir.iterdir():
+                if entry.is_dir() and entry != self.version_dir:
+                    shutil.rmtree(entry, ignore_errors=True)
+                    removed += 1
+        return removed
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'parser_version': self.version}
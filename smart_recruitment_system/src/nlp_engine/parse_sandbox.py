@@ -0,0 +1,158 @@
+"""
+Parse Sandbox - Parse untrusted resume files in a pool of worker subprocesses
+
+Each worker is a separate Python process that runs ResumeParser under an
+address-space limit (RLIMIT_AS, where the OS supports it). The parent
+waits at most `timeout` seconds for an answer; a worker that times out,
+runs out of memory or crashes is killed and replaced, and the file fails
+with a recorded reason instead of stalling the caller. Workers are kept
+alive between files, so the isolation costs one pipe round trip per parse.
+
+The worker side lives in parse_worker.py.
+"""
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from config.settings import (BASE_DIR, PARSE_WORKERS, PARSE_TIMEOUT, PARSE_MEMORY_LIMIT_MB,
+                             PDF_MAX_PAGES, PDF_MAX_CHARS)
+
+
+class ParseError(Exception):
+    """A file could not be parsed; `reason` says why (error, timeout, memory limit, crash)"""
+
+    def __init__(self, file_path, reason):
+        super().__init__(f"{Path(file_path).name}: {reason}")
+        self.file_path = str(file_path)
+        self.reason = reason
+
+
+class _Worker:
+    """One parser subprocess plus a thread that reads its replies"""
+
+    def __init__(self, memory_limit_mb, max_pages, max_chars):
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(p for p in [str(BASE_DIR), env.get('PYTHONPATH')] if p)
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'src.nlp_engine.parse_worker',
+             str(memory_limit_mb or 0), str(max_pages or 0), str(max_chars or 0)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, cwd=BASE_DIR, env=env,
+            text=True, encoding='utf-8'
+        )
+        self.replies = queue.Queue()
+        threading.Thread(target=self._read_replies, daemon=True).start()
+
+    def _read_replies(self):
+        for line in self.process.stdout:
+            self.replies.put(json.loads(line))
+        self.replies.put(None)  # worker exited
+
+    def alive(self):
+        return self.process.poll() is None
+
+    def kill(self):
+        if self.alive():
+            self.process.kill()
+        self.process.wait()
+
+
+class ParseSandbox:
+    def __init__(self, workers=PARSE_WORKERS, timeout=PARSE_TIMEOUT, memory_limit_mb=PARSE_MEMORY_LIMIT_MB,
+                 max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS):
+        self.num_workers = workers
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self._idle = queue.Queue()
+        self._started = False
+        self._start_lock = threading.Lock()
+        self.parsed = 0
+        self.restarts = 0
+        self.failures = deque(maxlen=100)  # most recent failures, newest last
+
+    def _spawn(self):
+        return _Worker(self.memory_limit_mb, self.max_pages, self.max_chars)
+
+    def _ensure_started(self):
+        with self._start_lock:
+            if not self._started:
+                for _ in range(self.num_workers):
+                    self._idle.put(self._spawn())
+                self._started = True
+
+    def parse(self, file_path):
+        """Text of the file, parsed in a worker; raises ParseError on failure"""
+        self._ensure_started()
+        file_path = Path(file_path).resolve()
+        worker = self._idle.get()
+        try:
+            if not worker.alive():
+                worker = self._respawn(worker)
+            return self._parse_in(worker, file_path)
+        finally:
+            if not worker.alive():
+                worker = self._respawn(worker)
+            self._idle.put(worker)
+
+    def _respawn(self, worker):
+        worker.kill()
+        self.restarts += 1
+        return self._spawn()
+
+    def _parse_in(self, worker, file_path):
+        try:
+            worker.process.stdin.write(json.dumps({'path': str(file_path)}) + '\n')
+            worker.process.stdin.flush()
+            reply = worker.replies.get(timeout=self.timeout)
+        except queue.Empty:
+            worker.kill()
+            self._fail(file_path, f"timed out after {self.timeout}s")
+        except OSError:
+            reply = None
+
+        if reply is None:
+            worker.kill()
+            self._fail(file_path, f"parser process exited (code {worker.process.returncode})")
+        if 'error' in reply:
+            if reply.get('fatal'):
+                worker.kill()  # the worker is exiting; replace it
+            self._fail(file_path, reply['error'])
+        self.parsed += 1
+        return reply['text']
+
+    def _fail(self, file_path, reason):
+        self.failures.append({'file': file_path.name, 'reason': reason, 'time': time.time()})
+        raise ParseError(file_path, reason)
+
+    def stats(self):
+        return {'workers': self.num_workers, 'parsed': self.parsed, 'failed': len(self.failures),
+                'restarts': self.restarts, 'recent_failures': list(self.failures)[-10:]}
+
+    def close(self):
+        """Stop every worker"""
+        with self._start_lock:
+            while not self._idle.empty():
+                worker = self._idle.get_nowait()
+                try:
+                    worker.process.stdin.close()
+                except OSError:
+                    pass
+                try:
+                    worker.process.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    worker.kill()
+            self._started = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
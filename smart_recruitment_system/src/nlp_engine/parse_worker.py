@@ -0,0 +1,52 @@
+"""
+Parse Worker - Subprocess entry point used by ParseSandbox
+
+Run as `python -m src.nlp_engine.parse_worker <memory MB> <max pages> <max chars>`
+(0 = no limit). Protocol: one JSON object per line. The parent sends
+{"path": ...}; the worker answers {"text": ...} or {"error": ...}.
+"""
+import json
+import os
+import sys
+
+from .resume_parser import ResumeParser
+
+
+def _limit_memory(memory_limit_mb):
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _serve(memory_limit_mb, max_pages, max_chars):
+    """Worker loop: parse one path per input line until stdin closes"""
+    parser = ResumeParser(max_pages=max_pages or None, max_chars=max_chars or None)
+    if memory_limit_mb:
+        _limit_memory(memory_limit_mb)
+
+    # Keep stray prints from parsing libraries out of the reply stream
+    replies = sys.stdout
+    sys.stdout = sys.stderr
+    for line in sys.stdin:
+        path = json.loads(line)['path']
+        try:
+            reply = {'text': parser.parse(path)}
+        except MemoryError:
+            replies.write(json.dumps({'error': f"memory limit of {memory_limit_mb} MB exceeded", 'fatal': True}) + '\n')
+            replies.flush()
+            return  # exit, so the parent replaces this worker
+        except Exception as e:
+            reply = {'error': f"{type(e).__name__}: {e}"}
+        replies.write(json.dumps(reply) + '\n')
+        replies.flush()
+
+
+if __name__ == '__main__':
+    try:
+        _serve(*(int(arg) for arg in sys.argv[1:4]))
+    except BrokenPipeError:
+        # The parent went away mid-parse; exit without flushing the dead pipe again
+        os._exit(1)
@@ -1,15 +1,72 @@
 """
 Resume Parser - Extract and clean text from PDF, DOCX, and TXT files
 """
-import re
 from pathlib import Path
 import PyPDF2
 import pdfplumber
 from docx import Document
+from config.settings import PDF_MAX_PAGES, PDF_MAX_CHARS
+from .docx_extractor import extract_docx_text
+from .text_preprocessor import clean_text
+
+# Bump when text extraction or cleaning changes so cached text is re-parsed
+PARSER_VERSION = 2
+
+def iter_pdf_pages(file_path, max_pages=None):
+    """Yield the text of each PDF page in order, one page at a time
+
+    pdfplumber is tried first; a page it fails on is re-read with PyPDF2
+    instead of restarting the whole document. If pdfplumber cannot open
+    the file at all, every page comes from PyPDF2.
+    """
+    with open(file_path, 'rb') as f:
+        fallback = None
+        
+        def fallback_page(number):
+            nonlocal fallback
+            try:
+                if fallback is None:
+                    fallback = PyPDF2.PdfReader(f)
+                return fallback.pages[number].extract_text() or ""
+            except Exception:
+                return ""
+        
+        try:
+            pdf = pdfplumber.open(file_path)
+        except Exception:
+            pdf = None
+        
+        if pdf is None:
+            try:
+                num_pages = len(PyPDF2.PdfReader(f).pages)
+            except Exception:
+                return
+            for number in range(num_pages if max_pages is None else min(num_pages, max_pages)):
+                yield fallback_page(number)
+            return
+        
+        with pdf:
+            for number, page in enumerate(pdf.pages):
+                if max_pages is not None and number >= max_pages:
+                    return
+                try:
+                    page_text = page.extract_text() or ""
+                except Exception:
+                    page_text = fallback_page(number)
+                # Drop the page's parsed layout objects before moving on
+                page.flush_cache()
+                yield page_text
 
 class ResumeParser:
-    def __init__(self):
+    def __init__(self, cache=None, max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS, sandbox=None):
         self.supported_formats = ['.pdf', '.docx', '.txt']
+        # Optional ParseCache; unchanged files are then parsed only once
+        self.cache = cache
+        # Optional ParseSandbox; files are then parsed in worker processes with a timeout and memory cap
+        self.sandbox = sandbox
+        # Budget for PDFs; None reads everything
+        self.max_pages = max_pages
+        self.max_chars = max_chars
     
     def parse(self, file_path):
         """Parse resume and extract clean text"""
@@ -24,35 +81,49 @@ class ResumeParser:
         
         # Route to appropriate parser
         parsers = {'.pdf': self._parse_pdf, '.docx': self._parse_docx, '.txt': self._parse_txt}
-        return parsers[ext](file_path)
+        parse_fn = self.sandbox.parse if self.sandbox is not None else parsers[ext]
+        if self.cache is not None:
+            return self.cache.get_or_parse(file_path, parse_fn, self._cache_settings(ext))
+        return parse_fn(file_path)
+    
+    def _cache_settings(self, ext):
+        """Limits the parsed text depends on (the sandbox's when parsing there); only PDFs are truncated"""
+        if ext != '.pdf':
+            return None
+        limits = self.sandbox if self.sandbox is not None else self
+        return f"pages={limits.max_pages},chars={limits.max_chars}"
     
     def _parse_pdf(self, file_path):
-        """Extract text from PDF using pdfplumber (primary) and PyPDF2 (fallback)"""
-        text = ""
+        """Extract text from PDF using pdfplumber (primary) and PyPDF2 (per-page fallback)
+
+        Stops after max_pages pages or once max_chars characters are read.
+        """
+        pages = []
+        num_chars = 0
         
-        # Try pdfplumber first (better text extraction)
-        try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        except Exception:
-            # Fallback to PyPDF2
-            try:
-                with open(file_path, 'rb') as f:
-                    reader = PyPDF2.PdfReader(f)
-                    for page in reader.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-            except Exception:
-                pass
+        for page_text in iter_pdf_pages(file_path, self.max_pages):
+            if not page_text:
+                continue
+            pages.append(page_text)
+            num_chars += len(page_text)
+            if self.max_chars is not None and num_chars >= self.max_chars:
+                break
         
+        text = '\n'.join(pages)
+        if self.max_chars is not None:
+            text = text[:self.max_chars]
         return self._clean_text(text)
     
     def _parse_docx(self, file_path):
         """Extract text from DOCX including paragraphs and tables"""
+        # Stream the document XML directly; python-docx handles anything the fast path can't read
+        try:
+            return self._clean_text(extract_docx_text(file_path))
+        except Exception:
+            return self._parse_docx_document(file_path)
+    
+    def _parse_docx_document(self, file_path):
+        """Extract DOCX text through python-docx's document model"""
         doc = Document(file_path)
         text_parts = []
         
@@ -85,17 +156,4 @@ class ResumeParser:
     
     def _clean_text(self, text):
         """Clean and normalize extracted text"""
-        if not text:
-            return ""
-        
-        # Normalize line breaks
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Remove excessive whitespace while preserving structure
-        text = re.sub(r' +', ' ', text)  # Multiple spaces to single
-        text = re.sub(r'\n{3,}', '\n\n', text)  # Max 2 consecutive newlines
-        
-        # Remove special characters but keep important punctuation
-        text = re.sub(r'[^\w\s@.,\-+()#:/\n]', '', text)
-        
-        return text.strip()
+        return clean_text(text)
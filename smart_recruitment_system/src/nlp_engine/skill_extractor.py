@@ -1,72 +1,30 @@
 """
 Skill Extractor - Extract technical and soft skills from resume text
 """
-import re
+from config.settings import SKILLS_TAXONOMY_PATH, SKILL_INDEX_CACHE_DIR
+from .skill_index import SkillIndex
 
 class SkillExtractor:
-    def __init__(self):
-        # Expanded technical skills database
-        self.tech_skills = {
-            'programming': [
-                'python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'go', 'rust', 
-                'swift', 'kotlin', 'typescript', 'scala', 'r', 'matlab', 'perl'
-            ],
-            'web': [
-                'html', 'css', 'react', 'angular', 'vue', 'nodejs', 'django', 'flask', 
-                'fastapi', 'express', 'nextjs', 'nuxt', 'svelte', 'bootstrap', 'tailwind'
-            ],
-            'database': [
-                'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite', 
-                'dynamodb', 'cassandra', 'elasticsearch', 'mariadb'
-            ],
-            'cloud': [
-                'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'jenkins', 
-                'ansible', 'cloudformation', 'lambda', 'ec2', 's3'
-            ],
-            'ml_ai': [
-                'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'keras', 
-                'scikit-learn', 'nlp', 'computer vision', 'opencv', 'pandas', 'numpy'
-            ],
-            'tools': [
-                'git', 'github', 'gitlab', 'jira', 'confluence', 'slack', 'vscode', 
-                'jupyter', 'postman', 'swagger', 'linux', 'bash'
-            ]
-        }
-        
-        self.soft_skills = [
-            'leadership', 'communication', 'teamwork', 'problem solving', 'analytical',
-            'critical thinking', 'time management', 'adaptability', 'creativity',
-            'collaboration', 'presentation', 'negotiation', 'project management'
-        ]
+    def __init__(self, taxonomy_path=SKILLS_TAXONOMY_PATH, cache_dir=SKILL_INDEX_CACHE_DIR):
+        # Skills taxonomy (categories, synonyms, phrases) compiled once and cached on disk
+        self.index = SkillIndex.load(taxonomy_path, cache_dir)
+        self.tech_skills = self.index.tech_skills
+        self.soft_skills = self.index.soft_skills
     
-    def extract_skills(self, text):
-        """Extract all skills from resume text"""
-        text_lower = text.lower()
+    def extract_skills(self, text, text_lower=None):
+        """Extract all skills from resume text (pass text_lower if already computed)"""
+        # Single pass over the text for all skills and their synonyms
+        by_category = self.index.match(text, text_lower)
         
         found_skills = {
             'technical': {},
-            'soft': []
+            'soft': sorted(by_category.get(None, []))
         }
         
-        # Extract technical skills by category
-        for category, skills in self.tech_skills.items():
-            found = []
-            for skill in skills:
-                # Use word boundary for accurate matching
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    found.append(skill.title())
-            
-            if found:
-                found_skills['technical'][category] = sorted(set(found))
-        
-        # Extract soft skills
-        for skill in self.soft_skills:
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills['soft'].append(skill.title())
-        
-        found_skills['soft'] = sorted(set(found_skills['soft']))
+        # Keep categories in taxonomy order
+        for category in self.tech_skills:
+            if category in by_category:
+                found_skills['technical'][category] = sorted(by_category[category])
         
         return found_skills
     
@@ -0,0 +1,149 @@
+"""
+Skill Index - Compile a skills taxonomy file into a cached lookup index
+
+Taxonomy format (JSON):
+    {
+      "version": 1,
+      "technical": {
+        "<category>": [
+          "python",
+          {"name": "kubernetes", "aliases": ["k8s"]},
+          {"name": "go", "aliases": ["golang"], "case_sensitive": ["Go"]}
+        ]
+      },
+      "soft": ["leadership", {"name": "teamwork", "aliases": ["team player"]}]
+    }
+
+Entries are a canonical name or an object with optional ``aliases``
+(matched case-insensitively) and ``case_sensitive`` surface forms. An entry
+with ``case_sensitive`` forms is only matched through those forms and its
+aliases, which keeps short names like 'R' and 'Go' from firing on ordinary
+words. Multi-word phrases also match with hyphens ('problem-solving').
+"""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from .skill_matcher import SkillMatcher
+
+# Bump when the compiled layout changes so stale caches are rebuilt
+INDEX_FORMAT_VERSION = 2
+
+# Compiled indexes already loaded in this process, keyed by cache key
+_loaded_indexes = {}
+
+
+def _phrase_variants(phrase):
+    """Surface variants of an n-gram phrase"""
+    variants = {phrase}
+    if ' ' in phrase:
+        variants.add(phrase.replace(' ', '-'))
+    return variants
+
+
+class SkillIndex:
+    def __init__(self, tech_skills, soft_skills, insensitive, sensitive, taxonomy_version=None):
+        # Canonical names, in taxonomy order
+        self.tech_skills = tech_skills
+        self.soft_skills = soft_skills
+        self.insensitive = insensitive
+        self.sensitive = sensitive
+        self.taxonomy_version = taxonomy_version
+
+    def __len__(self):
+        return len(self.insensitive) + len(self.sensitive)
+
+    @classmethod
+    def build(cls, taxonomy):
+        """Compile a taxonomy dict into case-insensitive and case-sensitive automata"""
+        insensitive = SkillMatcher()
+        sensitive = SkillMatcher()
+        tech_skills = {}
+        soft_skills = []
+
+        groups = [(category, entries) for category, entries in taxonomy.get('technical', {}).items()]
+        groups.append((None, taxonomy.get('soft', [])))
+
+        for category, entries in groups:
+            names = []
+            for entry in entries:
+                if isinstance(entry, str):
+                    entry = {'name': entry}
+
+                name = entry['name'].lower()
+                payload = (category, entry.get('display') or name.title())
+                names.append(name)
+
+                phrases = [alias.lower() for alias in entry.get('aliases', [])]
+                if not entry.get('case_sensitive'):
+                    phrases.append(name)
+
+                for phrase in phrases:
+                    for variant in _phrase_variants(phrase):
+                        insensitive.add(variant, payload)
+                for form in entry.get('case_sensitive', []):
+                    sensitive.add(form, payload)
+
+            if category is None:
+                soft_skills = names
+            else:
+                tech_skills[category] = names
+
+        return cls(tech_skills, soft_skills, insensitive.compile(), sensitive.compile(),
+                   taxonomy.get('version'))
+
+    @classmethod
+    def load(cls, taxonomy_path, cache_dir=None):
+        """Load the compiled index for a taxonomy file, building it only on a cache miss
+
+        The cache key is the taxonomy file's content hash, so editing the file
+        rebuilds the index once and every later process loads it from disk.
+        """
+        data = Path(taxonomy_path).read_bytes()
+        key = hashlib.sha256(data + f"|v{INDEX_FORMAT_VERSION}".encode()).hexdigest()[:16]
+
+        if key in _loaded_indexes:
+            return _loaded_indexes[key]
+
+        cache_path = Path(cache_dir) / f"skill_index-{key}.pkl" if cache_dir else None
+        index = None
+
+        if cache_path is not None and cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as f:
+                    index = pickle.load(f)
+            except Exception:
+                index = None
+
+        if index is None:
+            index = cls.build(json.loads(data))
+            if cache_path is not None:
+                index.save(cache_path)
+
+        _loaded_indexes[key] = index
+        return index
+
+    def save(self, path):
+        """Atomically write the compiled index so concurrent loaders never see a partial file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def match(self, text, text_lower=None):
+        """Map category (None for soft skills) -> set of display names found"""
+        if text_lower is None:
+            text_lower = text.lower()
+
+        found = {}
+        for category, name in self.insensitive.find_all(text_lower):
+            found.setdefault(category, set()).add(name)
+        if len(self.sensitive):
+            for category, name in self.sensitive.find_all(text):
+                found.setdefault(category, set()).add(name)
+        return found
@@ -0,0 +1,126 @@
+"""
+Skill Matcher - Aho-Corasick automaton for single-pass multi-pattern matching
+"""
+from collections import deque
+
+# Transitions live in one flat dict keyed by state * _BASE + ord(char); a
+# single int-keyed dict loads from disk far faster than a dict per state.
+_BASE = 0x110000
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == '_'
+
+
+class SkillMatcher:
+    """Find every occurrence of many phrases in one pass over the text.
+
+    Matching cost depends on the text length, not on the number of patterns,
+    so a 50k-entry taxonomy scans a resume as fast as a 100-entry one.
+    A match only counts when it is not glued to another word character on
+    either side (like a regex ``(?<!\\w)skill(?!\\w)``), which also lets
+    patterns such as 'c++' and 'c#' match before spaces and punctuation.
+    """
+
+    def __init__(self, patterns=None):
+        self._goto = {}
+        self._fail = [0]
+        self._own = {}       # state -> (length, payload index) of patterns ending exactly there
+        self._out = {}       # _own plus outputs inherited along failure links, set by compile()
+        self._payloads = []
+        self._num_states = 1
+        self._compiled = True
+
+        for pattern, payload in (patterns or []):
+            self.add(pattern, payload)
+        self.compile()
+
+    def __len__(self):
+        return len(self._payloads)
+
+    def add(self, pattern, payload=None):
+        """Add a pattern; call compile() before searching"""
+        if not pattern:
+            return
+
+        goto = self._goto
+        state = 0
+        for ch in pattern:
+            key = state * _BASE + ord(ch)
+            next_state = goto.get(key)
+            if next_state is None:
+                next_state = self._num_states
+                self._num_states += 1
+                goto[key] = next_state
+            state = next_state
+
+        self._own.setdefault(state, []).append((len(pattern), len(self._payloads)))
+        self._payloads.append(payload if payload is not None else pattern)
+        self._compiled = False
+
+    def compile(self):
+        """Build failure links breadth-first and merge inherited outputs
+
+        Outputs are rebuilt from each state's own patterns, so compiling
+        again after add() never reports a match twice.
+        """
+        goto = self._goto
+        out = {state: list(matches) for state, matches in self._own.items()}
+
+        children = [[] for _ in range(self._num_states)]
+        for key, next_state in goto.items():
+            children[key // _BASE].append((key % _BASE, next_state))
+
+        fail = [0] * self._num_states
+        queue = deque(next_state for _, next_state in children[0])
+
+        while queue:
+            state = queue.popleft()
+            for code, next_state in children[state]:
+                queue.append(next_state)
+                f = fail[state]
+                target = goto.get(f * _BASE + code)
+                while target is None and f:
+                    f = fail[f]
+                    target = goto.get(f * _BASE + code)
+                fail[next_state] = target if target is not None and target != next_state else 0
+                inherited = out.get(fail[next_state])
+                if inherited:
+                    out[next_state] = out.get(next_state, []) + inherited
+
+        self._fail = fail
+        self._out = out
+        self._compiled = True
+        return self
+
+    def finditer(self, text):
+        """Yield (start, end, payload) for every word-bounded match"""
+        if not self._compiled:
+            self.compile()
+
+        goto, fail, out, payloads = self._goto, self._fail, self._out, self._payloads
+        n = len(text)
+        state = 0
+
+        for i, ch in enumerate(text):
+            code = ord(ch)
+            next_state = goto.get(state * _BASE + code)
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto.get(state * _BASE + code)
+            state = next_state or 0
+
+            matches = out.get(state)
+            if matches:
+                end = i + 1
+                if end < n and _is_word_char(text[end]):
+                    continue
+                for length, index in matches:
+                    start = end - length
+                    if start > 0 and _is_word_char(text[start - 1]):
+                        continue
+                    yield start, end, payloads[index]
+
+    def find_all(self, text):
+        """Set of payloads of all patterns present in the text"""
+        return {payload for _, _, payload in self.finditer(text)}
@@ -4,6 +4,57 @@ Text Preprocessor - Clean and normalize resume text
 
 import re
 
+MULTI_SPACE_RE = re.compile(r' {2,}')
+BLANK_LINES_RE = re.compile(r'\n{3,}')
+# Anything but word characters, whitespace and punctuation common in resumes
+UNSUPPORTED_CHARS_RE = re.compile(r'[^\w\s@.,\-+()#:/]')
+URL_RE = re.compile(r'http\S+|www\.\S+')
+
+# Section header vocabulary: word stem -> section
+SECTION_STEMS = {
+    'educat': 'education', 'academic': 'education', 'qualification': 'education',
+    'experience': 'experience', 'employment': 'experience', 'internship': 'experience',
+    'skill': 'skills', 'competenc': 'skills', 'proficienc': 'skills', 'expertise': 'skills',
+    'project': 'projects', 'portfolio': 'projects',
+    'certific': 'certifications', 'licen': 'certifications',
+    'summary': 'summary', 'objective': 'summary', 'profile': 'summary',
+    'achievement': 'achievements', 'award': 'achievements', 'honor': 'achievements', 'hackathon': 'achievements',
+    'information': 'other', 'interest': 'other', 'hobb': 'other', 'language': 'other',
+    'reference': 'other', 'publication': 'other', 'activit': 'other', 'volunteer': 'other'
+}
+HEADER_PHRASES = {'work history': 'experience', 'career history': 'experience'}
+# Words allowed next to a keyword in a header ("Technical Skills", "Work Experience")
+HEADER_MODIFIERS = {'technical', 'professional', 'work', 'relevant', 'key', 'core', 'personal', 'selected',
+                    'other', 'additional', 'computer', 'soft', 'it', 'software', 'and', 'of', 'my', 'career',
+                    'industry', 'research', 'major', 'notable', 'side', 'areas', 'abilities', 'tools', 'history'}
+MAX_HEADER_WORDS = 5
+MAX_HEADER_CHARS = 40
+HEADER_WORD_RE = re.compile(r'[a-z]+')
+CAPS_PREFIX_RE = re.compile(r'[A-Z][A-Z&/ ]{2,}')
+
+SECTION_STEM_RE = re.compile('|'.join(SECTION_STEMS))
+
+def _section_for_word(word):
+    match = SECTION_STEM_RE.match(word)
+    return SECTION_STEMS[match.group()] if match else None
+
+def clean_text(text):
+    """Normalize line breaks, collapse spaces, cap blank lines and drop unsupported characters
+
+    Passes that have nothing to change are skipped after a cheap substring
+    check, so typical text is scanned by one regex plus the final strip.
+    """
+    if not text:
+        return ""
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    if '  ' in text:
+        text = MULTI_SPACE_RE.sub(' ', text)
+    if '\n\n\n' in text:
+        text = BLANK_LINES_RE.sub('\n\n', text)
+    text = UNSUPPORTED_CHARS_RE.sub('', text)
+    return text.strip()
+
 class TextPreprocessor:
     def __init__(self):
         self.stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
@@ -21,28 +72,89 @@ class TextPreprocessor:
     
     def remove_urls(self, text):
         """Remove URLs"""
-        return re.sub(r'http\S+|www\.\S+', '', text)
+        return URL_RE.sub('', text)
     
     def remove_extra_spaces(self, text):
         """Remove extra whitespace"""
-        return re.sub(r'\s+', ' ', text).strip()
+        return ' '.join(text.split())
     
-    def extract_sections(self, text):
-        """Extract resume sections"""
+    def extract_sections(self, text, segments=None):
+        """Map each resume section to its [start, end) character span (first occurrence)"""
         sections = {}
+        for section in segments if segments is not None else self.segment_sections(text):
+            sections.setdefault(section['name'], [section['start'], section['end']])
+        return sections
+    
+    def segment_sections(self, text):
+        """Split text into sections at header lines, in one pass over the lines
+
+        Returns a list of {'name', 'header', 'start', 'end', 'body_start', 'text'}
+        where [start, end) covers the header and body and 'text' is the body.
+        """
+        sections = []
+        offset = 0
+        for line in text.split('\n'):
+            header = self._match_header(line)
+            if header is not None:
+                name, head_length = header
+                if sections:
+                    sections[-1]['end'] = offset
+                head_start = offset + len(line) - len(line.lstrip())
+                sections.append({'name': name, 'header': line.strip()[:head_length].rstrip(' :'),
+                                 'start': offset, 'end': len(text), 'body_start': head_start + head_length})
+            offset += len(line) + 1
+        
+        for section in sections:
+            section['text'] = text[section['body_start']:section['end']].strip()
+        return sections
+    
+    def section_text(self, segments, names):
+        """Body text of every segment with one of the given names, joined; None if there are none"""
+        bodies = [section['text'] for section in segments if section['name'] in names]
+        return '\n'.join(bodies) if bodies else None
+    
+    def _match_header(self, line):
+        """(section name, header length) if the line starts a section, else None
+
+        A header is a short line (or the part before a colon, or a leading
+        ALL-CAPS run glued to the next word by PDF extraction) made only of
+        section keywords and modifier words such as 'technical' or 'work'.
+        """
+        stripped = line.strip()
+        if not stripped or not stripped[0].isalpha():
+            return None
         
-        # Common section headers
-        patterns = {
-            'education': r'education|academic|qualification',
-            'experience': r'experience|employment|work history',
-            'skills': r'skills|technical skills|competencies',
-            'projects': r'projects|portfolio',
-            'certifications': r'certifications|certificates|licenses'
-        }
+        heads = []
+        if ':' in stripped:
+            heads.append((stripped.split(':', 1)[0], 1))
+        elif len(stripped) <= MAX_HEADER_CHARS:
+            heads.append((stripped, 0))
+        caps = CAPS_PREFIX_RE.match(stripped)
+        if caps is not None and caps.end() < len(stripped):
+            head = caps.group()
+            if stripped[caps.end()].islower():
+                head = head[:-1]  # "EXPERIENCESoftware": the last capital starts the next word
+            heads.append((head.rstrip(), 0))
         
-        for section, pattern in patterns.items():
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                sections[section] = match.start()
+        for head, separator in heads:
+            name = self._header_name(head)
+            if name is not None:
+                return name, len(head) + separator
+        return None
+    
+    def _header_name(self, head):
+        words = HEADER_WORD_RE.findall(head.lower())
+        if not words or len(words) > MAX_HEADER_WORDS:
+            return None
+        phrase = ' '.join(words)
+        if phrase in HEADER_PHRASES:
+            return HEADER_PHRASES[phrase]
         
-        return sections
+        name = None
+        for word in words:
+            section = _section_for_word(word)
+            if section is not None:
+                name = section  # the last keyword names the section ("Academic Projects")
+            elif word not in HEADER_MODIFIERS:
+                return None
+        return name
@@ -1,5 +1,8 @@
 from .ranking_engine import RankingEngine
 from .candidate_scorer import CandidateScorer
 from .job_matcher import JobMatcher
+from .skill_bitmap_index import SkillBitmapIndex
+from .tfidf_index import TfidfIndex
+from .semantic_index import HashedEmbedder, IVFIndex
 
-__all__ = ['RankingEngine', 'CandidateScorer', 'JobMatcher']
+__all__ = ['RankingEngine', 'CandidateScorer', 'JobMatcher', 'SkillBitmapIndex', 'TfidfIndex', 'HashedEmbedder', 'IVFIndex']
@@ -1,6 +1,75 @@
 """
 Candidate Scorer - Score candidates based on resume and requirements
 """
+import numpy as np
+
+EXPERIENCE_KEYWORDS = ['years', 'experience', 'worked', 'developed', 'led', 'managed']
+EDUCATION_KEYWORDS = ['bachelor', 'master', 'phd', 'degree', 'university', 'college']
+CONTACT_FIELDS = ['email', 'phone', 'linkedin', 'github']
+
+SCORE_COMPONENTS = ['skills_match', 'experience', 'education', 'profile_completeness']
+
+
+def normalize_skill(skill):
+    """Form in which skills are compared: required skills match technical skills case-insensitively"""
+    return skill.strip().lower()
+
+
+def required_skill_set(job_requirements):
+    """Distinct normalized required skills; its size is the skills_match denominator on every path"""
+    return {normalize_skill(s) for s in job_requirements.get('required_skills', [])}
+
+
+class CandidateFeatures:
+    """Per-candidate features extracted once, so any job or weighting can be scored without rescanning text
+
+    experience_flags / education_flags / contact_flags are (n, keywords)
+    boolean matrices. Technical skills are kept in CSR form: candidate i
+    has skill columns skill_indices[skill_indptr[i]:skill_indptr[i + 1]].
+    """
+
+    def __init__(self, candidates):
+        n = len(candidates)
+        self.ids = [c.get('id', c.get('file_path')) for c in candidates]
+        self.experience_flags = np.zeros((n, len(EXPERIENCE_KEYWORDS)), dtype=bool)
+        self.education_flags = np.zeros((n, len(EDUCATION_KEYWORDS)), dtype=bool)
+        self.contact_flags = np.zeros((n, len(CONTACT_FIELDS)), dtype=bool)
+        self.skill_vocab = {}
+
+        indptr = [0]
+        indices = []
+        for i, candidate in enumerate(candidates):
+            # Lowercase once; keyword flags keep the substring semantics of `kw in text`
+            text = candidate.get('raw_text', '').lower()
+            self.experience_flags[i] = [kw in text for kw in EXPERIENCE_KEYWORDS]
+            self.education_flags[i] = [kw in text for kw in EDUCATION_KEYWORDS]
+
+            entities = candidate.get('entities', {})
+            self.contact_flags[i] = [bool(entities.get(field)) for field in CONTACT_FIELDS]
+
+            skills = set()
+            for cat, skill_list in candidate.get('skills', {}).get('technical', {}).items():
+                skills.update(normalize_skill(s) for s in skill_list)
+            indices.extend(self.skill_vocab.setdefault(skill, len(self.skill_vocab)) for skill in skills)
+            indptr.append(len(indices))
+
+        self.skill_indptr = np.asarray(indptr, dtype=np.int64)
+        self.skill_indices = np.asarray(indices, dtype=np.int64)
+        # Row of each stored skill, for per-candidate bincounts
+        self.skill_rows = np.repeat(np.arange(n), np.diff(self.skill_indptr))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def matched_skills(self, required_skills):
+        """Number of the required skills each candidate has"""
+        required = {normalize_skill(s) for s in required_skills}
+        columns = [self.skill_vocab[s] for s in required if s in self.skill_vocab]
+        if not columns:
+            return np.zeros(len(self), dtype=np.int64)
+        hits = np.isin(self.skill_indices, columns)
+        return np.bincount(self.skill_rows[hits], minlength=len(self))
+
 
 class CandidateScorer:
     def __init__(self):
@@ -10,72 +79,125 @@ class CandidateScorer:
             'education': 0.2,
             'profile_completeness': 0.1
         }
-    
-    def score_candidate(self, candidate_data, job_requirements):
-        """Calculate overall candidate score"""
+
+    def score_candidate(self, candidate_data, job_requirements, matched_skills=None):
+        """Calculate overall candidate score
+
+        matched_skills: number of required skills the candidate has, when
+        already known (e.g. from SkillBitmapIndex.match_counts)
+        """
+        # Lowercase once for both keyword scores
+        text = candidate_data.get('raw_text', '').lower()
         scores = {
-            'skills_match': self._score_skills(candidate_data, job_requirements),
-            'experience': self._score_experience(candidate_data),
-            'education': self._score_education(candidate_data),
+            'skills_match': self._score_skills(candidate_data, job_requirements, matched_skills),
+            'experience': self._score_experience(text),
+            'education': self._score_education(text),
             'profile_completeness': self._score_completeness(candidate_data)
         }
-        
+
         # Weighted total
         total_score = sum(scores[k] * self.weights[k] for k in scores)
-        
+
         return {
             'total_score': round(total_score, 2),
             'breakdown': scores,
             'grade': self._get_grade(total_score)
         }
-    
-    def _score_skills(self, candidate_data, job_requirements):
+
+    def extract_features(self, candidates):
+        """Scan every candidate once; reuse the result across jobs and weightings"""
+        return CandidateFeatures(candidates)
+
+    def score_batch(self, candidates, job_requirements, skill_counts=None, weights=None):
+        """Score all candidates at once with matrix operations
+
+        candidates: list of candidate dicts or a CandidateFeatures from
+        extract_features(). skill_counts: optional array of matched required
+        skills per candidate, counting each distinct normalized required
+        skill once (as SkillBitmapIndex.match_counts does).
+        Returns {'total_score', 'breakdown': {component: array}, 'grade'},
+        matching score_candidate() element for element.
+        """
+        features = candidates if isinstance(candidates, CandidateFeatures) else self.extract_features(candidates)
+        weights = weights or self.weights
+        n = len(features)
+
+        required = required_skill_set(job_requirements)
+        if skill_counts is not None:
+            matched = np.asarray(skill_counts, dtype=np.float64)
+        else:
+            matched = features.matched_skills(required).astype(np.float64)
+
+        if required:
+            skills = np.minimum(matched / len(required) * 100, 100.0)
+        else:
+            skills = np.full(n, 50.0)
+
+        breakdown = {
+            'skills_match': skills,
+            'experience': np.minimum(features.experience_flags.sum(axis=1) * 10.0, 100.0),
+            'education': np.minimum(features.education_flags.sum(axis=1) * 15.0, 100.0),
+            'profile_completeness': features.contact_flags.sum(axis=1) * 25
+        }
+
+        # Same summation order as score_candidate, so totals agree exactly
+        total = np.zeros(n)
+        for k in SCORE_COMPONENTS:
+            total = total + breakdown[k] * weights[k]
+
+        grades = np.select([total >= 80, total >= 60, total >= 40], ['A', 'B', 'C'], default='D')
+
+        return {
+            'total_score': np.round(total, 2),
+            'breakdown': breakdown,
+            'grade': grades
+        }
+
+    def _score_skills(self, candidate_data, job_requirements, matched_skills=None):
         """Score based on skill match"""
+        if matched_skills is not None:
+            required = required_skill_set(job_requirements)
+            if not required:
+                return 50.0
+            return min(matched_skills / len(required) * 100, 100.0)
+
         candidate_skills = set()
         for cat, skills in candidate_data.get('skills', {}).get('technical', {}).items():
-            candidate_skills.update(skills)
-        
-        required_skills = set(job_requirements.get('required_skills', []))
-        
+            candidate_skills.update(normalize_skill(s) for s in skills)
+
+        required_skills = required_skill_set(job_requirements)
+
         if not required_skills:
             return 50.0
-        
+
         matched = candidate_skills.intersection(required_skills)
         score = (len(matched) / len(required_skills)) * 100
-        
+
         return min(score, 100.0)
-    
-    def _score_experience(self, candidate_data):
-        """Score based on experience indicators"""
-        text = candidate_data.get('raw_text', '').lower()
-        
+
+    def _score_experience(self, text):
+        """Score based on experience indicators in the lowercased resume text"""
         # Simple heuristic: look for experience keywords
-        exp_keywords = ['years', 'experience', 'worked', 'developed', 'led', 'managed']
-        score = sum(10 for kw in exp_keywords if kw in text)
-        
+        score = sum(10 for kw in EXPERIENCE_KEYWORDS if kw in text)
+
         return min(score, 100.0)
-    
-    def _score_education(self, candidate_data):
-        """Score based on education"""
-        text = candidate_data.get('raw_text', '').lower()
-        
-        edu_keywords = ['bachelor', 'master', 'phd', 'degree', 'university', 'college']
-        score = sum(15 for kw in edu_keywords if kw in text)
-        
+
+    def _score_education(self, text):
+        """Score based on education keywords in the lowercased resume text"""
+        score = sum(15 for kw in EDUCATION_KEYWORDS if kw in text)
+
         return min(score, 100.0)
-    
+
     def _score_completeness(self, candidate_data):
         """Score profile completeness"""
         entities = candidate_data.get('entities', {})
-        
+
         score = 0
-        if entities.get('email'): score += 25
-        if entities.get('phone'): score += 25
-        if entities.get('linkedin'): score += 25
-        if entities.get('github'): score += 25
-        
+        for field in CONTACT_FIELDS:
+            if entities.get(field): score += 25
+
         return score
-    
+
     def _get_grade(self, score):
         """Convert score to grade"""
         if score >= 80: return 'A'
@@ -2,45 +2,73 @@
 Job Matcher - Match candidates to job requirements
 """
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
+from .tfidf_index import TfidfIndex
+from .semantic_index import HashedEmbedder, IVFIndex
 
 class JobMatcher:
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer(max_features=100)
+    def __init__(self, index=None, semantic_index=None, embedder=None):
+        # Candidates are tokenized once into the index; queries only tokenize the job
+        self.index = index if index is not None else TfidfIndex()
+        # Dense hashed n-gram embeddings in an ANN index for semantic matching
+        self.embedder = embedder or HashedEmbedder()
+        self.semantic_index = semantic_index if semantic_index is not None else IVFIndex(self.embedder.dim)
+    
+    def add_candidate(self, candidate):
+        """Index (or re-index) one candidate's text in both indexes"""
+        doc_id = self.doc_id(candidate)
+        revision = candidate.get('revision')
+        text = self._prepare_candidate_text(candidate)
+        self.index.add(doc_id, text, revision)
+        self.semantic_index.add([doc_id], self.embedder.embed(text)[None, :], [revision])
+    
+    def remove_candidate(self, doc_id):
+        removed = self.index.remove(doc_id)
+        return self.semantic_index.remove(doc_id) or removed
+    
+    def index_candidates(self, candidates):
+        """Add candidates that are not indexed yet"""
+        for candidate in candidates:
+            doc_id = self.doc_id(candidate)
+            if doc_id not in self.index or doc_id not in self.semantic_index:
+                self.add_candidate(candidate)
+    
+    def match_semantic(self, job_description, k=10):
+        """Top-k (doc id, similarity score) by embedding cosine, via the ANN index"""
+        ids, scores = self.semantic_index.search(self.embedder.embed(job_description), k)
+        return [(doc_id, round(float(score) * 100, 2)) for doc_id, score in zip(ids, scores)]
     
     def match_candidates(self, candidates, job_description):
         """Match candidates to job description"""
         if not candidates:
             return []
         
-        # Prepare texts
-        job_text = job_description.lower()
-        candidate_texts = [self._prepare_candidate_text(c) for c in candidates]
+        # Index only candidates seen for the first time
+        doc_ids = [self.doc_id(c) for c in candidates]
+        self.index_candidates(candidates)
         
-        # Calculate similarity
-        all_texts = [job_text] + candidate_texts
+        if not self.index.vocab:
+            # Fallback: simple keyword matching
+            return self._simple_match(candidates, job_description.lower())
         
-        try:
-            tfidf_matrix = self.vectorizer.fit_transform(all_texts)
-            similarities = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:]).flatten()
-            
-            # Add similarity scores to candidates
-            results = []
-            for i, candidate in enumerate(candidates):
-                results.append({
-                    'candidate': candidate,
-                    'similarity_score': round(float(similarities[i]) * 100, 2)
-                })
-            
-            # Sort by similarity
-            results.sort(key=lambda x: x['similarity_score'], reverse=True)
-            return results
+        # One sparse mat-vec against every indexed candidate
+        ids, similarities = self.index.scores(job_description)
+        similarity_by_id = dict(zip(ids, similarities.tolist()))
         
-        except:
-            # Fallback: simple keyword matching
-            return self._simple_match(candidates, job_text)
+        # Add similarity scores to candidates
+        results = []
+        for doc_id, candidate in zip(doc_ids, candidates):
+            results.append({
+                'candidate': candidate,
+                'similarity_score': round(similarity_by_id.get(doc_id, 0.0) * 100, 2)
+            })
+        
+        # Sort by similarity
+        results.sort(key=lambda x: x['similarity_score'], reverse=True)
+        return results
+    
+    def doc_id(self, candidate):
+        """Store id when available, file path otherwise"""
+        return candidate.get('id', candidate.get('file_path'))
     
     def _prepare_candidate_text(self, candidate):
         """Prepare candidate text for matching"""
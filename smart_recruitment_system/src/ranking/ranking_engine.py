@@ -2,30 +2,94 @@
 Ranking Engine - Main interface for candidate ranking
 """
 
+import numpy as np
+
 from .candidate_scorer import CandidateScorer
 from .job_matcher import JobMatcher
 
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Neighbours retrieved for semantic matching. Every page is cut from this
+# same window, so consecutive offsets neither repeat nor skip candidates.
+SEMANTIC_WINDOW = 500
+
+def _whole_number(name, value, minimum):
+    try:
+        n = int(value)
+    except (TypeError, ValueError):
+        n = minimum - 1
+    if isinstance(value, bool) or n < minimum or str(n) != str(value).strip():
+        raise ValueError(f"{name} must be a whole number of at least {minimum}, not {value!r}")
+    return n
+
+def parse_page(data):
+    """(limit, offset) from a request body; limit is capped at MAX_PAGE_SIZE, ValueError on bad input"""
+    limit = _whole_number('limit', data.get('limit', DEFAULT_PAGE_SIZE), 1)
+    offset = _whole_number('offset', data.get('offset', 0), 0)
+    return min(limit, MAX_PAGE_SIZE), offset
+
+def top_k_indices(values, k, offset=0):
+    """Indices of ranks offset..offset+k by descending value, without a full sort
+
+    Ties keep their original order, exactly like a stable descending sort.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    end = min(offset + k, n)
+    if end <= offset:
+        return np.zeros(0, dtype=np.int64)
+    
+    if end < n:
+        # argpartition finds the end-th best value in O(n); keep everything
+        # above it plus the earliest ties needed to fill the window
+        threshold = values[np.argpartition(-values, end - 1)[end - 1]]
+        above = np.flatnonzero(values > threshold)
+        ties = np.flatnonzero(values == threshold)[:end - len(above)]
+        candidates = np.concatenate([above, ties])
+    else:
+        candidates = np.arange(n)
+    
+    order = np.lexsort((candidates, -values[candidates]))
+    return candidates[order][offset:end]
+
 class RankingEngine:
-    def __init__(self):
+    def __init__(self, matcher=None):
         self.scorer = CandidateScorer()
-        self.matcher = JobMatcher()
+        self.matcher = matcher or JobMatcher()
     
-    def rank_candidates(self, candidates, job_requirements):
-        """Rank candidates based on job requirements"""
-        ranked = []
+    def rank_candidates(self, candidates, job_requirements, skill_counts=None, features=None):
+        """Rank candidates based on job requirements
+
+        skill_counts: optional {candidate id: matched required skills}, so the
+        scorer can skip building a skill set per candidate
+        features: optional CandidateFeatures for these candidates, reused
+        across calls so re-ranking never rescans resume text
+        """
+        if not candidates:
+            return []
         
-        for candidate in candidates:
-            # Score candidate
-            score_result = self.scorer.score_candidate(candidate, job_requirements)
-            
+        # Score every candidate in one batch
+        features = features or self.scorer.extract_features(candidates)
+        counts = None
+        if skill_counts is not None:
+            counts = [skill_counts.get(c.get('id'), 0) for c in candidates]
+        scores = self.scorer.score_batch(features, job_requirements, counts)
+        
+        totals = scores['total_score'].tolist()
+        grades = scores['grade'].tolist()
+        breakdowns = self._breakdown_rows(scores['breakdown'])
+        
+        ranked = []
+        for i, candidate in enumerate(candidates):
             # Combine with candidate data
             ranked.append({
                 'candidate_id': candidate.get('file_path', 'unknown'),
                 'name': candidate.get('entities', {}).get('name'),
                 'email': candidate.get('entities', {}).get('email'),
-                'total_score': score_result['total_score'],
-                'grade': score_result['grade'],
-                'breakdown': score_result['breakdown'],
+                'total_score': totals[i],
+                'grade': grades[i],
+                'breakdown': breakdowns[i],
                 'skills': self._get_skills_summary(candidate),
                 'candidate_data': candidate
             })
@@ -35,33 +99,179 @@ class RankingEngine:
         
         return ranked
     
-    def match_to_job(self, candidates, job_description, job_requirements):
-        """Match and rank candidates for a specific job"""
+    def rank_page(self, features, job_requirements, k=DEFAULT_PAGE_SIZE, offset=0, skill_counts=None, include=None):
+        """Score all candidates, but order and return only one page
+
+        features: CandidateFeatures (see CandidateScorer.extract_features)
+        include: optional boolean mask of candidates eligible for ranking
+        Returns (page, total) where page rows hold 'index' into features,
+        'id', 'rank', 'total_score', 'grade' and 'breakdown'.
+        """
+        scores = self.scorer.score_batch(features, job_requirements, skill_counts)
+        totals = scores['total_score']
+        
+        if include is not None:
+            totals = np.where(include, totals, -np.inf)
+            total = int(np.count_nonzero(include))
+        else:
+            total = len(totals)
+        
+        page = []
+        for rank, i in enumerate(top_k_indices(totals, min(k, max(total - offset, 0)), offset), offset + 1):
+            page.append({
+                'index': int(i),
+                'id': features.ids[i],
+                'rank': rank,
+                'total_score': float(scores['total_score'][i]),
+                'grade': str(scores['grade'][i]),
+                'breakdown': {name: values[i].item() for name, values in scores['breakdown'].items()}
+            })
+        return page, total
+    
+    def rank_top_k(self, candidates, job_requirements, k=DEFAULT_PAGE_SIZE, offset=0, skill_counts=None, features=None):
+        """Top-k page of ranked candidates with compact payloads (no raw text)
+
+        Returns {'candidates', 'total', 'offset', 'limit'}.
+        """
+        features = features or self.scorer.extract_features(candidates)
+        counts = None
+        if skill_counts is not None:
+            counts = [skill_counts.get(c.get('id'), 0) for c in candidates]
+        
+        page, total = self.rank_page(features, job_requirements, k, offset, counts)
+        return {
+            'candidates': [self.page_payload(candidates[row['index']], row) for row in page],
+            'total': total,
+            'offset': offset,
+            'limit': k
+        }
+    
+    def page_payload(self, candidate, row):
+        """Result row sent to clients: scores plus contact summary, never the raw text"""
+        return {
+            'candidate_id': candidate.get('file_path', 'unknown'),
+            'rank': row['rank'],
+            'name': candidate.get('entities', {}).get('name'),
+            'email': candidate.get('entities', {}).get('email'),
+            'total_score': row['total_score'],
+            'grade': row['grade'],
+            'breakdown': row['breakdown'],
+            'skills': self._get_skills_summary(candidate)
+        }
+    
+    def match_page(self, features, job_requirements, similarity, k=DEFAULT_PAGE_SIZE, offset=0, include=None):
+        """One page by combined score (50% similarity + 50% requirements) from extracted features
+
+        features: a CandidateFeatures or a list of them (e.g. one per source),
+        read as one concatenated pool. similarity: percent similarity to the
+        job per candidate, in the same order. include: optional boolean mask
+        of candidates eligible for ranking (e.g. the semantic window).
+        Returns (page, total) where page rows hold 'id', 'rank',
+        'combined_score', 'similarity_score', 'requirements_score' and 'grade'.
+        """
+        if not isinstance(features, (list, tuple)):
+            features = [features]
+        scored = [self.scorer.score_batch(f, job_requirements) for f in features]
+        ids = [doc_id for f in features for doc_id in f.ids]
+        totals = np.concatenate([s['total_score'] for s in scored]) if scored else np.zeros(0)
+        grades = np.concatenate([s['grade'] for s in scored]) if scored else np.zeros(0, dtype=str)
+        similarity = np.asarray(similarity, dtype=np.float64)
+        
+        combined = similarity * 0.5 + totals * 0.5
+        if include is not None:
+            combined = np.where(include, combined, -np.inf)
+            total = int(np.count_nonzero(include))
+        else:
+            total = len(combined)
+        
+        page = []
+        for rank, i in enumerate(top_k_indices(combined, min(k, max(total - offset, 0)), offset), offset + 1):
+            page.append({
+                'id': ids[i],
+                'rank': rank,
+                'combined_score': round(float(combined[i]), 2),
+                'similarity_score': float(similarity[i]),
+                'requirements_score': float(totals[i]),
+                'grade': str(grades[i])
+            })
+        return page, total
+    
+    def match_payload(self, candidate, row):
+        """Match result row sent to clients, never the raw text"""
+        return {
+            'candidate_id': candidate.get('file_path', 'unknown'),
+            'name': candidate.get('entities', {}).get('name'),
+            'email': candidate.get('entities', {}).get('email'),
+            'combined_score': row['combined_score'],
+            'similarity_score': row['similarity_score'],
+            'requirements_score': row['requirements_score'],
+            'grade': row['grade'],
+            'skills': self._get_skills_summary(candidate)
+        }
+    
+    def match_to_job(self, candidates, job_description, job_requirements, k=None, offset=0, mode='tfidf'):
+        """Match and rank candidates for a specific job
+
+        With k set, only the top-k page by combined score is built.
+        mode='semantic' retrieves the SEMANTIC_WINDOW nearest candidates
+        from the embedding ANN index instead of scoring everyone, and pages
+        within that window; `candidates` may then be a list or a function
+        loading candidates by id.
+        """
         # First, match by similarity
-        matched = self.matcher.match_candidates(candidates, job_description)
+        if mode == 'semantic':
+            k = k or DEFAULT_PAGE_SIZE
+            matched = self._semantic_matches(candidates, job_description, SEMANTIC_WINDOW)
+        else:
+            matched = self.matcher.match_candidates(candidates, job_description)
+        if not matched:
+            return []
+        
+        # Then score them all at once
+        scores = self.scorer.score_batch([item['candidate'] for item in matched], job_requirements)
+        totals = scores['total_score'].tolist()
+        grades = scores['grade'].tolist()
+        
+        rows = range(len(matched))
+        if k is not None:
+            similarity = np.array([item['similarity_score'] for item in matched])
+            combined = similarity * 0.5 + scores['total_score'] * 0.5
+            rows = top_k_indices(combined, k, offset).tolist()
         
-        # Then score each
         results = []
-        for item in matched:
-            candidate = item['candidate']
-            score_result = self.scorer.score_candidate(candidate, job_requirements)
+        for i in rows:
+            item = matched[i]
             
             # Combined score: 50% similarity + 50% requirements match
-            combined_score = (item['similarity_score'] * 0.5) + (score_result['total_score'] * 0.5)
+            combined_score = (item['similarity_score'] * 0.5) + (totals[i] * 0.5)
             
-            results.append({
-                'candidate_id': candidate.get('file_path', 'unknown'),
-                'name': candidate.get('entities', {}).get('name'),
-                'email': candidate.get('entities', {}).get('email'),
+            results.append(self.match_payload(item['candidate'], {
                 'combined_score': round(combined_score, 2),
                 'similarity_score': item['similarity_score'],
-                'requirements_score': score_result['total_score'],
-                'grade': score_result['grade'],
-                'skills': self._get_skills_summary(candidate)
-            })
+                'requirements_score': totals[i],
+                'grade': grades[i]
+            }))
         
         return results
     
+    def _semantic_matches(self, candidates, job_description, n):
+        """Nearest candidates to the job description, as match_candidates-style rows"""
+        if not callable(candidates):
+            self.matcher.index_candidates(candidates)
+        
+        hits = self.matcher.match_semantic(job_description, n)
+        ids = [doc_id for doc_id, _ in hits]
+        loaded = candidates(ids) if callable(candidates) else candidates
+        by_id = {self.matcher.doc_id(c): c for c in loaded}
+        
+        return [{'candidate': by_id[doc_id], 'similarity_score': score}
+                for doc_id, score in hits if doc_id in by_id]
+    
+    def _breakdown_rows(self, breakdown):
+        """Per-candidate breakdown dicts from per-component arrays"""
+        columns = {k: v.tolist() for k, v in breakdown.items()}
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+    
     def _get_skills_summary(self, candidate):
         """Get summary of candidate skills"""
         skills = []
@@ -0,0 +1,312 @@
+"""
+Semantic Index - Hashed n-gram embeddings with an IVF approximate nearest-neighbor index
+
+HashedEmbedder turns text into a dense, L2-normalized vector without any
+model download: every word contributes itself plus its character 3- and
+4-grams, hashed into `dim` signed buckets. Resumes that share word stems
+and spellings ("developer" / "development") land close together.
+
+IVFIndex is an inverted-file index in pure NumPy. Vectors are clustered
+with spherical k-means; a query scores the centroids, then only the
+vectors in the `nprobe` closest clusters. Until enough vectors exist to
+train, it falls back to exact search. With auto_train=False, add() only
+raises `needs_training`; the owner then runs k-means off its lock with
+snapshot() / fit() and installs the result with apply_training().
+"""
+import json
+import os
+import tempfile
+import zlib
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+from .tfidf_index import tokenize
+
+INDEX_FORMAT_VERSION = 1
+
+
+class HashedEmbedder:
+    def __init__(self, dim=256, ngram_sizes=(3, 4)):
+        self.dim = dim
+        self.ngram_sizes = ngram_sizes
+        # token -> (buckets, signs); the vocabulary is small, so each word is hashed once
+        self._token_cache = {}
+
+    def _features(self, token):
+        cached = self._token_cache.get(token)
+        if cached is None:
+            padded = f"<{token}>"
+            features = [token]
+            for n in self.ngram_sizes:
+                features.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+            hashes = np.fromiter((zlib.crc32(f.encode('utf-8')) for f in features), dtype=np.uint64,
+                                 count=len(features))
+            buckets = (hashes % self.dim).astype(np.int64)
+            signs = np.where((hashes >> np.uint64(31)) & np.uint64(1), -1.0, 1.0)
+            cached = self._token_cache[token] = (buckets, signs / np.sqrt(len(features)))
+        return cached
+
+    def embed(self, text):
+        """L2-normalized float32 vector for one text"""
+        counts = Counter(tokenize(text))
+        if not counts:
+            return np.zeros(self.dim, dtype=np.float32)
+
+        buckets, weights = [], []
+        for token, tf in counts.items():
+            token_buckets, token_signs = self._features(token)
+            buckets.append(token_buckets)
+            weights.append(token_signs * (1.0 + np.log(tf)))
+
+        vector = np.bincount(np.concatenate(buckets), weights=np.concatenate(weights), minlength=self.dim)
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).astype(np.float32)
+
+    def embed_many(self, texts):
+        return np.vstack([self.embed(t) for t in texts]) if texts else np.zeros((0, self.dim), dtype=np.float32)
+
+
+class IVFIndex:
+    def __init__(self, dim, nlist=None, nprobe=8, train_threshold=1024, seed=42, auto_train=True):
+        self.dim = dim
+        self.nlist = nlist                    # clusters; None picks ~sqrt(n) when training
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.seed = seed
+        self.auto_train = auto_train          # train inside add() when needed
+        self.centroids = None                 # (nlist, dim) once trained
+        self._trained_size = 0
+        self._lists = [self._empty_list()]    # a single exact-search list until trained
+        self._where = {}                      # id -> (list number, position)
+        self.revisions = {}                   # id -> source revision it was indexed at
+        self.dirty = False
+        self._seq = 0                         # add() calls so far
+        self._added_at = {}                   # id -> add() call that stored its current vector
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._where
+
+    @property
+    def ids(self):
+        return list(self._where)
+
+    @property
+    def needs_training(self):
+        """Enough data to train for the first time, or grown 8x since the last training"""
+        if self.centroids is None:
+            return len(self) >= self.train_threshold
+        return len(self) >= 8 * self._trained_size
+
+    def _empty_list(self):
+        return {'ids': [], 'vectors': np.zeros((16, self.dim), dtype=np.float32)}
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def add(self, doc_ids, vectors, revisions=None):
+        """Add or replace vectors (rows of a 2-D array) under the given ids, recording their revisions"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        for doc_id in doc_ids:
+            if doc_id in self._where:
+                self.remove(doc_id)
+        self.revisions.update(zip(doc_ids, revisions or [None] * len(doc_ids)))
+        self._seq += 1
+
+        assignments = self._assign(vectors)
+        for doc_id, vector, list_no in zip(doc_ids, vectors, assignments):
+            self._append(list_no, doc_id, vector)
+            self._added_at[doc_id] = self._seq
+        self.dirty = True
+
+        # Train once there is enough data, and retrain after large growth
+        if self.auto_train and self.needs_training:
+            self.train()
+
+    def remove(self, doc_id):
+        """Delete a vector; returns False if the id is unknown"""
+        location = self._where.pop(doc_id, None)
+        if location is None:
+            return False
+        self.revisions.pop(doc_id, None)
+        self._added_at.pop(doc_id, None)
+        list_no, pos = location
+        inv = self._lists[list_no]
+
+        # Swap the last entry into the hole
+        last = len(inv['ids']) - 1
+        if pos != last:
+            moved_id = inv['ids'][last]
+            inv['ids'][pos] = moved_id
+            inv['vectors'][pos] = inv['vectors'][last]
+            self._where[moved_id] = (list_no, pos)
+        inv['ids'].pop()
+        self.dirty = True
+        return True
+
+    def _append(self, list_no, doc_id, vector):
+        inv = self._lists[list_no]
+        size = len(inv['ids'])
+        if size == len(inv['vectors']):
+            inv['vectors'] = np.concatenate([inv['vectors'], np.zeros_like(inv['vectors'])])
+        inv['vectors'][size] = vector
+        inv['ids'].append(doc_id)
+        self._where[doc_id] = (list_no, size)
+
+    def _assign(self, vectors):
+        if self.centroids is None:
+            return np.zeros(len(vectors), dtype=np.int64)
+        return np.argmax(vectors @ self.centroids.T, axis=1)
+
+    def _all(self):
+        """(ids, vectors) of every stored vector"""
+        ids = [doc_id for inv in self._lists for doc_id in inv['ids']]
+        vectors = [inv['vectors'][:len(inv['ids'])] for inv in self._lists]
+        return ids, np.concatenate(vectors) if vectors else np.zeros((0, self.dim), dtype=np.float32)
+
+    def train(self, iterations=10):
+        """Cluster all vectors with spherical k-means and rebuild the inverted lists"""
+        snapshot = self.snapshot()
+        self.apply_training(snapshot, *self.fit(snapshot[2], iterations))
+
+    def snapshot(self):
+        """(add count, ids, vectors) copied out, for fit() to run without holding the owner's lock"""
+        ids, vectors = self._all()
+        return self._seq, ids, vectors
+
+    def fit(self, vectors, iterations=10):
+        """(centroids, list number of each vector) from spherical k-means; reads no index state
+
+        Returns (None, None) when there is nothing to cluster.
+        """
+        n = len(vectors)
+        if n == 0:
+            return None, None
+        nlist = self.nlist or int(np.clip(np.sqrt(n), 1, 4096))
+        nlist = min(nlist, n)
+
+        rng = np.random.default_rng(self.seed)
+        sample = vectors[rng.choice(n, size=min(n, 32 * nlist), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            # Sum members per cluster with one sparse one-hot product
+            one_hot = sp.csr_matrix((np.ones(len(sample), dtype=np.float32), (labels, np.arange(len(sample)))),
+                                    shape=(nlist, len(sample)))
+            sums = np.asarray(one_hot @ sample, dtype=np.float32)
+            norms = np.linalg.norm(sums, axis=1)
+            empty = norms == 0
+            # Re-seed empty clusters with random sample points
+            sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()))]
+            norms[empty] = np.linalg.norm(sums[empty], axis=1)
+            centroids = (sums / np.maximum(norms, 1e-12)[:, None]).astype(np.float32)
+
+        return centroids, np.argmax(vectors @ centroids.T, axis=1)
+
+    def apply_training(self, snapshot, centroids, labels):
+        """Install fit() results and rebuild the inverted lists
+
+        Vectors added or replaced since the snapshot are assigned to the new
+        centroids here; the rest reuse the labels fit() computed.
+        """
+        if centroids is None:
+            return
+        seq, snapshot_ids, _ = snapshot
+        label_of = dict(zip(snapshot_ids, labels.tolist()))
+        ids, vectors = self._all()
+
+        self.centroids = centroids
+        self._trained_size = len(snapshot_ids)
+        self._lists = [self._empty_list() for _ in range(len(centroids))]
+        self._where = {}
+        for doc_id, vector in zip(ids, vectors):
+            if self._added_at.get(doc_id, 0) <= seq and doc_id in label_of:
+                list_no = label_of[doc_id]
+            else:
+                list_no = self._assign(vector[None, :])[0]
+            self._append(list_no, doc_id, vector)
+        self.dirty = True
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(self, query, k=10, nprobe=None):
+        """Top-k (ids, cosine scores) for a normalized query vector"""
+        query = np.asarray(query, dtype=np.float32).ravel()
+        if self.centroids is None:
+            probe = [0]
+        else:
+            nprobe = min(nprobe or self.nprobe, len(self.centroids))
+            centroid_scores = self.centroids @ query
+            probe = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+
+        ids, blocks = [], []
+        for list_no in probe:
+            inv = self._lists[list_no]
+            if inv['ids']:
+                ids.extend(inv['ids'])
+                blocks.append(inv['vectors'][:len(inv['ids'])])
+        if not ids:
+            return [], np.zeros(0, dtype=np.float32)
+
+        scores = np.concatenate(blocks) @ query
+        k = min(k, len(ids))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [ids[i] for i in top], scores[top]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path):
+        """Write vectors, ids and centroids to one .npz file (atomic replace)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        ids, vectors = self._all()
+        meta = {'format': INDEX_FORMAT_VERSION, 'dim': self.dim, 'nlist': self.nlist, 'nprobe': self.nprobe,
+                'train_threshold': self.train_threshold, 'trained_size': self._trained_size, 'ids': ids,
+                'revisions': [self.revisions.get(doc_id) for doc_id in ids]}
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-', suffix='.npz')
+        with os.fdopen(fd, 'wb') as f:
+            arrays = {'vectors': vectors, 'meta': np.array(json.dumps(meta))}
+            if self.centroids is not None:
+                arrays['centroids'] = self.centroids
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path, dim, auto_train=True):
+        """Load a saved index, or an empty one if the file is missing or stale"""
+        index = cls(dim, auto_train=auto_train)
+        try:
+            with np.load(path) as data:
+                meta = json.loads(str(data['meta']))
+                vectors = data['vectors']
+                centroids = data['centroids'] if 'centroids' in data else None
+        except (OSError, ValueError, KeyError):
+            return index
+        if meta.get('format') != INDEX_FORMAT_VERSION or meta.get('dim') != dim:
+            return index
+
+        index.nlist = meta['nlist']
+        index.nprobe = meta['nprobe']
+        index.train_threshold = meta['train_threshold']
+        if centroids is not None:
+            index.centroids = centroids
+            index._trained_size = meta['trained_size']
+            index._lists = [index._empty_list() for _ in range(len(centroids))]
+        for doc_id, vector, list_no in zip(meta['ids'], vectors, index._assign(vectors)):
+            index._append(list_no, doc_id, vector)
+        index.revisions = dict(zip(meta['ids'], meta.get('revisions') or [None] * len(meta['ids'])))
+        return index
@@ -0,0 +1,265 @@
+"""
+Skill Bitmap Index - Inverted index from skill to a bitmap of candidates
+
+Every candidate gets a dense slot; each technical skill keeps a packed
+uint64 bitmap with one bit per slot. Slots freed by removals (and
+re-uploads) are reused, so the bitmaps only grow with the number of live
+candidates. Required-skill filters then become a few vectorized AND/OR
+operations over len(candidates) / 64 words instead of a Python set
+intersection per candidate. Skills are indexed and looked up in the same
+normalized form CandidateScorer compares them in, so counts from the
+index score exactly like score_candidate().
+"""
+import numpy as np
+
+from ..storage.candidate_store import SOFT_CATEGORY
+from .candidate_scorer import normalize_skill
+
+_WORD_BITS = 64
+
+# Popcount per byte, for NumPy builds without np.bitwise_count
+_BYTE_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+
+def _popcount(words):
+    """Number of set bits in a uint64 array"""
+    if hasattr(np, 'bitwise_count'):
+        return int(np.bitwise_count(words).sum())
+    return int(_BYTE_POPCOUNT[words.view(np.uint8)].sum())
+
+
+def parse_skill_match(mode):
+    """'all', 'any' or a non-negative number of skills; ValueError otherwise"""
+    if mode in ('all', 'any'):
+        return mode
+    try:
+        k = int(mode)
+    except (TypeError, ValueError):
+        k = -1
+    if isinstance(mode, bool) or k < 0 or str(k) != str(mode).strip():
+        raise ValueError(f"skill_match must be 'all', 'any' or a non-negative whole number, not {mode!r}")
+    return k
+
+
+class SkillBitmapIndex:
+    def __init__(self, capacity=1024):
+        self._slots = {}                           # candidate id -> slot
+        self._ids = np.zeros(capacity, dtype=np.int64)  # slot -> candidate id
+        self._size = 0                             # slots handed out so far
+        self._free = []                            # slots of removed candidates, bits cleared
+        self._alive = np.zeros(self._num_words(capacity), dtype=np.uint64)
+        self._bitmaps = {}                         # skill -> packed bitmap
+        self._skills = {}                          # candidate id -> skills, for removal
+
+    def __len__(self):
+        return len(self._slots)
+
+    @staticmethod
+    def _num_words(capacity):
+        return (capacity + _WORD_BITS - 1) // _WORD_BITS
+
+    @classmethod
+    def from_store(cls, store, source=None):
+        """Build the index from a CandidateStore's candidate_skills table (technical skills only)"""
+        sql = """
+            SELECT c.id, s.name
+            FROM candidates c
+            LEFT JOIN candidate_skills cs ON cs.candidate_id = c.id
+            LEFT JOIN skills s ON s.id = cs.skill_id AND s.category != ?
+        """
+        params = [SOFT_CATEGORY]
+        if source is not None:
+            sql += " WHERE c.source = ?"
+            params.append(source)
+        sql += " ORDER BY c.id"
+
+        skills_by_id = {}
+        for candidate_id, skill in store.conn.execute(sql, params):
+            skills = skills_by_id.setdefault(candidate_id, [])
+            if skill is not None:
+                skills.append(skill)
+
+        index = cls(capacity=max(len(skills_by_id), 1))
+        index.add_many(skills_by_id.items())
+        return index
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def _grow(self, needed):
+        """Double capacity until `needed` slots fit, reallocating every bitmap"""
+        capacity = len(self._ids)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+
+        words = self._num_words(capacity)
+        self._ids = np.concatenate([self._ids, np.zeros(capacity - len(self._ids), dtype=np.int64)])
+        self._alive = np.concatenate([self._alive, np.zeros(words - len(self._alive), dtype=np.uint64)])
+        for skill, bitmap in self._bitmaps.items():
+            self._bitmaps[skill] = np.concatenate([bitmap, np.zeros(words - len(bitmap), dtype=np.uint64)])
+
+    def _bitmap(self, skill):
+        bitmap = self._bitmaps.get(skill)
+        if bitmap is None:
+            bitmap = np.zeros(len(self._alive), dtype=np.uint64)
+            self._bitmaps[skill] = bitmap
+        return bitmap
+
+    def add(self, candidate_id, skills):
+        """Add or replace one candidate's skills"""
+        self.add_many([(candidate_id, skills)])
+
+    def add_many(self, items):
+        """Add or replace many (candidate_id, skills) pairs"""
+        items = list(items)
+        for candidate_id, _ in items:
+            if candidate_id in self._slots:
+                self.remove(candidate_id)
+        self._grow(self._size + max(len(items) - len(self._free), 0))
+
+        # Collect slots per skill so each bitmap is updated with one scatter
+        slots_by_skill = {}
+        new_slots = []
+        for candidate_id, skills in items:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = self._size
+                self._size += 1
+            new_slots.append(slot)
+            self._slots[candidate_id] = slot
+            self._ids[slot] = candidate_id
+
+            skills = {normalize_skill(s) for s in skills}
+            self._skills[candidate_id] = skills
+            for skill in skills:
+                slots_by_skill.setdefault(skill, []).append(slot)
+
+        self._set_bits(self._alive, np.asarray(new_slots, dtype=np.int64))
+        for skill, slots in slots_by_skill.items():
+            self._set_bits(self._bitmap(skill), np.asarray(slots))
+
+    def remove(self, candidate_id):
+        """Drop a candidate; its slot is cleared and reused by the next add"""
+        slot = self._slots.pop(candidate_id, None)
+        if slot is None:
+            return False
+        word, mask = slot // _WORD_BITS, np.uint64(~(1 << (slot % _WORD_BITS)) & 0xFFFFFFFFFFFFFFFF)
+        self._alive[word] &= mask
+        for skill in self._skills.pop(candidate_id, ()):
+            self._bitmaps[skill][word] &= mask
+        self._free.append(slot)
+        return True
+
+    @staticmethod
+    def _set_bits(bitmap, slots):
+        if len(slots) == 0:
+            return
+        bits = np.left_shift(np.uint64(1), (slots % _WORD_BITS).astype(np.uint64))
+        np.bitwise_or.at(bitmap, slots // _WORD_BITS, bits)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _rows(self, skills):
+        """Bitmaps for the requested skills; None for skills nobody has"""
+        return [self._bitmaps.get(s) for s in dict.fromkeys(normalize_skill(s) for s in skills)]
+
+    def _to_ids(self, bitmap):
+        bits = np.unpackbits(bitmap.view(np.uint8), bitorder='little')[:self._size]
+        return self._ids[np.flatnonzero(bits)]
+
+    def match_all(self, skills):
+        """Candidate ids that have every skill (AND)"""
+        rows = self._rows(skills)
+        if not rows:
+            return self._to_ids(self._alive)
+        if any(row is None for row in rows):
+            return np.zeros(0, dtype=np.int64)
+        result = self._alive.copy()
+        for row in rows:
+            np.bitwise_and(result, row, out=result)
+        return self._to_ids(result)
+
+    def match_any(self, skills):
+        """Candidate ids that have at least one skill (OR)"""
+        result = np.zeros_like(self._alive)
+        for row in self._rows(skills):
+            if row is not None:
+                np.bitwise_or(result, row, out=result)
+        return self._to_ids(result & self._alive)
+
+    def _count_planes(self, skills):
+        """Bit-sliced per-candidate match counts: plane i holds bit i of each count
+
+        Adding a skill bitmap is a ripple-carry add across the planes, so
+        counting touches len(candidates) / 64 words per plane.
+        """
+        planes = []
+        for row in self._rows(skills):
+            if row is None:
+                continue
+            carry = row
+            for plane in planes:
+                next_carry = plane & carry
+                np.bitwise_xor(plane, carry, out=plane)
+                carry = next_carry
+            if carry.any():
+                planes.append(carry.copy())
+        return planes
+
+    def match_counts(self, skills):
+        """(candidate ids, number of the skills each one has) for every candidate"""
+        live = np.flatnonzero(np.unpackbits(self._alive.view(np.uint8), bitorder='little')[:self._size])
+        counts = np.zeros(self._size, dtype=np.int32)
+        for bit, plane in enumerate(self._count_planes(skills)):
+            counts += np.unpackbits(plane.view(np.uint8), bitorder='little')[:self._size].astype(np.int32) << bit
+        return self._ids[live], counts[live]
+
+    def match_at_least(self, skills, k):
+        """Candidate ids that have at least k of the skills"""
+        if k <= 0:
+            return self._to_ids(self._alive)
+        planes = self._count_planes(skills)
+        if k >= 1 << len(planes):
+            return np.zeros(0, dtype=np.int64)
+
+        # Compare every count with k from the most significant bit down
+        greater = np.zeros_like(self._alive)
+        equal = self._alive.copy()
+        for bit in range(len(planes) - 1, -1, -1):
+            if (k >> bit) & 1:
+                equal &= planes[bit]
+            else:
+                greater |= equal & planes[bit]
+                equal &= ~planes[bit]
+        return self._to_ids((greater | equal) & self._alive)
+
+    def count(self, skills, mode='all'):
+        """Number of matching candidates for 'all' or 'any' without listing them"""
+        rows = self._rows(skills)
+        if mode == 'all':
+            if any(row is None for row in rows):
+                return 0
+            result = self._alive.copy()
+            for row in rows:
+                np.bitwise_and(result, row, out=result)
+        else:
+            result = np.zeros_like(self._alive)
+            for row in rows:
+                if row is not None:
+                    np.bitwise_or(result, row, out=result)
+            result &= self._alive
+        return _popcount(result)
+
+    def filter(self, skills, mode='all'):
+        """Dispatch on mode: 'all', 'any' or a minimum number of matching skills"""
+        if mode == 'all':
+            return self.match_all(skills)
+        if mode == 'any':
+            return self.match_any(skills)
+        return self.match_at_least(skills, parse_skill_match(mode))
@@ -0,0 +1,275 @@
+"""
+TF-IDF Index - Persistent, incrementally updated document-term index over candidates
+
+Candidates are tokenized once when added. Term counts live in a sparse
+CSR matrix and document frequencies in a dense array, so the IDF always
+reflects the whole corpus. A job query tokenizes only the job description
+and scores every candidate with one sparse matrix-vector product.
+
+Weighting matches scikit-learn's TfidfVectorizer defaults: raw term
+counts, smooth idf = ln((1 + N) / (1 + df)) + 1 and L2-normalized vectors.
+
+Removing a document only marks its row deleted; rows are dropped in one
+pass once a quarter of the matrix is dead. Saved generations stay on disk
+until the following save, so a reader that picked up the previous
+meta.json can still open the files it names.
+"""
+import json
+import os
+import re
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+INDEX_FORMAT_VERSION = 1
+
+# Drop deleted rows once they make up this share of the matrix
+_COMPACT_RATIO = 0.25
+
+
+# Times load() re-reads meta.json when a concurrent save removed the files it named
+_LOAD_ATTEMPTS = 3
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class TfidfIndex:
+    def __init__(self):
+        self.vocab = {}                       # term -> column
+        self.ids = []                         # row -> document id
+        self._rows = {}                       # document id -> row
+        self.revisions = {}                   # document id -> source revision it was indexed at
+        self._alive = np.zeros(1024, dtype=bool)  # row -> not deleted (grown by doubling)
+        self._df = np.zeros(0, dtype=np.int64)
+        self._tf = sp.csr_matrix((0, 0), dtype=np.float64)
+        self._pending = []                    # (columns, counts) added since the last consolidation
+        self._norms = None                    # cached document vector norms
+        self.dirty = False                    # changed since the last save
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._rows
+
+    @property
+    def num_docs(self):
+        return len(self._rows)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def add(self, doc_id, text, revision=None):
+        """Add or replace one document; `revision` records which version of it was indexed"""
+        if doc_id in self._rows:
+            self.remove(doc_id)
+
+        counts = Counter(tokenize(text))
+        columns = np.fromiter((self.vocab.setdefault(t, len(self.vocab)) for t in counts), dtype=np.int64,
+                              count=len(counts))
+        values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+
+        if len(self.vocab) > len(self._df):
+            self._df = np.concatenate([self._df, np.zeros(len(self.vocab) - len(self._df), dtype=np.int64)])
+        self._df[columns] += 1
+
+        row = len(self.ids)
+        if row == len(self._alive):
+            self._alive = np.concatenate([self._alive, np.zeros(row, dtype=bool)])
+        self._alive[row] = True
+        self._rows[doc_id] = row
+        self.revisions[doc_id] = revision
+        self.ids.append(doc_id)
+        self._pending.append((columns, values))
+        self._norms = None
+        self.dirty = True
+
+    def add_many(self, docs):
+        """Add (doc_id, text) pairs"""
+        for doc_id, text in docs:
+            self.add(doc_id, text)
+
+    def remove(self, doc_id):
+        """Remove a document; returns False if it was not indexed"""
+        row = self._rows.pop(doc_id, None)
+        if row is None:
+            return False
+        self.revisions.pop(doc_id, None)
+
+        # Read the row where it lives instead of consolidating the matrix for every removal
+        consolidated = self._tf.shape[0]
+        if row < consolidated:
+            columns = self._tf.indices[self._tf.indptr[row]:self._tf.indptr[row + 1]]
+        else:
+            columns = self._pending[row - consolidated][0]
+        self._df[columns] -= 1
+        self._alive[row] = False
+        self._norms = None
+        self.dirty = True
+
+        if len(self.ids) - len(self._rows) > _COMPACT_RATIO * len(self.ids):
+            self.compact()
+        return True
+
+    def compact(self):
+        """Physically drop deleted rows"""
+        keep = np.flatnonzero(self._alive[:len(self.ids)])
+        if len(keep) == len(self.ids):
+            return
+        self._tf = self.matrix[keep]
+        self.ids = [self.ids[i] for i in keep]
+        self._rows = {doc_id: row for row, doc_id in enumerate(self.ids)}
+        self._alive = np.ones(max(len(self.ids), 1024), dtype=bool)
+        self._alive[len(self.ids):] = False
+        self._norms = None
+
+    @property
+    def matrix(self):
+        """Term-count matrix (rows = documents ever added, including deleted ones)"""
+        shape = (len(self.ids), len(self.vocab))
+        if self._pending:
+            data = np.concatenate([values for _, values in self._pending])
+            indices = np.concatenate([columns for columns, _ in self._pending])
+            indptr = np.concatenate([[0], np.cumsum([len(c) for c, _ in self._pending])])
+            new_rows = sp.csr_matrix((data, indices, indptr), shape=(len(self._pending), shape[1]))
+            self._tf = sp.vstack([self._widen(self._tf, shape[1]), new_rows], format='csr')
+            self._pending = []
+        elif self._tf.shape != shape:
+            self._tf = self._widen(self._tf, shape[1])
+        return self._tf
+
+    @staticmethod
+    def _widen(matrix, num_columns):
+        """Same rows with more (empty) columns, without copying the data"""
+        return sp.csr_matrix((matrix.data, matrix.indices, matrix.indptr), shape=(matrix.shape[0], num_columns))
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def idf(self):
+        n = self.num_docs
+        return np.log((1 + n) / (1 + self._df)) + 1
+
+    def _doc_norms(self, idf):
+        """L2 norm of every document's tf-idf vector, recomputed only after changes"""
+        if self._norms is None:
+            matrix = self.matrix
+            squared = matrix.multiply(matrix) if matrix.nnz else matrix
+            self._norms = np.sqrt(squared @ (idf ** 2)) if matrix.shape[1] else np.zeros(matrix.shape[0])
+        return self._norms
+
+    def scores(self, text):
+        """(document ids, cosine similarity to the text) for every live document"""
+        live = np.flatnonzero(self._alive[:len(self.ids)])
+        ids = [self.ids[i] for i in live]
+        if not len(live) or not self.vocab:
+            return ids, np.zeros(len(live))
+
+        counts = Counter(t for t in tokenize(text) if t in self.vocab)
+        if not counts:
+            return ids, np.zeros(len(live))
+
+        idf = self.idf()
+        query = np.zeros(len(self.vocab))
+        query[[self.vocab[t] for t in counts]] = list(counts.values())
+        query *= idf
+        query_norm = np.linalg.norm(query)
+
+        # tf-idf dot product for every document in one sparse mat-vec
+        dots = self.matrix @ (query * idf)
+        norms = self._doc_norms(idf)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            similarity = np.where(norms > 0, dots / (norms * query_norm), 0.0)
+        return ids, similarity[live]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, directory):
+        """Write the index; meta.json is replaced last, so readers never see a mix of generations
+
+        Files of the generation being replaced are kept until the next save
+        for readers that are still loading it.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.compact()
+
+        meta_path = directory / 'meta.json'
+        old_generation = None
+        if meta_path.exists():
+            old_generation = json.loads(meta_path.read_text()).get('generation')
+        generation = (old_generation or 0) + 1
+
+        sp.save_npz(directory / f'tf-{generation}.npz', self.matrix)
+        np.save(directory / f'df-{generation}.npy', self._df)
+
+        meta = {'format': INDEX_FORMAT_VERSION, 'generation': generation,
+                'vocab': list(self.vocab), 'ids': self.ids,
+                'revisions': [self.revisions.get(doc_id) for doc_id in self.ids]}
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, meta_path)
+
+        for path in [*directory.glob('tf-*.npz'), *directory.glob('df-*.npy')]:
+            if _generation_of(path) not in (generation, old_generation):
+                path.unlink(missing_ok=True)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, directory):
+        """Load a saved index, or return an empty one if none exists (or it is stale)
+
+        If the generation's files are gone because saves replaced it while
+        loading, the current meta.json is read again.
+        """
+        index = cls()
+        meta_path = Path(directory) / 'meta.json'
+        generation = None
+        for _ in range(_LOAD_ATTEMPTS):
+            try:
+                meta = json.loads(meta_path.read_text())
+                if meta.get('format') != INDEX_FORMAT_VERSION:
+                    return index
+            except (OSError, ValueError):
+                return index
+            if meta.get('generation') == generation:
+                return index   # missing files that no save explains
+            generation = meta.get('generation')
+            try:
+                tf = sp.load_npz(Path(directory) / f'tf-{generation}.npz').tocsr()
+                df = np.load(Path(directory) / f'df-{generation}.npy')
+                break
+            except (OSError, ValueError):
+                continue
+        else:
+            return index
+
+        index.vocab = {term: col for col, term in enumerate(meta['vocab'])}
+        index.ids = meta['ids']
+        index.revisions = dict(zip(index.ids, meta.get('revisions') or [None] * len(index.ids)))
+        index._rows = {doc_id: row for row, doc_id in enumerate(index.ids)}
+        index._alive = np.ones(max(len(index.ids), 1024), dtype=bool)
+        index._alive[len(index.ids):] = False
+        index._df = df
+        index._tf = tf
+        return index
+
+
+def _generation_of(path):
+    """Generation number in a 'tf-<n>.npz' / 'df-<n>.npy' file name, or None"""
+    try:
+        return int(path.stem.split('-', 1)[1])
+    except (IndexError, ValueError):
+        return None
@@ -0,0 +1,3 @@
+from .candidate_store import CandidateStore
+
+__all__ = ['CandidateStore']
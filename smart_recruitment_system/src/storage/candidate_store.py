@@ -0,0 +1,369 @@
+"""
+Candidate Store - SQLite-backed storage for parsed resumes
+
+Tables:
+    candidates        one row per resume, entities in typed columns
+    skills            normalized skill names (one row per category/name)
+    candidate_skills  candidate <-> skill links, indexed both ways
+    candidates_fts    FTS5 full-text index over raw_text
+
+Candidates are unique per (source, filename), where source is 'uploaded'
+or 'test'. Every upsert stamps the row with a new store-wide revision, so
+derived indexes can tell a re-parsed candidate from the one they hold. Records are returned in the same shape as
+ResumeNLPEngine.process_resume, plus 'id', 'filename' and 'source'.
+"""
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from config.settings import CANDIDATE_DB_PATH
+
+SCHEMA_VERSION = 1
+
+ENTITY_COLUMNS = ('name', 'email', 'phone', 'linkedin', 'github', 'location')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    file_path TEXT,
+    content_hash TEXT,
+    size INTEGER,
+    name TEXT,
+    email TEXT,
+    phone TEXT,
+    linkedin TEXT,
+    github TEXT,
+    location TEXT,
+    total_technical_skills INTEGER NOT NULL DEFAULT 0,
+    total_soft_skills INTEGER NOT NULL DEFAULT 0,
+    sections TEXT,
+    raw_text TEXT NOT NULL DEFAULT '',
+    revision INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    UNIQUE (source, filename)
+);
+CREATE INDEX IF NOT EXISTS idx_candidates_email ON candidates (email);
+CREATE INDEX IF NOT EXISTS idx_candidates_hash ON candidates (content_hash);
+
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (category, name)
+);
+CREATE INDEX IF NOT EXISTS idx_skills_name ON skills (name);
+
+CREATE TABLE IF NOT EXISTS candidate_skills (
+    candidate_id INTEGER NOT NULL REFERENCES candidates (id) ON DELETE CASCADE,
+    skill_id INTEGER NOT NULL REFERENCES skills (id),
+    position INTEGER NOT NULL,
+    PRIMARY KEY (candidate_id, skill_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_candidate_skills_skill ON candidate_skills (skill_id, candidate_id);
+"""
+
+REVISION_INDEX = "CREATE INDEX IF NOT EXISTS idx_candidates_revision ON candidates (revision)"
+
+# External-content FTS table kept in sync by triggers
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS candidates_fts USING fts5 (
+    raw_text, content='candidates', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS candidates_ai AFTER INSERT ON candidates BEGIN
+    INSERT INTO candidates_fts (rowid, raw_text) VALUES (new.id, new.raw_text);
+END;
+CREATE TRIGGER IF NOT EXISTS candidates_ad AFTER DELETE ON candidates BEGIN
+    INSERT INTO candidates_fts (candidates_fts, rowid, raw_text) VALUES ('delete', old.id, old.raw_text);
+END;
+CREATE TRIGGER IF NOT EXISTS candidates_au AFTER UPDATE OF raw_text ON candidates BEGIN
+    INSERT INTO candidates_fts (candidates_fts, rowid, raw_text) VALUES ('delete', old.id, old.raw_text);
+    INSERT INTO candidates_fts (rowid, raw_text) VALUES (new.id, new.raw_text);
+END;
+"""
+
+# Category stored for soft skills in the skills table
+SOFT_CATEGORY = 'soft'
+
+_LIST_COLUMNS = "id, source, filename, file_path, size, name, email, total_technical_skills, total_soft_skills"
+
+
+class CandidateStore:
+    def __init__(self, db_path=CANDIDATE_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # sqlite3 connections must not be shared between threads
+        self._local = threading.local()
+        self.has_fts = self._init_schema()
+
+    @property
+    def conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _init_schema(self):
+        """Create tables; returns False when this SQLite build lacks FTS5"""
+        with self.conn as conn:
+            conn.executescript(SCHEMA)
+            # Stores created before candidates carried a revision
+            if 'revision' not in [row[1] for row in conn.execute("PRAGMA table_info(candidates)")]:
+                conn.execute("ALTER TABLE candidates ADD COLUMN revision INTEGER NOT NULL DEFAULT 0")
+            conn.execute(REVISION_INDEX)
+            try:
+                conn.executescript(FTS_SCHEMA)
+                has_fts = True
+            except sqlite3.OperationalError:
+                has_fts = False
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        return has_fts
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, result, filename, source='uploaded', file_path=None, content_hash=None, size=None):
+        """Insert or replace a processed resume; returns the candidate id"""
+        entities = result.get('entities') or {}
+        skills = result.get('skills') or {}
+        technical = skills.get('technical') or {}
+        soft = skills.get('soft') or []
+        now = datetime.now().isoformat(timespec='seconds')
+
+        row = {
+            'source': source,
+            'filename': filename,
+            'file_path': str(file_path or result.get('file_path') or filename),
+            'content_hash': content_hash,
+            'size': size,
+            'total_technical_skills': sum(len(v) for v in technical.values()),
+            'total_soft_skills': len(soft),
+            'sections': json.dumps(result.get('sections') or {}),
+            'raw_text': result.get('raw_text') or '',
+            'now': now
+        }
+        row.update({col: entities.get(col) for col in ENTITY_COLUMNS})
+
+        with self.conn as conn:
+            candidate_id = conn.execute(
+                """
+                INSERT INTO candidates (source, filename, file_path, content_hash, size,
+                    name, email, phone, linkedin, github, location,
+                    total_technical_skills, total_soft_skills, sections, raw_text,
+                    revision, created_at, updated_at)
+                VALUES (:source, :filename, :file_path, :content_hash, :size,
+                    :name, :email, :phone, :linkedin, :github, :location,
+                    :total_technical_skills, :total_soft_skills, :sections, :raw_text,
+                    (SELECT COALESCE(MAX(revision), 0) + 1 FROM candidates), :now, :now)
+                ON CONFLICT (source, filename) DO UPDATE SET
+                    file_path=excluded.file_path, content_hash=excluded.content_hash,
+                    size=excluded.size, name=excluded.name, email=excluded.email,
+                    phone=excluded.phone, linkedin=excluded.linkedin, github=excluded.github,
+                    location=excluded.location,
+                    total_technical_skills=excluded.total_technical_skills,
+                    total_soft_skills=excluded.total_soft_skills,
+                    sections=excluded.sections, raw_text=excluded.raw_text,
+                    revision=excluded.revision, updated_at=excluded.updated_at
+                RETURNING id
+                """,
+                row
+            ).fetchone()[0]
+
+            pairs = [(category, name) for category, names in technical.items() for name in names]
+            pairs += [(SOFT_CATEGORY, name) for name in soft]
+
+            conn.execute("DELETE FROM candidate_skills WHERE candidate_id = ?", (candidate_id,))
+            conn.executemany("INSERT OR IGNORE INTO skills (category, name) VALUES (?, ?)", pairs)
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO candidate_skills (candidate_id, skill_id, position)
+                SELECT ?, id, ? FROM skills WHERE category = ? AND name = ?
+                """,
+                [(candidate_id, position, category, name) for position, (category, name) in enumerate(pairs)]
+            )
+        return candidate_id
+
+    def delete(self, filename, source='uploaded'):
+        """Delete a candidate; returns the removed candidate's id, or None"""
+        with self.conn as conn:
+            row = conn.execute(
+                "DELETE FROM candidates WHERE source = ? AND filename = ? RETURNING id", (source, filename)
+            ).fetchone()
+        return row[0] if row else None
+
+    def import_sidecars(self, folder, source='uploaded'):
+        """Import legacy <filename>.json results saved next to uploaded resumes"""
+        imported = 0
+        for json_path in sorted(Path(folder).glob('*.json')):
+            resume_path = json_path.with_suffix('')
+            try:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    result = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if not isinstance(result, dict) or 'entities' not in result:
+                continue
+
+            size = resume_path.stat().st_size if resume_path.exists() else None
+            self.upsert(result, resume_path.name, source, file_path=resume_path, size=size)
+            imported += 1
+        return imported
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def count(self, source=None):
+        if source is None:
+            return self.conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM candidates WHERE source = ?", (source,)).fetchone()[0]
+
+    def ids(self, source=None):
+        """All candidate ids, optionally for one source"""
+        if source is None:
+            return [row[0] for row in self.conn.execute("SELECT id FROM candidates ORDER BY id")]
+        return [row[0] for row in self.conn.execute("SELECT id FROM candidates WHERE source = ? ORDER BY id", (source,))]
+
+    def revisions(self, source=None):
+        """Candidate id -> revision, optionally for one source"""
+        if source is None:
+            return dict(self.conn.execute("SELECT id, revision FROM candidates"))
+        return dict(self.conn.execute("SELECT id, revision FROM candidates WHERE source = ?", (source,)))
+
+    def contains(self, filename, source='uploaded'):
+        row = self.conn.execute(
+            "SELECT 1 FROM candidates WHERE source = ? AND filename = ?", (source, filename)
+        ).fetchone()
+        return row is not None
+
+    def find_by_hash(self, content_hash, source=None):
+        """Filename of a stored resume with this content hash, or None"""
+        sql = "SELECT filename FROM candidates WHERE content_hash = ?"
+        params = [content_hash]
+        if source is not None:
+            sql += " AND source = ?"
+            params.append(source)
+        row = self.conn.execute(sql + " LIMIT 1", params).fetchone()
+        return row[0] if row else None
+
+    def list_candidates(self, source=None, limit=None, offset=0):
+        """Lightweight listing rows (no raw text or skills)"""
+        sql = f"SELECT {_LIST_COLUMNS} FROM candidates"
+        params = []
+        if source is not None:
+            sql += " WHERE source = ?"
+            params.append(source)
+        sql += " ORDER BY id LIMIT ? OFFSET ?"
+        params += [-1 if limit is None else limit, offset]
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def get(self, filename, source='uploaded'):
+        """Full record for one candidate, or None"""
+        rows = list(self._iter_records("c.source = ? AND c.filename = ?", (source, filename)))
+        return rows[0] if rows else None
+
+    def iter_candidates(self, source=None, ids=None):
+        """Yield full records in id order, optionally restricted to a source or id list"""
+        where, params = [], []
+        if source is not None:
+            where.append("c.source = ?")
+            params.append(source)
+        if ids is not None:
+            ids = list(ids)
+            if not ids:
+                return
+            # Bind the ids as one JSON array so any number fits in a single parameter
+            where.append("c.id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps([int(i) for i in ids]))
+        yield from self._iter_records(" AND ".join(where) or "1", params)
+
+    def search(self, query, limit=50, source=None):
+        """Candidate ids whose raw text matches a full-text query, best first"""
+        if self.has_fts:
+            sql = """
+                SELECT c.id FROM candidates_fts f JOIN candidates c ON c.id = f.rowid
+                WHERE candidates_fts MATCH ?
+            """
+            params = [query]
+            if source is not None:
+                sql += " AND c.source = ?"
+                params.append(source)
+            sql += " ORDER BY f.rank LIMIT ?"
+        else:
+            sql = "SELECT id FROM candidates WHERE raw_text LIKE ?"
+            params = [f"%{query}%"]
+            if source is not None:
+                sql += " AND source = ?"
+                params.append(source)
+            sql += " LIMIT ?"
+        params.append(limit)
+        return [row[0] for row in self.conn.execute(sql, params)]
+
+    def _iter_records(self, where, params):
+        """Merge-join candidates with their skills, both streamed in id order"""
+        conn = self.conn
+        candidates = conn.execute(f"SELECT * FROM candidates c WHERE {where} ORDER BY c.id", params)
+        skills = conn.execute(
+            f"""
+            SELECT cs.candidate_id, s.category, s.name
+            FROM candidate_skills cs
+            JOIN skills s ON s.id = cs.skill_id
+            JOIN candidates c ON c.id = cs.candidate_id
+            WHERE {where}
+            ORDER BY cs.candidate_id, cs.position
+            """,
+            params
+        )
+
+        pending = skills.fetchone()
+        for row in candidates:
+            technical, soft = {}, []
+            while pending is not None and pending[0] < row['id']:
+                pending = skills.fetchone()
+            while pending is not None and pending[0] == row['id']:
+                if pending[1] == SOFT_CATEGORY:
+                    soft.append(pending[2])
+                else:
+                    technical.setdefault(pending[1], []).append(pending[2])
+                pending = skills.fetchone()
+            yield self._to_record(row, technical, soft)
+
+    def _to_record(self, row, technical, soft):
+        """Rebuild the ResumeNLPEngine.process_resume result shape"""
+        entities = {col: row[col] for col in ENTITY_COLUMNS}
+        return {
+            'id': row['id'],
+            'filename': row['filename'],
+            'source': row['source'],
+            'file_path': row['file_path'],
+            'raw_text': row['raw_text'],
+            'revision': row['revision'],
+            'entities': entities,
+            'skills': {'technical': technical, 'soft': soft},
+            'sections': json.loads(row['sections'] or '{}'),
+            'summary': {
+                'name': entities['name'],
+                'email': entities['email'],
+                'phone': entities['phone'],
+                'total_technical_skills': row['total_technical_skills'],
+                'total_soft_skills': row['total_soft_skills'],
+                'has_linkedin': entities['linkedin'] is not None,
+                'has_github': entities['github'] is not None
+            }
+        }
@@ -1,39 +1,286 @@
 """
 Flask Web Application for Smart Recruitment System
 """
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, url_for
 from werkzeug.utils import secure_filename
 import os
 from pathlib import Path
-import json
 import sys
+import threading
+import time
+import atexit
+import numpy as np
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from src.nlp_engine.resume_parser import ResumeParser
-from src.ranking.ranking_engine import RankingEngine
+from src.nlp_engine.parse_sandbox import ParseSandbox, ParseError
+from src.storage import CandidateStore
+from src.ingestion import IngestionQueue, IngestionWorkers, BulkUpload
+from src.ranking.ranking_engine import RankingEngine, SEMANTIC_WINDOW, parse_page
+from src.ranking.skill_bitmap_index import SkillBitmapIndex, parse_skill_match
+from src.ranking.job_matcher import JobMatcher
+from src.ranking.tfidf_index import TfidfIndex
+from src.ranking.semantic_index import HashedEmbedder, IVFIndex
+from src.ui.engine_registry import EngineRegistry
+from config.settings import (TFIDF_INDEX_DIR, SEMANTIC_INDEX_PATH, MATCH_INDEX_SAVE_INTERVAL,
+                             BULK_UPLOAD_MAX_BYTES, BULK_UPLOAD_MAX_FILES, ANALYTICS_STATE_PATH,
+                             ANALYTICS_SAVE_INTERVAL)
 from src.analytics.dashboard_generator import DashboardGenerator
+from src.analytics.analytics_state import AnalyticsState
 
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = 'data/uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max
 
-# Initialize components (lazy load face_detector to avoid deepface import)
-face_detector = None
-resume_parser = ResumeParser()
-ranking_engine = RankingEngine()
+# Initialize components
+# Uploaded files are parsed in reusable worker processes with a timeout and memory cap
+parse_sandbox = ParseSandbox()
+atexit.register(parse_sandbox.close)
+
+def _build_ranking_engine():
+    # Job matching scores against persisted TF-IDF and embedding (ANN) indexes of every candidate
+    embedder = HashedEmbedder()
+    return RankingEngine(JobMatcher(TfidfIndex.load(TFIDF_INDEX_DIR),
+                                    IVFIndex.load(SEMANTIC_INDEX_PATH, embedder.dim, auto_train=False), embedder))
+
+def _build_face_detector():
+    # Imported here so OpenCV is only loaded once a photo is checked
+    from .simple_face_detector import OpenCVFaceDetector
+    return OpenCVFaceDetector()
+
+# Engines are built once and shared by every request; GET /api/engines shows build times
+engines = EngineRegistry()
+engines.register('ranking', _build_ranking_engine)
+engines.register('face_detector', _build_face_detector, per_thread=True)  # OpenCV classifiers are not thread-safe
+# Build the shared engines at startup so no request waits for them
+engines.warm_up()
+ranking_engine = engines.get('ranking')
+_match_lock = threading.Lock()
+_match_saved_at = time.monotonic()
+_semantic_training = threading.Lock()  # held while a background k-means run is in flight
 dashboard_gen = DashboardGenerator()
+# Dashboard analytics over every stored candidate, updated as candidates are added or removed
+analytics_state = AnalyticsState.load(ANALYTICS_STATE_PATH)
+_analytics_saved_at = time.monotonic()
+atexit.register(lambda: save_analytics(force=True))
+
+# Parsed candidates live in SQLite; resume files stay on disk for viewing
+candidate_store = CandidateStore()
+RESUME_FOLDERS = {'uploaded': Path('data/resumes/uploaded'), 'test': Path('data/resumes/test')}
+RESUME_FORMATS = ['.pdf', '.docx', '.txt']
+_store_synced = False
+_store_sync_lock = threading.Lock()
+
+# Skill -> candidate bitmaps per source, built from the store on first use
+skill_indexes = {}
+_skill_index_lock = threading.Lock()
+
+# Scoring features per source, so ranking requests never rescan resume text
+candidate_features = {}
+_features_lock = threading.Lock()
+
+# Uploads are parsed by background worker processes fed from a SQLite job table
+ingest_queue = IngestionQueue()
+ingest_workers = IngestionWorkers(queue=ingest_queue)
+atexit.register(ingest_workers.close)
+_ingest_seq = ingest_queue.last_seq()  # last finished job already applied to the in-memory indexes
+_ingest_lock = threading.Lock()
 
 # Ensure upload folder exists
 Path(app.config['UPLOAD_FOLDER']).mkdir(parents=True, exist_ok=True)
 
+def ensure_store_synced():
+    """Reconcile the store with the resume folders and the in-memory indexes with the store (once per process)
+
+    Files that are neither stored nor known to the ingestion queue are
+    queued for the background workers rather than parsed here; files with
+    a job in any state (queued, processing, done or failed) are left alone.
+    """
+    global _store_synced
+    if _store_synced:
+        apply_ingested()
+        return
+    with _store_sync_lock:
+        if _store_synced:
+            return
+
+        # Migrate legacy <filename>.json sidecars saved by earlier versions
+        if candidate_store.count('uploaded') == 0 and RESUME_FOLDERS['uploaded'].exists():
+            candidate_store.import_sidecars(RESUME_FOLDERS['uploaded'], 'uploaded')
+
+        queued = 0
+        for source, folder in RESUME_FOLDERS.items():
+            if not folder.exists():
+                continue
+            known = ingest_queue.filenames(source)
+            missing = [(file.resolve(), file.name, None) for file in folder.glob('*')
+                       if file.suffix.lower() in RESUME_FORMATS and file.name not in known
+                       and not candidate_store.contains(file.name, source)]
+            queued += len(ingest_queue.enqueue_many(missing, source))
+        if queued:
+            ingest_workers.ensure_running()
+        sync_match_indexes()
+        sync_analytics()
+        _store_synced = True
+
+def sync_match_indexes():
+    """Reconcile the persisted match indexes with the store, e.g. after a crash before a save
+
+    Candidates re-parsed since the indexes were saved carry a newer store
+    revision than the one indexed, and are re-indexed like missing ones.
+    """
+    matcher = ranking_engine.matcher
+    with _match_lock:
+        revisions = candidate_store.revisions()
+        indexed = set(matcher.index.ids) | set(matcher.semantic_index.ids)
+        for doc_id in indexed - set(revisions):
+            matcher.remove_candidate(doc_id)
+        stale = [doc_id for doc_id, revision in revisions.items()
+                 if matcher.index.revisions.get(doc_id) != revision
+                 or matcher.semantic_index.revisions.get(doc_id) != revision]
+        for candidate in candidate_store.iter_candidates(ids=stale):
+            matcher.add_candidate(candidate)
+    save_match_indexes(force=True)
+    train_semantic_index()
+
+def save_match_indexes(force=False):
+    """Persist the match indexes if they changed, at most once per MATCH_INDEX_SAVE_INTERVAL"""
+    global _match_saved_at
+    with _match_lock:
+        matcher = ranking_engine.matcher
+        if not (matcher.index.dirty or matcher.semantic_index.dirty):
+            return
+        if force or time.monotonic() - _match_saved_at >= MATCH_INDEX_SAVE_INTERVAL:
+            if matcher.index.dirty:
+                matcher.index.save(TFIDF_INDEX_DIR)
+            if matcher.semantic_index.dirty:
+                matcher.semantic_index.save(SEMANTIC_INDEX_PATH)
+            _match_saved_at = time.monotonic()
+
+def train_semantic_index():
+    """Start clustering the semantic index in a background thread once it has grown enough
+
+    k-means runs on a snapshot without the match lock; only installing the
+    new clusters holds it, so match requests never wait for training.
+    """
+    index = ranking_engine.matcher.semantic_index
+    with _match_lock:
+        if not index.needs_training or not _semantic_training.acquire(blocking=False):
+            return
+    threading.Thread(target=_train_semantic_index, args=(index,), daemon=True).start()
+
+def _train_semantic_index(index):
+    try:
+        with _match_lock:
+            snapshot = index.snapshot()
+        centroids, labels = index.fit(snapshot[2])
+        with _match_lock:
+            index.apply_training(snapshot, centroids, labels)
+    finally:
+        _semantic_training.release()
+    save_match_indexes()
+
+def sync_analytics():
+    """Reconcile the persisted analytics state with the store"""
+    store_ids = {str(candidate_id) for candidate_id in candidate_store.ids()}
+    for candidate_id in set(analytics_state.ids) - store_ids:
+        analytics_state.remove(candidate_id)
+    missing = [int(candidate_id) for candidate_id in store_ids - set(analytics_state.ids)]
+    analytics_state.add_many((c['id'], c, *_profile_score(c), None)
+                             for c in candidate_store.iter_candidates(ids=missing))
+    save_analytics(force=True)
+
+def save_analytics(force=False):
+    """Persist the analytics state if it changed, at most once per ANALYTICS_SAVE_INTERVAL"""
+    global _analytics_saved_at
+    if analytics_state.dirty and (force or time.monotonic() - _analytics_saved_at >= ANALYTICS_SAVE_INTERVAL):
+        analytics_state.save(ANALYTICS_STATE_PATH)
+        _analytics_saved_at = time.monotonic()
+
+def _profile_score(candidate):
+    """Job-independent (score, grade) shown on the dashboard"""
+    score = ranking_engine.scorer.score_candidate(candidate, {})
+    return score['total_score'], score['grade']
+
+def get_skill_index(source):
+    """Inverted skill index for a source, built once and then kept up to date"""
+    with _skill_index_lock:
+        if source not in skill_indexes:
+            skill_indexes[source] = SkillBitmapIndex.from_store(candidate_store, source)
+        return skill_indexes[source]
+
+def get_candidate_features(source):
+    """Scoring features for a source, extracted once and dropped when the source changes"""
+    with _features_lock:
+        if source not in candidate_features:
+            candidates = candidate_store.iter_candidates(source)
+            candidate_features[source] = ranking_engine.scorer.extract_features(list(candidates))
+        return candidate_features[source]
+
+def _align(ids, values, target_ids, default=0):
+    """Reorder values keyed by ids to follow target_ids"""
+    order = np.argsort(ids)
+    sorted_ids = ids[order]
+    pos = np.clip(np.searchsorted(sorted_ids, target_ids), 0, max(len(ids) - 1, 0))
+    found = (sorted_ids[pos] == target_ids) if len(ids) else np.zeros(len(target_ids), dtype=bool)
+    return np.where(found, values[order][pos] if len(ids) else default, default)
+
+def apply_ingested():
+    """Add candidates stored by ingestion workers since the last call to the in-memory indexes"""
+    global _ingest_seq
+    with _ingest_lock:
+        finished = ingest_queue.finished_since(_ingest_seq)
+        if not finished:
+            return
+        ids = [job['candidate_id'] for job in finished]
+        for candidate in candidate_store.iter_candidates(ids=ids):
+            _index_candidate(candidate)
+        _ingest_seq = finished[-1]['done_seq']
+    save_match_indexes()
+    train_semantic_index()
+    save_analytics()
+
+def _index_candidate(candidate):
+    """Bring one stored candidate (with 'id' and 'source') into the skill, feature and match indexes"""
+    source = candidate['source']
+    with _skill_index_lock:
+        if source in skill_indexes:
+            skill_indexes[source].add(candidate['id'], _technical_skills(candidate))
+    with _features_lock:
+        candidate_features.pop(source, None)
+    with _match_lock:
+        ranking_engine.matcher.add_candidate(candidate)
+    analytics_state.add(candidate['id'], candidate, *_profile_score(candidate))
+
+def _resume_summary(result):
+    """Contact details and skills shown after an upload"""
+    entities = result.get('entities', {})
+    skills = _all_skills(result)
+    return {
+        'email': entities.get('email'),
+        'phone': entities.get('phone'),
+        'name': entities.get('name'),
+        'linkedin': entities.get('linkedin'),
+        'github': entities.get('github'),
+        'skills': list(set(skills)),
+        'total_skills': len(skills)
+    }
+
+def _technical_skills(result):
+    """Skills required-skill filters and scoring match against"""
+    return [s for cat in result.get('skills', {}).get('technical', {}).values() for s in cat]
+
+def _all_skills(result):
+    return _technical_skills(result) + result.get('skills', {}).get('soft', [])
+
 @app.route('/')
 def index():
     return render_template('index.html')
 
 @app.route('/upload_resume', methods=['POST'])
 def upload_resume():
+    """Save the file and queue it for parsing; poll /api/ingest/<job_id> for the result"""
     try:
         if 'resume' not in request.files:
             return jsonify({'success': False, 'error': 'No file uploaded'}), 400
@@ -44,62 +291,86 @@ def upload_resume():
         
         filename = secure_filename(file.filename)
         
-        # Save to uploads folder (temporary)
-        upload_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(upload_path)
-        
-        # Parse resume using NLP engine
-        from src.nlp_engine import ResumeNLPEngine
-        nlp_engine = ResumeNLPEngine()
-        result = nlp_engine.process_resume(upload_path)
-        
-        # Save to permanent storage for ranking
-        permanent_folder = Path('data/resumes/uploaded')
+        # Save straight to permanent storage; a background worker parses and stores it
+        permanent_folder = RESUME_FOLDERS['uploaded']
         permanent_folder.mkdir(parents=True, exist_ok=True)
-        permanent_path = permanent_folder / filename
+        permanent_path = (permanent_folder / filename).resolve()
+        file.save(permanent_path)
         
-        # Copy to permanent storage
-        import shutil
-        shutil.copy2(upload_path, permanent_path)
-        
-        # Save parsed data as JSON
-        import json
-        json_path = permanent_folder / f"{filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(result, f, indent=2)
-        
-        # Extract data for response
-        entities = result.get('entities', {})
-        skills = result.get('skills', {})
-        
-        # Count total skills
-        tech_count = sum(len(v) for v in skills.get('technical', {}).values())
-        soft_count = len(skills.get('soft', []))
-        total_skills = tech_count + soft_count
+        job_id = ingest_queue.enqueue(permanent_path, filename, 'uploaded')
+        ingest_workers.ensure_running()
         
         return jsonify({
             'success': True,
             'filename': filename,
-            'stored': True,
-            'data': {
-                'email': entities.get('email'),
-                'phone': entities.get('phone'),
-                'name': entities.get('name'),
-                'linkedin': entities.get('linkedin'),
-                'github': entities.get('github'),
-                'skills': list(set(
-                    [s for cat in skills.get('technical', {}).values() for s in cat] +
-                    skills.get('soft', [])
-                )),
-                'total_skills': total_skills
-            }
-        })
+            'job_id': job_id,
+            'status': 'queued',
+            'status_url': url_for('ingest_status', job_id=job_id)
+        }), 202
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+@app.route('/upload_resumes', methods=['POST'])
+def upload_resumes():
+    """Bulk upload: any number of 'resumes' files and/or zip archives, queued for parallel parsing"""
+    # Raise the app-wide limits for this request only, before the form is parsed
+    request.max_content_length = BULK_UPLOAD_MAX_BYTES
+    request.max_form_parts = BULK_UPLOAD_MAX_FILES + 100
+    try:
+        files = [f for f in request.files.getlist('resumes') if f.filename]
+        if not files:
+            return jsonify({'success': False, 'error': 'No files uploaded'}), 400
+        
+        bulk = BulkUpload(RESUME_FOLDERS['uploaded'], candidate_store, ingest_queue, 'uploaded')
+        for file in files:
+            bulk.add(file)
+        job_ids = bulk.commit()
+        if job_ids:
+            ingest_workers.ensure_running()
+        
+        return jsonify({'success': True, **bulk.summary(), 'status_url': url_for('ingest_overview')}), 202
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/ingest/<int:job_id>')
+def ingest_status(job_id):
+    """Progress of one upload: queued (with queue position), processing (stage), done or failed"""
+    job = ingest_queue.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    if job['status'] in ('queued', 'processing'):
+        ingest_workers.ensure_running()
+    
+    response = {
+        'success': True,
+        'job_id': job_id,
+        'filename': job['filename'],
+        'status': job['status'],
+        'stage': job['stage'],
+        'position': job.get('position'),
+        'error': job['error'],
+        'created_at': job['created_at'],
+        'started_at': job['started_at'],
+        'finished_at': job['finished_at']
+    }
+    if job['status'] == 'done':
+        apply_ingested()
+        record = candidate_store.get(job['filename'], job['source'])
+        if record is not None:
+            response['data'] = _resume_summary(record)
+    return jsonify(response)
+
+@app.route('/api/ingest')
+def ingest_overview():
+    """Job counts per status and the number of running workers"""
+    return jsonify({'jobs': ingest_queue.counts(), 'workers': ingest_workers.alive()})
+
 @app.route('/verify_face', methods=['POST'])
 def verify_face():
     if 'image' not in request.files:
@@ -111,9 +382,7 @@ def verify_face():
     file.save(filepath)
     
     try:
-        from .simple_face_detector import OpenCVFaceDetector
-        detector = OpenCVFaceDetector()
-        faces = detector.detect_faces(filepath)
+        faces = engines.get('face_detector').detect_faces(filepath)
         
         return jsonify({
             'success': True,
@@ -132,6 +401,12 @@ def rank_candidates():
         data = request.json
         job_desc = data.get('job_description', '')
         use_uploaded = data.get('use_uploaded', True)  # Use uploaded resumes by default
+        required_skills = data.get('required_skills', [])
+        try:
+            skill_match = parse_skill_match(data.get('skill_match', 'all'))  # 'all', 'any' or minimum number of skills
+            limit, offset = parse_page(data)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         
         if not job_desc.strip():
             return jsonify({
@@ -139,53 +414,46 @@ def rank_candidates():
                 'error': 'Job description is required'
             }), 400
         
-        # Process resumes from uploaded folder
-        from src.nlp_engine import ResumeNLPEngine
-        from pathlib import Path
+        ensure_store_synced()
         
-        nlp_engine = ResumeNLPEngine()
-        candidates = []
+        # Use uploaded resumes unless asked for the test set
+        source = 'uploaded' if use_uploaded else 'test'
+        features = get_candidate_features(source)
+        skill_counts = include = None
         
-        # Check uploaded folder first
-        uploaded_path = Path('data/resumes/uploaded')
-        test_path = Path('data/resumes/test')
+        if required_skills:
+            # Filter and count required skills on the bitmap index
+            skill_index = get_skill_index(source)
+            with _skill_index_lock:
+                ids = skill_index.filter(required_skills, skill_match)
+                all_ids, counts = skill_index.match_counts(required_skills)
+            feature_ids = np.asarray(features.ids, dtype=np.int64)
+            include = np.isin(feature_ids, ids)
+            skill_counts = _align(all_ids, counts, feature_ids)
         
-        # Use uploaded folder if it exists and has files
-        if use_uploaded and uploaded_path.exists():
-            resume_path = uploaded_path
-        elif test_path.exists():
-            resume_path = test_path
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'No resume folders found'
-            }), 404
+        # Score everyone, but build payloads only for the requested page
+        job_requirements = {'required_skills': required_skills, 'min_experience': 0}
+        page, total = ranking_engine.rank_page(features, job_requirements, limit, offset, skill_counts, include)
         
-        # Process all resumes in folder
-        for file in resume_path.glob('*'):
-            if file.suffix.lower() in ['.pdf', '.docx', '.txt']:
-                try:
-                    candidate_data = nlp_engine.process_resume(str(file))
-                    candidates.append(candidate_data)
-                except Exception:
-                    continue
-        
-        if not candidates:
+        if not len(features):
             return jsonify({
                 'success': True,
                 'candidates': [],
-                'message': f'No valid resumes found in {resume_path.name}'
+                'total': 0,
+                'message': f'No valid resumes found in {source}'
             })
         
-        # Rank candidates
-        job_requirements = {'required_skills': [], 'min_experience': 0}
-        results = ranking_engine.rank_candidates(candidates, job_requirements)
+        page_candidates = {c['id']: c for c in candidate_store.iter_candidates(source, ids=[row['id'] for row in page])}
+        results = [ranking_engine.page_payload(page_candidates[row['id']], row)
+                   for row in page if row['id'] in page_candidates]
         
         return jsonify({
             'success': True,
             'candidates': results,
-            'total': len(results),
-            'source': resume_path.name
+            'total': total,
+            'offset': offset,
+            'limit': limit,
+            'source': source
         })
     except Exception as e:
         return jsonify({
@@ -193,35 +461,92 @@ def rank_candidates():
             'error': str(e)
         }), 500
 
+@app.route('/api/match_job', methods=['POST'])
+def match_job():
+    """Top-k candidates for a job description by text similarity plus requirements score"""
+    try:
+        data = request.json
+        job_desc = data.get('job_description', '')
+        mode = data.get('mode', 'semantic')  # 'semantic' (ANN over embeddings) or 'tfidf'
+        try:
+            limit, offset = parse_page(data)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        if mode == 'semantic' and offset >= SEMANTIC_WINDOW:
+            return jsonify({'success': False, 'error': f'Semantic matching returns the top {SEMANTIC_WINDOW} '
+                                                       f'candidates; offset must be below {SEMANTIC_WINDOW}',
+                            'window': SEMANTIC_WINDOW}), 400
+        
+        if not job_desc.strip():
+            return jsonify({'success': False, 'error': 'Job description is required'}), 400
+        if mode not in ('semantic', 'tfidf'):
+            return jsonify({'success': False, 'error': f'Unknown mode: {mode}'}), 400
+        
+        ensure_store_synced()
+        job_requirements = {'required_skills': data.get('required_skills', []), 'min_experience': 0}
+        
+        # Similarities come back as fresh arrays, so the lock is held only while the index is read
+        matcher = ranking_engine.matcher
+        with _match_lock:
+            if mode == 'semantic':
+                # One fixed window of neighbours, whatever the offset, so pages never overlap
+                hits = matcher.match_semantic(job_desc, SEMANTIC_WINDOW)
+                matched_ids = np.array([doc_id for doc_id, _ in hits], dtype=np.int64)
+                similarity = np.array([score for _, score in hits])
+            else:
+                matched_ids, similarity = matcher.index.scores(job_desc)
+                matched_ids = np.asarray(matched_ids, dtype=np.int64)
+                similarity = np.round(similarity * 100, 2)
+        
+        # Requirements are scored from the cached features; only the page is loaded from the store
+        features = [get_candidate_features(source) for source in ('uploaded', 'test')]
+        feature_ids = np.asarray([doc_id for f in features for doc_id in f.ids], dtype=np.int64)
+        include = np.isin(feature_ids, matched_ids) if mode == 'semantic' else None
+        page, total = ranking_engine.match_page(features, job_requirements, _align(matched_ids, similarity, feature_ids),
+                                            limit, offset, include)
+        
+        page_candidates = {c['id']: c for c in candidate_store.iter_candidates(ids=[row['id'] for row in page])}
+        results = [ranking_engine.match_payload(page_candidates[row['id']], row)
+                   for row in page if row['id'] in page_candidates]
+        
+        response = {
+            'success': True,
+            'candidates': results,
+            'total': total,
+            'offset': offset,
+            'limit': limit,
+            'mode': mode
+        }
+        if mode == 'semantic':
+            # total never exceeds the window; paging past it needs a narrower job description
+            response['window'] = SEMANTIC_WINDOW
+        return jsonify(response)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/dashboard')
 def dashboard():
-    # Load analytics data
-    analytics_path = 'data/processed/dashboard_analytics.json'
-    if Path(analytics_path).exists():
-        with open(analytics_path, 'r') as f:
-            analytics = json.load(f)
-    else:
-        # Default empty analytics structure
-        analytics = {
-            'overview': {
-                'total_candidates': 0,
-                'average_score': 0.0,
-                'score_range': {'min': 0, 'max': 0}
-            },
-            'skills_distribution': {'top_skills': []},
-            'grade_distribution': {},
-            'top_candidates': []
-        }
-    
-    return render_template('dashboard.html', analytics=analytics)
+    ensure_store_synced()
+    return render_template('dashboard.html', analytics=analytics_state.analytics())
 
 @app.route('/api/analytics')
 def get_analytics():
-    analytics_path = 'data/processed/dashboard_analytics.json'
-    if Path(analytics_path).exists():
-        with open(analytics_path, 'r') as f:
-            return jsonify(json.load(f))
-    return jsonify({'error': 'No analytics data available'}), 404
+    """Current analytics, kept up to date as candidates are added or removed"""
+    ensure_store_synced()
+    return jsonify(analytics_state.analytics())
+
+@app.route('/api/parse_status')
+def parse_status():
+    """Sandboxed parser pool counters and the most recent parse failures with their reasons"""
+    return jsonify(parse_sandbox.stats())
+
+@app.route('/api/engines')
+def engine_status():
+    """Shared engines: whether each is built, how long building took and when"""
+    return jsonify(engines.stats())
 
 @app.route('/api/visualizations/<chart_name>')
 def get_visualization(chart_name):
@@ -233,33 +558,15 @@ def get_visualization(chart_name):
 @app.route('/api/resumes')
 def list_resumes():
     """List all available resumes"""
-    import os
-    base_dir = Path(os.getcwd())
-    resumes = []
-    
-    # Check uploaded folder
-    uploaded_path = base_dir / 'data/resumes/uploaded'
-    if uploaded_path.exists():
-        for file in uploaded_path.glob('*'):
-            if file.suffix.lower() in ['.pdf', '.docx', '.txt']:
-                resumes.append({
-                    'filename': file.name,
-                    'path': str(file),
-                    'size': file.stat().st_size,
-                    'source': 'uploaded'
-                })
+    ensure_store_synced()
     
-    # Check test folder
-    test_path = base_dir / 'data/resumes/test'
-    if test_path.exists():
-        for file in test_path.glob('*'):
-            if file.suffix.lower() in ['.pdf', '.docx', '.txt']:
-                resumes.append({
-                    'filename': file.name,
-                    'path': str(file),
-                    'size': file.stat().st_size,
-                    'source': 'test'
-                })
+    resumes = [{
+        'filename': row['filename'],
+        'path': row['file_path'],
+        'size': row['size'],
+        'source': row['source'],
+        'name': row['name']
+    } for row in candidate_store.list_candidates()]
     
     return jsonify({'resumes': resumes, 'total': len(resumes)})
 
@@ -285,11 +592,25 @@ def delete_resume(filename):
     import os
     base_dir = Path(os.getcwd())
     
-    # Check uploaded folder first
+    # Check uploaded resumes first
     uploaded_path = base_dir / 'data/resumes/uploaded' / filename
+    deleted = candidate_store.delete(filename, 'uploaded')
+    if deleted:
+        with _skill_index_lock:
+            if 'uploaded' in skill_indexes:
+                skill_indexes['uploaded'].remove(deleted)
+        with _features_lock:
+            candidate_features.pop('uploaded', None)
+        with _match_lock:
+            ranking_engine.matcher.remove_candidate(deleted)
+        save_match_indexes()
+        analytics_state.remove(deleted)
+        save_analytics()
     if uploaded_path.exists():
         uploaded_path.unlink()
-        # Also delete JSON if exists
+        deleted = True
+    if deleted:
+        # Also delete legacy JSON sidecar if it exists
         json_path = base_dir / 'data/resumes/uploaded' / f"{filename}.json"
         if json_path.exists():
             json_path.unlink()
@@ -297,7 +618,7 @@ def delete_resume(filename):
     
     # Check test folder (only if not in uploaded)
     test_path = base_dir / 'data/resumes/test' / filename
-    if test_path.exists():
+    if test_path.exists() or candidate_store.contains(filename, 'test'):
         return jsonify({'success': False, 'error': 'Cannot delete test resumes'}), 403
     
     return jsonify({'success': False, 'error': 'Resume not found'}), 404
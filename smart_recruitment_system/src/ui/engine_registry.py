@@ -0,0 +1,74 @@
+"""
+Engine Registry - Application-scoped engines built once and shared by all requests
+
+Each engine is registered with a factory. The first get() builds it,
+under a per-engine lock so concurrent requests wait for one build
+instead of racing to start their own, and later calls return the same
+instance. Engines that must not be shared between threads (OpenCV
+classifiers) are registered with per_thread=True and built once per
+request thread. stats() reports how long each build took.
+"""
+import threading
+import time
+from datetime import datetime
+
+
+class EngineRegistry:
+    def __init__(self):
+        self._factories = {}
+        self._engines = {}
+        self._build_locks = {}
+        self._local = threading.local()
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    def register(self, name, factory, per_thread=False):
+        """Add an engine; nothing is built until the first get()"""
+        self._factories[name] = (factory, per_thread)
+        self._build_locks[name] = threading.Lock()
+        self._stats[name] = {'per_thread': per_thread, 'builds': 0, 'build_seconds': None,
+                             'total_build_seconds': 0.0, 'built_at': None, 'error': None}
+
+    def get(self, name):
+        """The shared engine (or this thread's copy), built on first use"""
+        factory, per_thread = self._factories[name]
+        if per_thread:
+            engines = self._local.__dict__.setdefault('engines', {})
+            if name not in engines:
+                engines[name] = self._build(name, factory)
+            return engines[name]
+
+        engine = self._engines.get(name)
+        if engine is None:
+            with self._build_locks[name]:
+                engine = self._engines.get(name)
+                if engine is None:
+                    engine = self._engines[name] = self._build(name, factory)
+        return engine
+
+    def _build(self, name, factory):
+        stats = self._stats[name]
+        start = time.perf_counter()
+        try:
+            engine = factory()
+        except Exception as e:
+            # Not cached: the next get() tries again
+            stats['error'] = f"{type(e).__name__}: {e}"
+            raise
+        seconds = time.perf_counter() - start
+        with self._stats_lock:
+            stats.update(builds=stats['builds'] + 1, build_seconds=round(seconds, 4),
+                         total_build_seconds=round(stats['total_build_seconds'] + seconds, 4),
+                         built_at=datetime.now().isoformat(timespec='seconds'), error=None)
+        print(f"✅ Built {name} engine in {seconds:.2f}s")
+        return engine
+
+    def warm_up(self, *names):
+        """Build engines now (all registered ones by default) so the first request does not wait"""
+        for name in names or list(self._factories):
+            if not self._factories[name][1]:
+                self.get(name)
+
+    def stats(self):
+        with self._stats_lock:
+            return {name: {**stats, 'built': stats['builds'] > 0} for name, stats in self._stats.items()}
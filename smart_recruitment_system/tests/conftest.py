@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests import the project as the app does: `src.*` and `config.*` from the project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
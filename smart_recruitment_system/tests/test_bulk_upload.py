@@ -0,0 +1,49 @@
+import io
+import zipfile
+
+from werkzeug.datastructures import FileStorage
+
+from src.ingestion.bulk_upload import BulkUpload
+
+
+class FakeStore:
+    def __init__(self, filenames=()):
+        self.filenames = set(filenames)
+
+    def contains(self, filename, source='uploaded'):
+        return filename in self.filenames
+
+    def find_by_hash(self, content_hash, source=None):
+        return None
+
+
+class FakeQueue:
+    def pending_with_hash(self, content_hash):
+        return None
+
+    def enqueue_many(self, files, source='uploaded'):
+        return list(range(1, len(files) + 1))
+
+
+def _zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    buffer.seek(0)
+    return FileStorage(buffer, filename='batch.zip')
+
+
+def test_existing_resumes_are_never_overwritten(tmp_path):
+    (tmp_path / 'resume.txt').write_text('already on disk')
+    bulk = BulkUpload(tmp_path, FakeStore({'stored.txt'}), FakeQueue())
+    bulk.add(_zip({'resume.txt': 'new resume', 'stored.txt': 'another resume',
+                   'a/cv.txt': 'first cv', 'b/cv.txt': 'second cv'}))
+    bulk.commit()
+
+    assert (tmp_path / 'resume.txt').read_text() == 'already on disk'
+    saved = {row['name']: row['filename'] for row in bulk.summary()['files']}
+    assert saved == {'batch.zip/resume.txt': 'resume_2.txt', 'batch.zip/stored.txt': 'stored_2.txt',
+                     'batch.zip/a/cv.txt': 'cv.txt', 'batch.zip/b/cv.txt': 'b_cv.txt'}
+    assert (tmp_path / 'resume_2.txt').read_text() == 'new resume'
+    assert not list(tmp_path.glob('.upload-*'))
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from src.ranking.candidate_scorer import CandidateScorer
+from src.ranking.skill_bitmap_index import SkillBitmapIndex
+
+CANDIDATES = [
+    {'id': 1, 'raw_text': 'Led a team for 5 years. Bachelor degree.',
+     'entities': {'email': 'a@example.com', 'phone': '5551234567'},
+     'skills': {'technical': {'databases': ['Sql'], 'programming': ['Python']}, 'soft': ['Communication']}},
+    {'id': 2, 'raw_text': 'Developed services at a university lab.',
+     'entities': {'github': 'https://github.com/b'},
+     'skills': {'technical': {'programming': ['Java', 'Python']}, 'soft': []}},
+    {'id': 3, 'raw_text': '', 'entities': {}, 'skills': {'technical': {}, 'soft': ['Leadership']}},
+]
+
+REQUIRED = [
+    [],
+    ['Python'],
+    ['python', 'SQL'],
+    ['SQL', 'sql', ' Sql '],
+    ['Sql', 'Communication'],
+    ['JAVA', 'java', 'Python', 'rust'],
+]
+
+
+@pytest.mark.parametrize('required', REQUIRED)
+def test_batch_paths_match_score_candidate(required):
+    scorer = CandidateScorer()
+    job = {'required_skills': required}
+    expected = [scorer.score_candidate(c, job) for c in CANDIDATES]
+
+    index = SkillBitmapIndex()
+    index.add_many((c['id'], [s for skills in c['skills']['technical'].values() for s in skills])
+                   for c in CANDIDATES)
+    ids, counts = index.match_counts(required)
+    by_id = dict(zip(ids.tolist(), counts.tolist()))
+    skill_counts = [by_id.get(c['id'], 0) for c in CANDIDATES]
+
+    features = scorer.extract_features(CANDIDATES)
+    for scores in (scorer.score_batch(features, job), scorer.score_batch(features, job, skill_counts)):
+        assert scores['total_score'].tolist() == [e['total_score'] for e in expected]
+        assert scores['grade'].tolist() == [e['grade'] for e in expected]
+        for component in expected[0]['breakdown']:
+            assert np.allclose(scores['breakdown'][component], [e['breakdown'][component] for e in expected])
+
+
+def test_duplicate_required_skills_count_once():
+    scorer = CandidateScorer()
+    score = scorer.score_candidate(CANDIDATES[0], {'required_skills': ['SQL', 'sql', 'Rust']})
+    assert score['breakdown']['skills_match'] == 50.0
@@ -0,0 +1,31 @@
+from src.ingestion.job_queue import IngestionQueue
+
+
+def _abandon(queue, worker='w1'):
+    job = queue.claim(worker)
+    # Worker died without heartbeating; lease_timeout=-1 treats the lease as expired
+    return job, queue.requeue_abandoned(lease_timeout=-1, max_attempts=2)
+
+
+def test_abandoned_job_fails_after_max_attempts(tmp_path):
+    queue = IngestionQueue(tmp_path / 'queue.db')
+    job_id = queue.enqueue(tmp_path / 'crash.pdf', 'crash.pdf')
+
+    job, requeued = _abandon(queue)
+    assert job['attempts'] == 1 and requeued == 1
+    assert queue.get(job_id)['status'] == 'queued'
+
+    job, requeued = _abandon(queue)
+    assert job['attempts'] == 2 and requeued == 0
+    failed = queue.get(job_id)
+    assert failed['status'] == 'failed'
+    assert '2 times' in failed['error'] and failed['finished_at']
+    assert queue.claim('w2') is None
+
+
+def test_live_jobs_are_left_alone(tmp_path):
+    queue = IngestionQueue(tmp_path / 'queue.db')
+    job_id = queue.enqueue(tmp_path / 'a.txt', 'a.txt')
+    queue.claim('w1')
+    assert queue.requeue_abandoned(lease_timeout=60, max_attempts=1) == 0
+    assert queue.get(job_id)['status'] == 'processing'
@@ -0,0 +1,21 @@
+import pytest
+
+from src.ranking.ranking_engine import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, parse_page
+
+
+def test_parse_page_defaults_and_cap():
+    assert parse_page({}) == (DEFAULT_PAGE_SIZE, 0)
+    assert parse_page({'limit': 5, 'offset': '40'}) == (5, 40)
+    assert parse_page({'limit': MAX_PAGE_SIZE + 1}) == (MAX_PAGE_SIZE, 0)
+
+
+@pytest.mark.parametrize('field', ['limit', 'offset'])
+@pytest.mark.parametrize('value', ['abc', None, 1.5, '1.5', '', True, -1, [10]])
+def test_parse_page_rejects_bad_input(field, value):
+    with pytest.raises(ValueError, match=field):
+        parse_page({field: value})
+
+
+def test_parse_page_rejects_zero_limit():
+    with pytest.raises(ValueError, match='limit'):
+        parse_page({'limit': 0})
@@ -0,0 +1,42 @@
+import numpy as np
+
+from src.ranking.semantic_index import IVFIndex
+
+
+def _vectors(n, dim=16, seed=0):
+    vectors = np.random.default_rng(seed).normal(size=(n, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_add_defers_training_without_auto_train():
+    index = IVFIndex(16, train_threshold=64, auto_train=False)
+    index.add(list(range(64)), _vectors(64))
+    assert index.centroids is None and index.needs_training
+
+    snapshot = index.snapshot()
+    centroids, labels = index.fit(snapshot[2])
+    index.apply_training(snapshot, centroids, labels)
+    assert index.centroids is not None and not index.needs_training
+
+
+def test_apply_training_keeps_changes_made_during_fit():
+    vectors = _vectors(80)
+    index = IVFIndex(16, train_threshold=64, auto_train=False)
+    index.add(list(range(64)), vectors[:64])
+
+    snapshot = index.snapshot()
+    centroids, labels = index.fit(snapshot[2])
+    # Concurrent updates while k-means runs: one removal, one replacement, new ids
+    index.remove(0)
+    index.add([1], vectors[64:65])
+    index.add(list(range(100, 115)), vectors[65:])
+    index.apply_training(snapshot, centroids, labels)
+
+    assert 0 not in index and len(index) == 78
+    for doc_id, vector in [(1, vectors[64])] + list(zip(range(100, 115), vectors[65:])):
+        list_no, pos = index._where[doc_id]
+        assert np.array_equal(index._lists[list_no]['vectors'][pos], vector)
+        assert list_no == int(np.argmax(centroids @ vector))
+    # Every vector is still found by an exhaustive probe
+    ids, _ = index.search(vectors[64], k=1, nprobe=len(centroids))
+    assert ids == [1]
@@ -0,0 +1,27 @@
+from src.nlp_engine.skill_matcher import SkillMatcher
+
+
+def _matches(matcher, text):
+    return sorted(matcher.finditer(text))
+
+
+def test_finds_overlapping_patterns_once():
+    matcher = SkillMatcher([('machine learning', 'ml'), ('learning', 'learning')])
+    assert _matches(matcher, 'machine learning') == [(0, 16, 'ml'), (8, 16, 'learning')]
+
+
+def test_compile_twice_does_not_duplicate_matches():
+    matcher = SkillMatcher([('machine learning', 'ml'), ('learning', 'learning')])
+    expected = _matches(matcher, 'machine learning')
+    matcher.compile()
+    matcher.compile()
+    assert _matches(matcher, 'machine learning') == expected
+
+
+def test_recompile_after_add():
+    matcher = SkillMatcher([('learning', 'learning')])
+    matcher.add('deep learning', 'dl')
+    matcher.compile()
+    matcher.add('c++', 'c++')
+    matcher.compile()
+    assert _matches(matcher, 'deep learning and c++') == [(0, 13, 'dl'), (5, 13, 'learning'), (18, 21, 'c++')]